@@ -0,0 +1,606 @@
+"""
+    블로그 글 생성기 성능 측정 도구
+
+    로컬 가짜 네이버 검색 서버(core.fake_naver)와 가짜 LLM(core.fake_llm)을 띄운 뒤
+    검색 → 제목 생성 → 글 생성 → 파일 저장 전체 흐름을 실제 워커 코드로 실행하고
+    제목/분, 글/분, 단계별 p50/p95/p99 처리 시간, 최대 메모리(RSS), GUI 스레드 멈춤 시간을
+    JSON 파일로 저장합니다. --compare로 이전 결과와 비교하면 성능이 나빠진 항목을 알려줍니다.
+
+    가짜 검색 서버는 측정 결과(메모리, 주 스레드 멈춤)에 섞이지 않도록 별도 프로세스로 실행합니다.
+    PyQt5를 불러올 수 있으면 QThread 워커(BatchSearchWorker 등)를 이벤트 루프에서 실행하고
+    QTimer 박동으로 GUI 스레드 멈춤을 측정합니다. 없으면 워커가 감싸는 core 엔진을 직접 실행하고
+    주 스레드 대신 박동 스레드의 지연을 측정합니다.
+    --network async는 스레드 워커 대신 공용 asyncio 루프의 비동기 워커/엔진을 측정합니다.
+
+    사용 예:
+        python blog_bench.py
+        python blog_bench.py --keywords 40 --posts 60 --llm-latency lognormal:1500,0.6 -o bench.json
+        python blog_bench.py --network async --max-in-flight 50
+        python blog_bench.py --compare bench_results/baseline.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from datetime import datetime
+
+_PLACES = ("강남", "홍대", "성수", "제주", "부산", "여의도", "판교", "잠실", "이태원", "전주")
+_TOPICS = ("맛집", "카페", "여행 코스", "데이트", "브런치", "숙소", "술집", "빵집")
+
+# --compare에서 비교할 항목 - (경로, 클수록 좋은지, 무시할 최소 차이)
+COMPARE_METRICS = [
+    ("throughput.titles_per_min", True, 0.0),
+    ("throughput.posts_per_min", True, 0.0),
+    ("stages.search.p95", False, 5.0),
+    ("stages.titles.p95", False, 5.0),
+    ("stages.content.p95", False, 5.0),
+    ("stages.file_output.p95", False, 5.0),
+    ("peak_rss_mb", False, 5.0),
+    ("gui_blocked.blocked_ms", False, 20.0),
+]
+
+
+def log(message):
+    print(f"[{time.strftime('%H:%M:%S')}] {message}", file=sys.stderr, flush=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="가짜 검색 서버/LLM으로 전체 흐름 성능을 측정합니다.")
+    parser.add_argument("--keywords", type=int, default=20, help="검색할 키워드 수 (기본 20)")
+    parser.add_argument("--titles", type=int, default=5, help="키워드당 생성할 제목 수 (기본 5)")
+    parser.add_argument("--posts", type=int, default=30, help="생성할 글 수 (기본 30)")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="동시 글 생성 수")
+    parser.add_argument("--deep", action="store_true", help="딥 검색 (키워드당 페이지 여러 개)")
+    parser.add_argument("--no-stream", action="store_true", help="글을 스트리밍으로 생성하지 않음")
+    parser.add_argument(
+        "--outline", action="store_true", help="개요를 먼저 만들고 섹션을 동시에 생성하는 모드로 측정"
+    )
+    parser.add_argument(
+        "--search-latency", default="lognormal:120,0.4", help="가짜 검색 서버 지연 시간 분포 (ms)"
+    )
+    parser.add_argument("--search-errors", default="", help="가짜 검색 서버 오류 비율 (예: 429:0.02)")
+    parser.add_argument(
+        "--llm-latency", default="lognormal:800,0.5", help="가짜 LLM 지연 시간 분포 (ms)"
+    )
+    parser.add_argument("--llm-errors", default="", help="가짜 LLM 오류 비율 (예: 429:0.05,500:0.02)")
+    parser.add_argument(
+        "--llm-output-rate",
+        type=float,
+        default=0,
+        help="가짜 LLM 초당 출력 글자 수 - 응답 길이에 비례한 지연 추가 (기본 0: 사용 안 함)",
+    )
+    parser.add_argument(
+        "--gemini-rpm", type=int, default=100000, help="LLM 분당 요청 수 한도 (기본: 사실상 무제한)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="지연/오류 난수 seed")
+    parser.add_argument(
+        "--mode", choices=("auto", "qt", "engine"), default="auto", help="워커 실행 방식 (기본 auto)"
+    )
+    parser.add_argument(
+        "--network", choices=("thread", "async"), default="thread", help="네트워크 실행 방식 (기본 thread)"
+    )
+    parser.add_argument("-o", "--output", default=None, help="결과 JSON 경로 (기본 bench_results/)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.1, help="성능 저하로 판단할 변화율 (기본 0.1 = 10%%)"
+    )
+    parser.add_argument("--keep-output", action="store_true", help="생성한 글과 데이터 폴더를 지우지 않음")
+    return parser.parse_args(argv)
+
+
+def make_keywords(count):
+    """지역 × 주제 조합으로 측정용 키워드 생성"""
+    pairs = itertools.islice(itertools.cycle(itertools.product(_PLACES, _TOPICS)), count)
+    keywords = []
+    for index, (place, topic) in enumerate(pairs):
+        round_number = index // (len(_PLACES) * len(_TOPICS))
+        keywords.append(f"{place} {topic}" + (f" {round_number + 1}" if round_number else ""))
+    return keywords
+
+
+def peak_rss_mb():
+    """프로세스 최대 메모리 사용량 (MB) - 측정할 수 없으면 None"""
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 바이트, 리눅스는 KB 단위
+        return round(peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024, 1)
+    try:
+        import psutil
+
+        return round(psutil.Process().memory_info().peak_wset / 1024 / 1024, 1)
+    except (ImportError, AttributeError):
+        return None
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class Heartbeat:
+    """
+    주 스레드 응답성 측정
+    interval_ms마다 tick()이 호출되어야 하는데 stall_ms 이상 늦어지면 멈춤으로 보고 늦어진 시간을 합산합니다.
+    """
+
+    def __init__(self, interval_ms=10, stall_ms=50):
+        self.interval_ms = interval_ms
+        self.stall_ms = stall_ms
+        self.last = None
+        self.ticks = 0
+        self.stalls = 0
+        self.blocked_ms = 0.0
+        self.max_gap_ms = 0.0
+        self.stop_event = threading.Event()
+
+    def tick(self):
+        now = time.monotonic()
+        if self.last is not None:
+            gap_ms = (now - self.last) * 1000
+            self.max_gap_ms = max(self.max_gap_ms, gap_ms)
+            delay_ms = gap_ms - self.interval_ms
+            if delay_ms >= self.stall_ms:
+                self.stalls += 1
+                self.blocked_ms += delay_ms
+        self.last = now
+        self.ticks += 1
+
+    def run_thread(self):
+        """Qt 없이 측정할 때 쓰는 박동 스레드"""
+        while not self.stop_event.wait(self.interval_ms / 1000):
+            self.tick()
+
+    def snapshot(self, source):
+        return {
+            "source": source,
+            "interval_ms": self.interval_ms,
+            "stall_threshold_ms": self.stall_ms,
+            "ticks": self.ticks,
+            "stalls": self.stalls,
+            "blocked_ms": round(self.blocked_ms, 1),
+            "max_gap_ms": round(self.max_gap_ms, 1),
+        }
+
+
+def run_engine_pipeline(config, heartbeat):
+    """core 엔진을 직접 실행 - 단계별 {wall_s, items, failed}와 생성 결과 반환"""
+    from core.batch_search import BatchSearchEngine
+    from core.content_generation import BatchContentEngine
+    from core.llm_provider import get_llm_model
+    from core.prompt_builder import get_token_budget, get_token_counter
+    from core.title_generation import (
+        TITLE_MODEL_NAME,
+        build_batch_title_requests,
+        generate_batch_titles,
+        generate_batch_titles_async,
+        group_posts_by_keyword,
+    )
+
+    use_async = config["network"] == "async"
+    if use_async:
+        from core.async_engine import get_async_engine
+
+        run_async = get_async_engine().run
+
+    stages = {}
+    thread = threading.Thread(target=heartbeat.run_thread, daemon=True)
+    thread.start()
+    try:
+        failed = []
+        started = time.monotonic()
+        engine = BatchSearchEngine(
+            "bench", "bench", max_in_flight=config["search_in_flight"], deep=config["deep"], use_cache=False
+        )
+        on_failed = lambda keyword, error: failed.append(keyword)
+        if use_async:
+            blog_posts = run_async(engine.run_async(config["keywords"], on_keyword_failed=on_failed))
+        else:
+            blog_posts = engine.run(config["keywords"], on_keyword_failed=on_failed)
+        stages["search"] = {
+            "wall_s": time.monotonic() - started,
+            "items": len(config["keywords"]) - len(failed),
+            "failed": len(failed),
+        }
+
+        failed = []
+        started = time.monotonic()
+        model = get_llm_model(config["api_key"], TITLE_MODEL_NAME)
+        requests = build_batch_title_requests(
+            group_posts_by_keyword(blog_posts),
+            config["titles"],
+            budget=get_token_budget(),
+            counter=get_token_counter(model),
+        )
+        kwargs = {
+            "use_cache": False,
+            "api_key": config["api_key"],
+            "on_keyword_failed": lambda keyword, error: failed.append(keyword),
+        }
+        if use_async:
+            results = run_async(generate_batch_titles_async(model, requests, **kwargs))
+        else:
+            results = generate_batch_titles(model, requests, **kwargs)
+        titles = [title for keyword_titles in results.values() for title in keyword_titles]
+        stages["titles"] = {
+            "wall_s": time.monotonic() - started,
+            "items": len(titles),
+            "failed": len(failed),
+        }
+
+        counts = {"done": 0, "failed": 0}
+        started = time.monotonic()
+        engine = BatchContentEngine(
+            config["api_key"],
+            config["prompt"],
+            config["save_path"],
+            max_in_flight=config["max_in_flight"],
+            use_cache=False,
+            stream=config["stream"],
+            outline=config["outline"],
+        )
+        kwargs = {
+            "on_title_done": lambda *args: counts.__setitem__("done", counts["done"] + 1),
+            "on_title_failed": lambda *args: counts.__setitem__("failed", counts["failed"] + 1),
+        }
+        if use_async:
+            run_async(engine.run_async(titles[: config["posts"]], **kwargs))
+        else:
+            engine.run(titles[: config["posts"]], **kwargs)
+        stages["content"] = {
+            "wall_s": time.monotonic() - started,
+            "items": counts["done"],
+            "failed": counts["failed"],
+        }
+    finally:
+        heartbeat.stop_event.set()
+        thread.join()
+    return stages
+
+
+def run_qt_pipeline(config, heartbeat):
+    """QThread 워커를 이벤트 루프에서 실행 - 결과 신호는 GUI와 같이 주 스레드에서 처리"""
+    from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+    from core import workers
+
+    # 비동기 워커는 같은 신호를 가진 Async* 클래스
+    prefix = "Async" if config["network"] == "async" else ""
+    BatchSearchWorker = getattr(workers, prefix + "BatchSearchWorker")
+    BatchTitleGenerateWorker = getattr(workers, prefix + "BatchTitleGenerateWorker")
+    BatchContentGenerateWorker = getattr(workers, prefix + "BatchContentGenerateWorker")
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    timer = QTimer()
+    timer.setInterval(heartbeat.interval_ms)
+    timer.timeout.connect(heartbeat.tick)
+
+    def run_worker(worker, finished_signal, failed_signal=None):
+        """
+        워커가 끝날 때까지 이벤트 루프 실행 - (걸린 시간, 완료 신호 인자)
+        failed_signal이 오면 RuntimeError
+        """
+        loop = QEventLoop()
+        result = []
+        errors = []
+
+        def finished(*args):
+            result.extend(args)
+            loop.quit()
+
+        def failed(error):
+            errors.append(error)
+            loop.quit()
+
+        finished_signal.connect(finished)
+        if failed_signal is not None:
+            failed_signal.connect(failed)
+        started = time.monotonic()
+        worker.start()
+        loop.exec_()
+        worker.wait()
+        if errors:
+            raise RuntimeError(errors[0])
+        return time.monotonic() - started, result
+
+    stages = {}
+    timer.start()
+    try:
+        failed = []
+        worker = BatchSearchWorker(
+            config["keywords"], "bench", "bench", max_in_flight=config["search_in_flight"], deep=config["deep"]
+        )
+        worker.engine.use_cache = False
+        worker.keyword_failed.connect(lambda keyword, error: failed.append(keyword))
+        wall, (blog_posts,) = run_worker(worker, worker.batch_completed)
+        stages["search"] = {
+            "wall_s": wall,
+            "items": len(config["keywords"]) - len(failed),
+            "failed": len(failed),
+        }
+
+        failed = []
+        worker = BatchTitleGenerateWorker(
+            blog_posts, config["titles"], config["api_key"], use_cache=False
+        )
+        worker.keyword_failed.connect(lambda keyword, error: failed.append(keyword))
+        wall, (results,) = run_worker(worker, worker.batch_completed, worker.generation_failed)
+        titles = [title for keyword_titles in results.values() for title in keyword_titles]
+        stages["titles"] = {"wall_s": wall, "items": len(titles), "failed": len(failed)}
+
+        # 글 생성 탭의 미리보기처럼 받은 조각을 주 스레드에서 모음
+        counts = {"done": 0, "failed": 0}
+        preview_chunks = {}
+        worker = BatchContentGenerateWorker(
+            titles[: config["posts"]],
+            config["prompt"],
+            config["api_key"],
+            config["save_path"],
+            max_in_flight=config["max_in_flight"],
+            use_cache=False,
+            stream=config["stream"],
+            outline=config["outline"],
+        )
+        worker.content_generated.connect(
+            lambda index, title, path: counts.__setitem__("done", counts["done"] + 1)
+        )
+        worker.content_failed.connect(
+            lambda index, title, error: counts.__setitem__("failed", counts["failed"] + 1)
+        )
+        worker.content_chunk.connect(
+            lambda index, text: preview_chunks.setdefault(index, []).append(text)
+        )
+        wall, _ = run_worker(worker, worker.batch_completed)
+        stages["content"] = {"wall_s": wall, "items": counts["done"], "failed": counts["failed"]}
+    finally:
+        timer.stop()
+    app.processEvents()
+    return stages
+
+
+def start_fake_naver(args):
+    """가짜 검색 서버 프로세스 시작 - (프로세스, 검색 주소)"""
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "core.fake_naver",
+            "--latency",
+            args.search_latency,
+            "--errors",
+            args.search_errors,
+            "--seed",
+            str(args.seed),
+        ],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    url = process.stdout.readline().strip()
+    if not url:
+        process.kill()
+        raise SystemExit("가짜 검색 서버를 시작하지 못했습니다.")
+    return process, url
+
+
+def fake_naver_stats(url):
+    """가짜 검색 서버의 요청/주입 오류 수"""
+    stats_url = url.rsplit("/v1/", 1)[0] + "/stats"
+    try:
+        with urllib.request.urlopen(stats_url, timeout=5) as response:
+            return json.loads(response.read().decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def qt_available():
+    try:
+        import PyQt5.QtCore  # noqa: F401
+        import core.workers  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_result(args, config, mode, stages, heartbeat, server_stats, total_wall):
+    """측정 결과 JSON 구성"""
+    from core.http_client import get_http_client
+    from core.stage_metrics import get_stage_metrics
+
+    stage_stats = get_stage_metrics().snapshot()
+    for name, stats in stage_stats.items():
+        for key in ("p50", "p95", "p99"):
+            stats[key] = round(stats[key], 1)
+        stats.update(stages.get(name, {}))
+        if "wall_s" in stats:
+            stats["wall_s"] = round(stats["wall_s"], 3)
+
+    def per_minute(stage):
+        info = stages.get(stage, {})
+        return round(info["items"] / info["wall_s"] * 60, 1) if info.get("wall_s") else 0.0
+
+    return {
+        "version": 1,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "mode": mode,
+        "platform": {
+            "python": platform.python_version(),
+            "system": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {
+            "keywords": len(config["keywords"]),
+            "titles_per_keyword": config["titles"],
+            "posts": config["posts"],
+            "max_in_flight": config["max_in_flight"],
+            "deep": config["deep"],
+            "network": config["network"],
+            "stream": config["stream"],
+            "outline": config["outline"],
+            "search_latency": args.search_latency,
+            "search_errors": args.search_errors,
+            "llm_latency": args.llm_latency,
+            "llm_errors": args.llm_errors,
+            "llm_output_rate": args.llm_output_rate,
+            "gemini_rpm": args.gemini_rpm,
+            "seed": args.seed,
+        },
+        "throughput": {
+            "titles_per_min": per_minute("titles"),
+            "posts_per_min": per_minute("content"),
+            "total_wall_s": round(total_wall, 3),
+        },
+        "stages": stage_stats,
+        "http": get_http_client().latency_stats(),
+        "fake_naver": server_stats,
+        "peak_rss_mb": peak_rss_mb(),
+        "gui_blocked": heartbeat.snapshot("qt_timer" if mode == "qt" else "heartbeat_thread"),
+    }
+
+
+def lookup(result, path):
+    value = result
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return value
+
+
+def compare_results(baseline, current, tolerance):
+    """이전 결과와 비교 - (항목, 이전 값, 현재 값, 변화율, 저하 여부) 목록"""
+    rows = []
+    for path, higher_is_better, min_delta in COMPARE_METRICS:
+        before = lookup(baseline, path)
+        after = lookup(current, path)
+        if before is None or after is None:
+            continue
+        change = (after - before) / before if before else 0.0
+        worse = -change if higher_is_better else change
+        regressed = worse > tolerance and abs(after - before) >= min_delta
+        rows.append((path, before, after, change, regressed))
+    return rows
+
+
+def format_summary(result):
+    lines = [
+        f"모드: {result['mode']}/{result['config']['network']}, 전체 {result['throughput']['total_wall_s']:.1f}초",
+        f"제목 {result['throughput']['titles_per_min']:.1f}개/분, 글 {result['throughput']['posts_per_min']:.1f}개/분",
+    ]
+    for name in ("search", "titles", "content", "file_output"):
+        s = result["stages"].get(name)
+        if s:
+            lines.append(
+                f"{name}: {s['count']}회, p50 {s['p50']:.0f}ms / p95 {s['p95']:.0f}ms / p99 {s['p99']:.0f}ms"
+            )
+    blocked = result["gui_blocked"]
+    lines.append(
+        f"최대 메모리 {result['peak_rss_mb']}MB, 주 스레드 멈춤 {blocked['stalls']}회 "
+        f"{blocked['blocked_ms']:.0f}ms (최대 간격 {blocked['max_gap_ms']:.0f}ms)"
+    )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # core 모듈이 설정을 읽기 전에 측정용 환경 구성 (데이터 폴더, 가짜 LLM, 호출 한도)
+    data_dir = tempfile.mkdtemp(prefix="blog_bench_")
+    os.environ["BLOG_GENERATOR_DATA_DIR"] = data_dir
+    os.environ["LLM_PROVIDER"] = "fake"
+    os.environ["FAKE_LLM_LATENCY"] = args.llm_latency
+    os.environ["FAKE_LLM_ERRORS"] = args.llm_errors
+    os.environ["FAKE_LLM_OUTPUT_RATE"] = str(args.llm_output_rate)
+    os.environ["FAKE_LLM_SEED"] = str(args.seed)
+    os.environ["GEMINI_RPM"] = str(args.gemini_rpm)
+    os.environ["GEMINI_TPM"] = str(args.gemini_rpm * 100000)
+
+    from blog_cli import DEFAULT_CONTENT_PROMPT
+    from core.content_generation import get_max_in_flight
+
+    mode = args.mode
+    if mode == "auto":
+        mode = "qt" if qt_available() else "engine"
+
+    save_path = os.path.join(data_dir, "posts")
+    os.makedirs(save_path, exist_ok=True)
+    config = {
+        "keywords": make_keywords(args.keywords),
+        "titles": args.titles,
+        "posts": args.posts,
+        "max_in_flight": args.max_in_flight or get_max_in_flight(),
+        "search_in_flight": 4,
+        "network": args.network,
+        "deep": args.deep,
+        "stream": not args.no_stream,
+        "outline": args.outline,
+        "prompt": DEFAULT_CONTENT_PROMPT,
+        "save_path": save_path,
+        "api_key": "bench",
+    }
+
+    server, search_url = start_fake_naver(args)
+    os.environ["NAVER_SEARCH_URL"] = search_url
+    heartbeat = Heartbeat()
+    log(f"측정 시작 ({mode}, {args.network}): 키워드 {args.keywords}개, 제목 {args.titles}개씩, 글 {args.posts}개")
+    try:
+        started = time.monotonic()
+        if mode == "qt":
+            stages = run_qt_pipeline(config, heartbeat)
+        else:
+            stages = run_engine_pipeline(config, heartbeat)
+        total_wall = time.monotonic() - started
+        result = build_result(
+            args, config, mode, stages, heartbeat, fake_naver_stats(search_url), total_wall
+        )
+    finally:
+        server.terminate()
+        server.wait()
+        if not args.keep_output:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    output = args.output or os.path.join(
+        "bench_results", f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    if os.path.dirname(output):
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    log(f"결과 저장: {output}")
+    print(format_summary(result))
+
+    if not args.compare:
+        return 0
+    with open(args.compare, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = 0
+    print(f"\n비교 기준: {args.compare} ({baseline.get('git_commit') or '커밋 정보 없음'})")
+    for path, before, after, change, regressed in compare_results(baseline, result, args.tolerance):
+        regressions += regressed
+        mark = "  ⚠️ 저하" if regressed else ""
+        print(f"{path}: {before:.1f} → {after:.1f} ({change:+.1%}){mark}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""
+    블로그 글 생성기 명령줄 실행기
+
+    GUI 없이 검색 → 제목 생성 → 글 생성 → 파일 저장을 한 번에 실행합니다.
+    PyQt5와 Selenium을 불러오지 않으므로 서버나 cron에서도 사용할 수 있으며,
+    GUI 워커와 같은 core 모듈(일괄 검색, 제목/글 생성 엔진, 중복 제목 색인, 진행 기록)을 사용합니다.
+
+    사용 예:
+        python blog_cli.py -k "강남 맛집, 제주 여행" --titles 5 --posts 2 -o ./generated_posts
+        python blog_cli.py --keywords-file keywords.txt
+        python blog_cli.py --jobs jobs.jsonl
+        python blog_cli.py --resume
+
+    jobs.jsonl 한 줄 형식 (keyword 외에는 생략 가능):
+        {"keyword": "강남 맛집", "titles": 5, "posts": 2, "prompt": "...", "out": "./posts"}
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from utils.utils import load_env_file
+
+DEFAULT_CONTENT_PROMPT = """다음 조건에 맞는 블로그 글을 작성해주세요:
+
+1. 2000-3000자 분량
+2. SEO 최적화된 내용
+3. 독자에게 유용한 정보 제공
+4. 자연스러운 한국어 문체
+5. 소제목을 활용한 구조화된 글
+6. 마지막에 요약 또는 결론 포함
+
+글의 톤앤매너는 친근하고 전문적으로 작성해주세요."""
+
+
+def log(message):
+    """진행 상황은 표준 오류로 출력 (표준 출력은 결과 요약용)"""
+    print(f"[{time.strftime('%H:%M:%S')}] {message}", file=sys.stderr, flush=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="검색 → 제목 생성 → 글 생성 → 파일 저장을 GUI 없이 실행합니다."
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("-k", "--keywords", help="쉼표/줄바꿈으로 구분한 키워드 목록")
+    source.add_argument("--keywords-file", help="키워드 파일 (한 줄에 하나, #은 주석)")
+    source.add_argument("--jobs", help="작업 목록 JSONL 파일")
+    source.add_argument("--resume", action="store_true", help="중단된 일괄 글 생성 이어하기")
+
+    parser.add_argument("--titles", type=int, default=5, help="키워드당 생성할 제목 수 (기본 5)")
+    parser.add_argument(
+        "--posts", type=int, default=None, help="키워드당 글을 생성할 제목 수 (기본: 생성된 제목 전부)"
+    )
+    parser.add_argument("--prompt-file", help="글 생성 프롬프트 파일 (기본: GUI 기본 프롬프트)")
+    parser.add_argument("-o", "--out", default=None, help="글 저장 폴더 (기본: DEFAULT_SAVE_PATH 또는 ./generated_posts)")
+    parser.add_argument("--deep", action="store_true", help="딥 검색 (키워드당 최대 1000개)")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="동시 글 생성 수")
+    parser.add_argument("--no-cache", action="store_true", help="검색/AI 응답 캐시를 사용하지 않음")
+    parser.add_argument("--no-stream", action="store_true", help="글을 스트리밍으로 파일에 쓰지 않음")
+    parser.add_argument(
+        "--outline", action="store_true", help="개요를 먼저 만들고 섹션을 동시에 생성 (긴 글용)"
+    )
+    parser.add_argument("--allow-similar", action="store_true", help="이전 제목과 비슷한 제목도 사용")
+    parser.add_argument(
+        "--provider", default=None, help="LLM 제공자 (gemini, fake - 기본: .env의 LLM_PROVIDER 또는 gemini)"
+    )
+    parser.add_argument("--env-file", default=".env", help="환경변수 파일 (기본 .env)")
+    return parser.parse_args(argv)
+
+
+def load_jobs(args):
+    """명령줄 인자에서 작업 목록 생성 - [{keyword, titles, posts, prompt, out}]"""
+    # core 모듈은 인자 확인 후에 불러와 --help가 빠르게 동작하도록 함
+    from core.batch_search import load_keywords, parse_keywords
+
+    default_prompt = DEFAULT_CONTENT_PROMPT
+    if args.prompt_file:
+        with open(args.prompt_file, "r", encoding="utf-8") as f:
+            default_prompt = f.read().strip()
+    default_out = args.out or os.getenv("DEFAULT_SAVE_PATH") or "./generated_posts"
+
+    if args.jobs:
+        entries = []
+        with open(args.jobs, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise SystemExit(f"{args.jobs}:{line_number} JSON 형식 오류: {e}")
+                if not entry.get("keyword"):
+                    raise SystemExit(f"{args.jobs}:{line_number} keyword가 없습니다.")
+                entries.append(entry)
+    else:
+        if args.keywords:
+            keywords = parse_keywords(args.keywords)
+        else:
+            keywords = load_keywords(args.keywords_file)
+        entries = [{"keyword": keyword} for keyword in keywords]
+
+    return [
+        {
+            "keyword": entry["keyword"],
+            "titles": int(entry.get("titles", args.titles)),
+            "posts": entry.get("posts", args.posts),
+            "prompt": entry.get("prompt") or default_prompt,
+            "out": entry.get("out") or default_out,
+        }
+        for entry in entries
+    ]
+
+
+def search_jobs(jobs, args):
+    """키워드 동시 검색 - {키워드: 블로그 글 목록}"""
+    from core.batch_search import BatchSearchEngine
+    from core.title_generation import group_posts_by_keyword
+
+    client_id = os.getenv("NAVER_CLIENT_ID")
+    client_secret = os.getenv("NAVER_CLIENT_SECRET")
+    if not client_id or not client_secret:
+        raise SystemExit("NAVER_CLIENT_ID, NAVER_CLIENT_SECRET 환경변수가 필요합니다.")
+
+    engine = BatchSearchEngine(
+        client_id, client_secret, deep=args.deep, use_cache=not args.no_cache
+    )
+    keywords = list(dict.fromkeys(job["keyword"] for job in jobs))
+    log(f"{len(keywords)}개 키워드 검색 중...")
+    blog_posts = engine.run(
+        keywords,
+        on_keyword_done=lambda keyword, posts: log(f"검색 완료: {keyword} ({len(posts)}개)"),
+        on_keyword_failed=lambda keyword, error: log(f"검색 실패: {keyword} - {error}"),
+    )
+    return group_posts_by_keyword(blog_posts)
+
+
+def generate_job_titles(jobs, corpora, api_key, args):
+    """제목 수가 같은 키워드끼리 묶어 일괄 생성 - {키워드: 제목 목록}"""
+    from core.llm_provider import get_llm_model
+    from core.prompt_builder import get_token_budget, get_token_counter
+    from core.title_generation import (
+        TITLE_MODEL_NAME,
+        build_batch_title_requests,
+        generate_batch_titles,
+    )
+    from core.title_index import get_title_index
+
+    model = get_llm_model(api_key, TITLE_MODEL_NAME)
+    by_count = {}
+    for job in jobs:
+        if job["keyword"] in corpora:
+            by_count.setdefault(job["titles"], {})[job["keyword"]] = corpora[job["keyword"]]
+
+    results = {}
+    for count, group in by_count.items():
+        requests = build_batch_title_requests(
+            group, count, budget=get_token_budget(), counter=get_token_counter(model)
+        )
+        results.update(
+            generate_batch_titles(
+                model,
+                requests,
+                use_cache=not args.no_cache,
+                api_key=api_key,
+                on_request=lambda index, total: log(f"제목 생성 중... ({index}/{total} 요청)"),
+                on_keyword_failed=lambda keyword, error: log(f"제목 생성 실패: {keyword} - {error}"),
+            )
+        )
+
+    # 이전에 생성한 제목과 비슷한 제목 제외
+    index = get_title_index()
+    for keyword, titles in results.items():
+        kept = []
+        for title, similar, score in index.check_and_add(titles):
+            if similar and not args.allow_similar:
+                log(f"유사 제목 제외: {title} ≈ {similar} ({score:.0%})")
+                continue
+            kept.append(title)
+        results[keyword] = kept
+        log(f"제목 생성 완료: {keyword} ({len(kept)}개)")
+    return results
+
+
+def run_journal(journal, api_key, args):
+    """진행 기록의 남은 제목 글 생성 - (성공 수, 실패 수)"""
+    from core.content_generation import BatchContentEngine, get_max_in_flight
+
+    remaining = journal.remaining()
+    os.makedirs(journal.save_path, exist_ok=True)
+    engine = BatchContentEngine(
+        api_key,
+        journal.prompt,
+        journal.save_path,
+        max_in_flight=args.max_in_flight or get_max_in_flight(),
+        use_cache=not args.no_cache,
+        stream=not args.no_stream,
+        outline=args.outline or None,
+    )
+    counts = {"done": 0, "failed": 0}
+
+    def on_done(position, title, path, cache_hit):
+        journal.record_done(remaining[position][0], path)
+        counts["done"] += 1
+        log(f"글 생성 완료 ({counts['done'] + counts['failed']}/{len(remaining)}): {path}")
+
+    def on_failed(position, title, error):
+        journal.record_failed(remaining[position][0], error)
+        counts["failed"] += 1
+        log(f"글 생성 실패 ({counts['done'] + counts['failed']}/{len(remaining)}): {title} - {error}")
+
+    engine.run(
+        [title for _, title in remaining], on_title_done=on_done, on_title_failed=on_failed
+    )
+    report = engine.shared_prefix_report()
+    if report:
+        log(report)
+    return counts["done"], counts["failed"]
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    load_env_file(args.env_file)
+    if args.provider:
+        os.environ["LLM_PROVIDER"] = args.provider
+
+    from core.key_pool import resolve_api_keys
+
+    # 가짜 제공자는 API 키 없이도 실행 (제한기 구분용 이름만 사용)
+    # GEMINI_API_KEYS에 여러 키를 지정하면 요청을 키 풀로 나누어 보냄
+    api_key = resolve_api_keys()
+    if os.getenv("LLM_PROVIDER", "").lower() == "fake":
+        api_key = api_key or "fake"
+    if not api_key:
+        raise SystemExit("GEMINI_API_KEY 또는 GEMINI_API_KEYS 환경변수가 필요합니다.")
+
+    from core.batch_journal import BatchJournal, list_unfinished_journals
+
+    if args.resume:
+        journals = list_unfinished_journals()
+        log(f"이어서 생성할 기록 {len(journals)}개")
+    else:
+        jobs = load_jobs(args)
+        if not jobs:
+            raise SystemExit("키워드가 없습니다.")
+        corpora = search_jobs(jobs, args)
+        titles = generate_job_titles(jobs, corpora, api_key, args)
+
+        # 프롬프트와 저장 폴더가 같은 작업끼리 하나의 진행 기록으로 묶음
+        batches = {}
+        for job in jobs:
+            job_titles = titles.get(job["keyword"], [])
+            if job["posts"] is not None:
+                job_titles = job_titles[: int(job["posts"])]
+            batches.setdefault((job["prompt"], job["out"]), []).extend(job_titles)
+        journals = [
+            BatchJournal.create(batch_titles, prompt, out)
+            for (prompt, out), batch_titles in batches.items()
+            if batch_titles
+        ]
+
+    success_count = 0
+    failure_count = 0
+    for journal in journals:
+        done, failed = run_journal(journal, api_key, args)
+        success_count += done
+        failure_count += failed
+
+    from core.rate_limiter import format_limiter_stats, get_gemini_limiter
+
+    log(format_limiter_stats(get_gemini_limiter().stats()))
+    summary = {"posts": success_count, "failed": failure_count, "journals": [j.path for j in journals]}
+    print(json.dumps(summary, ensure_ascii=False))
+    return 1 if failure_count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
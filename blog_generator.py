@@ -12,9 +12,14 @@ from PyQt5.QtWidgets import (
     QProgressBar,
     QStatusBar,
     QTabWidget,
+    QCheckBox,
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from utils.utils import load_env_file
+from core.http_client import format_latency_stats, get_http_client
+from core.key_pool import env_api_keys
+from core.rate_limiter import format_key_usage, format_limiter_stats, get_gemini_limiter
+from core.search_cache import get_search_cache
 from tabs.title_generation_tab import TitleGenerationTab
 from tabs.content_generation_tab import ContentGenerationTab
 from tabs.blog_publish_tab import BlogPublishTab
@@ -67,8 +72,16 @@ class BlogGeneratorApp(QMainWindow):
         gemini_layout.addWidget(QLabel("Gemini API Key:"))
         self.gemini_key_input = QLineEdit()
         self.gemini_key_input.setEchoMode(QLineEdit.Password)
-        self.gemini_key_input.setPlaceholderText("Google AI Studio에서 발급받은 Gemini API 키")
+        self.gemini_key_input.setPlaceholderText(
+            "Google AI Studio에서 발급받은 Gemini API 키 (여러 개는 쉼표로 구분)"
+        )
         gemini_layout.addWidget(self.gemini_key_input)
+        
+        self.bypass_cache_check = QCheckBox("AI 응답 캐시 무시")
+        self.bypass_cache_check.setToolTip(
+            "같은 프롬프트로 생성한 적이 있어도 저장된 결과를 쓰지 않고 새로 생성합니다"
+        )
+        gemini_layout.addWidget(self.bypass_cache_check)
         api_layout.addLayout(gemini_layout)
         
         main_layout.addWidget(api_group)
@@ -98,6 +111,18 @@ class BlogGeneratorApp(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("준비됨")
         
+        # 검색 캐시 통계 (상태바 오른쪽)
+        self.cache_status_label = QLabel()
+        self.status_bar.addPermanentWidget(self.cache_status_label)
+        self.update_cache_status()
+        
+        # API 키별 상태와 사용량 (상태바 오른쪽, 생성 중에도 갱신)
+        self.key_status_label = QLabel()
+        self.status_bar.addPermanentWidget(self.key_status_label)
+        self.key_status_timer = QTimer(self)
+        self.key_status_timer.timeout.connect(self.update_key_status)
+        self.key_status_timer.start(2000)
+        
         # 스타일 적용
         self.apply_styles()
     
@@ -206,7 +231,7 @@ class BlogGeneratorApp(QMainWindow):
         # 환경변수에서 먼저 로드
         naver_id = os.getenv("NAVER_CLIENT_ID", "")
         naver_secret = os.getenv("NAVER_CLIENT_SECRET", "")
-        gemini_key = os.getenv("GEMINI_API_KEY", "")
+        gemini_key = ", ".join(env_api_keys())
         
         # GUI에 설정값 표시
         self.naver_id_input.setText(naver_id)
@@ -229,10 +254,39 @@ class BlogGeneratorApp(QMainWindow):
             self.gemini_key_input.setStyleSheet("background-color: #f0f0f0;")
             self.gemini_key_input.setToolTip("환경변수에서 로드됨 (.env 파일)")
     
+    def closeEvent(self, event):
+        """창을 닫을 때 진행 중인 일괄 작업을 중지하고 워커가 끝날 때까지 대기"""
+        self.status_bar.showMessage("진행 중인 작업을 정리하는 중...")
+        self.title_tab.stop_workers()
+        self.content_tab.stop_workers()
+        event.accept()
+    
     def update_status(self, message):
         """상태 업데이트"""
         self.status_bar.showMessage(message)
     
+    def use_response_cache(self):
+        """AI 응답 캐시 사용 여부"""
+        return not self.bypass_cache_check.isChecked()
+    
+    def update_cache_status(self):
+        """검색 캐시 적중/미적중 통계 표시 (툴팁: API 응답 시간, Gemini 한도)"""
+        stats = get_search_cache().stats()
+        self.cache_status_label.setText(
+            f"검색 캐시 적중 {stats['hits']} / 미적중 {stats['misses']} (저장 {stats['entries']}개)"
+        )
+        self.cache_status_label.setToolTip(
+            format_latency_stats(get_http_client().latency_stats())
+            + "\n"
+            + format_limiter_stats(get_gemini_limiter().stats())
+        )
+    
+    def update_key_status(self):
+        """API 키별 상태(정상/대기/사용 중지)와 완료 요청 수 표시 (툴팁: 키별 상세 사용량)"""
+        stats = get_gemini_limiter().stats()
+        self.key_status_label.setText(format_key_usage(stats))
+        self.key_status_label.setToolTip(format_limiter_stats(stats))
+    
 
 def main():
     app = QApplication(sys.argv)
@@ -144,7 +144,7 @@ def create_deployment_requirements():
     deployment_requirements = """
 # 배포용 고정 버전 의존성
 PyQt5==5.15.9
-google-generativeai==0.3.2
+google-generativeai==0.8.3
 requests==2.31.0
 selenium==4.15.2
 webdriver-manager==4.0.1
@@ -0,0 +1,179 @@
+"""
+    비동기 네트워크 엔진 모듈
+
+    백그라운드 스레드 하나에서 asyncio 이벤트 루프를 실행하고,
+    네이버 검색과 Gemini 호출을 코루틴으로 처리합니다. 동시에 진행되는 요청이 수백 개여도
+    스레드는 루프 하나만 사용하며, 속도는 기존과 같은 공용 제한기(acquire_async)가 조절합니다.
+
+    HTTP 요청은 aiohttp가 설치되어 있으면 aiohttp 세션으로 보내고,
+    없으면 공용 HTTP 클라이언트(requests)를 실행기 스레드에서 호출합니다.
+    응답 시간은 어느 쪽이든 공용 HTTP 클라이언트의 엔드포인트별 히스토그램에 기록됩니다.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from functools import partial
+from urllib.parse import urlsplit
+
+import requests
+
+from core.http_client import RETRY_STATUS_CODES, _retry_after_seconds, get_http_client
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+_CONNECTION_ERRORS = (asyncio.TimeoutError, requests.ConnectionError, requests.Timeout)
+if aiohttp is not None:
+    _CONNECTION_ERRORS += (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+
+
+class AsyncResponse:
+    """aiohttp 응답을 읽어 requests.Response와 같은 모양으로 보관"""
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content.decode("utf-8"))
+
+    def close(self):
+        pass
+
+
+class AsyncHttpClient:
+    """이벤트 루프 안에서 사용하는 HTTP 클라이언트 - 재시도 규칙은 HttpClient와 같음"""
+
+    def __init__(self, limit=100, limit_per_host=20, connect_timeout=5, read_timeout=30):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        # 백오프 설정과 응답 시간 기록은 공용 HTTP 클라이언트와 공유
+        self.sync_client = get_http_client()
+        self.session = None
+
+    def _get_session(self):
+        """aiohttp 세션은 루프 안에서 처음 사용할 때 생성"""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit, limit_per_host=self.limit_per_host
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.connect_timeout, sock_read=self.read_timeout
+                ),
+            )
+        return self.session
+
+    async def _send(self, method, url, **kwargs):
+        if aiohttp is None:
+            loop = asyncio.get_running_loop()
+            send = partial(
+                self.sync_client.session.request,
+                method,
+                url,
+                timeout=self.sync_client.timeout,
+                **kwargs,
+            )
+            return await loop.run_in_executor(None, send)
+
+        async with self._get_session().request(method, url, **kwargs) as response:
+            return AsyncResponse(response.status, response.headers, await response.read())
+
+    async def request(self, method, url, endpoint=None, limiter=None, **kwargs):
+        """
+        HTTP 요청 - 429/5xx 응답과 연결 오류는 백오프 후 재시도
+        limiter가 주어지면 매 시도 전에 limiter.acquire_async()를 기다립니다.
+        """
+        if endpoint is None:
+            parts = urlsplit(url)
+            endpoint = f"{parts.netloc}{parts.path}"
+        client = self.sync_client
+
+        attempt = 0
+        while True:
+            if limiter is not None:
+                await limiter.acquire_async()
+
+            started = time.monotonic()
+            try:
+                response = await self._send(method, url, **kwargs)
+            except _CONNECTION_ERRORS:
+                client.record_latency(endpoint, (time.monotonic() - started) * 1000)
+                if attempt >= client.max_retries:
+                    raise
+                await asyncio.sleep(client.backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            client.record_latency(endpoint, (time.monotonic() - started) * 1000)
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= client.max_retries:
+                return response
+
+            delay = _retry_after_seconds(response)
+            if delay is None:
+                delay = client.backoff_delay(attempt)
+            response.close()
+            await asyncio.sleep(min(delay, client.backoff_max))
+            attempt += 1
+
+    async def get(self, url, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+class AsyncEngine:
+    """백그라운드 스레드 하나에서 계속 실행되는 asyncio 이벤트 루프"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.http = AsyncHttpClient()
+        self.thread = threading.Thread(target=self._run, name="async-engine", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """다른 스레드에서 코루틴 실행 요청 - concurrent.futures.Future 반환"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout=None):
+        """코루틴을 루프에서 실행하고 끝날 때까지 대기 (루프 밖의 스레드에서 호출)"""
+        return self.submit(coro).result(timeout)
+
+
+async def run_blocking(func, *args, **kwargs):
+    """SQLite 저장 등 블로킹 작업을 실행기 스레드에서 실행해 루프를 막지 않음"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
+_async_engine = None
+_async_engine_lock = threading.Lock()
+
+
+def get_async_engine():
+    """프로그램 전체에서 공유하는 비동기 엔진 반환 (처음 호출할 때 루프 스레드 시작)"""
+    global _async_engine
+    with _async_engine_lock:
+        if _async_engine is None:
+            _async_engine = AsyncEngine()
+        return _async_engine
+
+
+def get_async_http_client():
+    """공용 이벤트 루프의 HTTP 클라이언트 (루프 안의 코루틴에서만 사용)"""
+    return get_async_engine().http
@@ -0,0 +1,146 @@
+"""
+    일괄 글 생성 기록(저널) 모듈
+
+    일괄 생성마다 JSON Lines 파일 하나에 제목 목록, 프롬프트와 그 해시,
+    제목별 완료(저장 경로)/실패 결과를 한 줄씩 덧붙여 기록합니다.
+    프로그램이 중간에 종료되어도 기록을 다시 읽어 완료되지 않은 제목만 이어서 생성할 수 있습니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from utils.utils import get_data_dir
+
+
+def get_journal_dir():
+    """저널 저장 폴더"""
+    path = os.path.join(get_data_dir(), "batches")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def prompt_hash(prompt):
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class BatchJournal:
+    """일괄 글 생성 기록 - 추가 기록만 하는 JSON Lines 파일"""
+
+    def __init__(self, path):
+        self.path = path
+        self.batch_id = os.path.splitext(os.path.basename(path))[0]
+        self.titles = []
+        self.prompt = ""
+        self.prompt_hash = ""
+        self.save_path = ""
+        self.created_at = None
+        self.done = {}  # index -> 저장 경로
+        self.failed = {}  # index -> 오류 메시지
+        self.needs_newline = False
+        self.lock = threading.Lock()
+
+    @classmethod
+    def create(cls, titles, prompt, save_path):
+        """새 저널 파일 생성"""
+        batch_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        journal = cls(os.path.join(get_journal_dir(), f"{batch_id}.jsonl"))
+        journal.titles = list(titles)
+        journal.prompt = prompt
+        journal.prompt_hash = prompt_hash(prompt)
+        journal.save_path = save_path
+        journal.created_at = time.time()
+        journal._append(
+            {
+                "type": "start",
+                "titles": journal.titles,
+                "prompt": prompt,
+                "prompt_hash": journal.prompt_hash,
+                "save_path": save_path,
+                "created_at": journal.created_at,
+            }
+        )
+        return journal
+
+    @classmethod
+    def load(cls, path):
+        """저널 파일을 읽어 진행 상태 복원 - 마지막 줄이 잘려 있으면 무시"""
+        journal = cls(path)
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                # 기록 중 종료되어 잘린 줄 뒤에 이어 쓰지 않도록 표시
+                journal.needs_newline = not line.endswith("\n")
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                journal._apply(record)
+        return journal
+
+    def _apply(self, record):
+        kind = record.get("type")
+        if kind == "start":
+            self.titles = record["titles"]
+            self.prompt = record["prompt"]
+            self.prompt_hash = record["prompt_hash"]
+            self.save_path = record.get("save_path", "")
+            self.created_at = record.get("created_at")
+        elif kind == "done":
+            self.done[record["index"]] = record["path"]
+            self.failed.pop(record["index"], None)
+        elif kind == "failed":
+            if record["index"] not in self.done:
+                self.failed[record["index"]] = record["error"]
+
+    def _append(self, record):
+        """기록 한 줄 추가 후 디스크에 반영"""
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                if self.needs_newline:
+                    f.write("\n")
+                    self.needs_newline = False
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def record_done(self, index, path):
+        self._append({"type": "done", "index": index, "path": path, "at": time.time()})
+        self._apply({"type": "done", "index": index, "path": path})
+
+    def record_failed(self, index, error):
+        self._append({"type": "failed", "index": index, "error": error, "at": time.time()})
+        self._apply({"type": "failed", "index": index, "error": error})
+
+    def remaining(self):
+        """아직 완료되지 않은 (index, 제목) 목록 - 실패한 제목 포함"""
+        return [(i, title) for i, title in enumerate(self.titles) if i not in self.done]
+
+    def is_complete(self):
+        return len(self.done) >= len(self.titles)
+
+    def summary(self):
+        """목록 표시용 요약 문자열"""
+        created = datetime.fromtimestamp(self.created_at or 0).strftime("%Y-%m-%d %H:%M")
+        first = self.titles[0] if self.titles else ""
+        return (
+            f"{created} - {first} 외 {max(0, len(self.titles) - 1)}개 "
+            f"(완료 {len(self.done)}/{len(self.titles)}, 실패 {len(self.failed)})"
+        )
+
+
+def list_unfinished_journals():
+    """완료되지 않은 저널 목록 (최근 순)"""
+    journals = []
+    for name in sorted(os.listdir(get_journal_dir()), reverse=True):
+        if not name.endswith(".jsonl"):
+            continue
+        try:
+            journal = BatchJournal.load(os.path.join(get_journal_dir(), name))
+        except (OSError, KeyError):
+            continue
+        if journal.titles and not journal.is_complete():
+            journals.append(journal)
+    return journals
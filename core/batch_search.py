@@ -0,0 +1,181 @@
+"""
+    다중 키워드 일괄 검색 모듈
+
+    키워드 목록을 동시에 검색하고 결과를 키워드별로 태그하여 하나로 합칩니다 (키워드 사이 중복 글 제거).
+    동시에 진행되는 검색 수는 max_in_flight로 제한되며,
+    실제 API 호출 속도는 core.naver_search의 공용 제한기가 조절합니다.
+    run_async는 같은 작업을 공용 asyncio 루프에서 코루틴으로 실행합니다.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from core.naver_search import (
+    MAX_RESULTS,
+    deep_search,
+    deep_search_async,
+    search_blog_page,
+    search_blog_page_async,
+)
+from core.normalizer import dedupe_posts
+from core.post_store import get_post_store
+from core.stage_metrics import STAGE_SEARCH, get_stage_metrics
+
+
+def parse_keywords(text):
+    """붙여넣은 텍스트에서 키워드 목록 추출 (줄바꿈/쉼표 구분, 중복 제거)"""
+    keywords = []
+    seen = set()
+    for line in text.splitlines():
+        for keyword in line.split(","):
+            keyword = keyword.strip()
+            if keyword and not keyword.startswith("#") and keyword not in seen:
+                seen.add(keyword)
+                keywords.append(keyword)
+    return keywords
+
+
+def load_keywords(file_path):
+    """키워드 파일 읽기"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return parse_keywords(f.read())
+
+
+def _aggregate(keywords, results):
+    """
+    키워드 입력 순서대로 결과 합치기
+    여러 키워드에서 같은 글이 나오면 먼저 나온 키워드의 글만 남기도록 합친 결과도 중복 제거
+    """
+    aggregated = []
+    for keyword in keywords:
+        aggregated.extend(results.get(keyword, []))
+    return dedupe_posts(aggregated)
+
+
+class BatchSearchEngine:
+    """다중 키워드 동시 검색 엔진"""
+
+    def __init__(
+        self,
+        client_id,
+        client_secret,
+        max_in_flight=4,
+        deep=False,
+        max_results=MAX_RESULTS,
+        use_cache=True,
+    ):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.max_in_flight = max_in_flight
+        self.deep = deep
+        self.max_results = max_results
+        self.use_cache = use_cache
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        """아직 시작하지 않은 키워드 검색 취소"""
+        self.stop_event.set()
+
+    def _check_stopped(self):
+        """취소 후 남은 키워드는 빈 결과가 아닌 실패(취소됨)로 보고"""
+        if self.stop_event.is_set():
+            raise RuntimeError("취소됨")
+
+    def search_keyword(self, keyword):
+        """키워드 하나 검색 후 중복 제거, 저장소에 보관하고 키워드 태그 추가"""
+        self._check_stopped()
+
+        with get_stage_metrics().timed(STAGE_SEARCH):
+            if self.deep:
+                blog_posts = deep_search(
+                    keyword, self.client_id, self.client_secret, **self._search_kwargs()
+                )
+            else:
+                blog_posts, _ = search_blog_page(
+                    keyword, self.client_id, self.client_secret, **self._search_kwargs()
+                )
+
+        return self._store_keyword(keyword, blog_posts)
+
+    def _store_keyword(self, keyword, blog_posts):
+        """중복 제거 후 저장소에 보관하고 키워드 태그 추가"""
+        blog_posts = dedupe_posts(blog_posts)
+        get_post_store().add_posts(keyword, blog_posts)
+        for post in blog_posts:
+            post["keyword"] = keyword
+        return blog_posts
+
+    def _search_kwargs(self):
+        if self.deep:
+            return {"max_results": self.max_results, "use_cache": self.use_cache}
+        return {"display": 20, "use_cache": self.use_cache}
+
+    def run(self, keywords, on_keyword_done=None, on_keyword_failed=None):
+        """
+        키워드 목록 검색 - 키워드 입력 순서대로 합친 결과 반환
+        on_keyword_done(keyword, blog_posts), on_keyword_failed(keyword, error)는
+        키워드 검색이 끝날 때마다 호출됩니다.
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            futures = {
+                executor.submit(self.search_keyword, keyword): keyword
+                for keyword in keywords
+            }
+            for future in as_completed(futures):
+                keyword = futures[future]
+                try:
+                    blog_posts = future.result()
+                except Exception as e:
+                    if on_keyword_failed:
+                        on_keyword_failed(keyword, str(e))
+                    continue
+
+                results[keyword] = blog_posts
+                if on_keyword_done:
+                    on_keyword_done(keyword, blog_posts)
+
+        return _aggregate(keywords, results)
+
+    async def search_keyword_async(self, keyword):
+        """search_keyword의 코루틴 버전 - 저장소 기록은 실행기 스레드에서 처리"""
+        from core.async_engine import run_blocking
+
+        self._check_stopped()
+
+        with get_stage_metrics().timed(STAGE_SEARCH):
+            if self.deep:
+                blog_posts = await deep_search_async(
+                    keyword, self.client_id, self.client_secret, **self._search_kwargs()
+                )
+            else:
+                blog_posts, _ = await search_blog_page_async(
+                    keyword, self.client_id, self.client_secret, **self._search_kwargs()
+                )
+
+        return await run_blocking(self._store_keyword, keyword, blog_posts)
+
+    async def run_async(self, keywords, on_keyword_done=None, on_keyword_failed=None):
+        """run의 코루틴 버전 - max_in_flight개 키워드를 스레드 없이 동시에 검색"""
+        from core.async_engine import run_blocking
+
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        results = {}
+
+        async def run_keyword(keyword):
+            async with semaphore:
+                try:
+                    blog_posts = await self.search_keyword_async(keyword)
+                except Exception as e:
+                    if on_keyword_failed:
+                        on_keyword_failed(keyword, str(e))
+                    return
+
+            results[keyword] = blog_posts
+            if on_keyword_done:
+                on_keyword_done(keyword, blog_posts)
+
+        await asyncio.gather(*(run_keyword(keyword) for keyword in keywords))
+
+        # 합친 결과의 중복 제거는 CPU 작업이므로 실행기 스레드에서 처리
+        return await run_blocking(_aggregate, keywords, results)
@@ -0,0 +1,562 @@
+"""
+    블로그 글 생성 모듈
+
+    제목과 사용자 프롬프트로 글 생성 요청 프롬프트를 만들고 Gemini로 글을 생성합니다.
+    BatchContentEngine은 여러 제목을 max_in_flight개씩 동시에 생성하고 결과를 파일로 저장합니다.
+    파일은 "<파일명>.part"에 먼저 쓴 뒤 완료되면 원래 이름으로 바꾸므로(os.replace)
+    완성되지 않은 글이 최종 파일로 남지 않고, 스트리밍 중 실패하면 .part 파일에 받은 부분이 남습니다.
+    스트리밍으로 완료한 글은 파일에서 다시 읽어 응답 캐시에 저장합니다 (STREAM_CACHE_MAX_BYTES 이하만).
+    같은 파일명으로 정리되는 제목은 _2, _3... 을 붙여 따로 저장합니다.
+    run_async는 같은 작업을 공용 asyncio 루프에서 코루틴으로 실행합니다.
+
+    여러 제목이 같은 프롬프트를 쓰므로 일괄 생성 시 프롬프트는 공유 지침으로 한 번만 등록하고
+    (core.llm_provider.open_shared_context), 제목마다 제목 부분만 보냅니다.
+    절감한 입력 토큰은 shared_prefix_report()로 생성 로그에 표시합니다.
+    outline=True면 제목마다 개요를 먼저 만들고 부분들을 동시에 생성합니다 (core.outline_generation).
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from core.llm_provider import (
+    SHARED_MODE_CONTEXT_CACHE,
+    get_llm_model,
+    open_shared_context,
+)
+from core.prompt_builder import PromptBuilder, estimate_cached_savings, get_token_budget
+from core.response_cache import (
+    cached_generate,
+    cached_generate_async,
+    cached_generate_stream,
+    cached_generate_stream_async,
+    store_response,
+)
+from core.stage_metrics import STAGE_CONTENT, STAGE_FILE_OUTPUT, get_stage_metrics
+from utils.utils import sanitize_filename
+
+CONTENT_MODEL_NAME = "gemini-2.0-flash-exp"
+
+# 글 하나당 예상 출력 토큰 수 (2000~3000자 기준, 비용 추정용)
+OUTPUT_TOKENS_PER_POST = 3000
+
+DEFAULT_MAX_IN_FLIGHT = 3
+
+# 스트리밍으로 생성한 글을 응답 캐시에 저장할 최대 본문 크기 (바이트)
+STREAM_CACHE_MAX_BYTES = 256 * 1024
+
+# 스트리밍 글 임시 파일을 디스크로 내보내는 최소 간격 (초) - 조각마다 flush하지 않음
+STREAM_FLUSH_INTERVAL = 1.0
+
+
+CONTENT_INSTRUCTION = "위 지침에 따라 이 제목으로 블로그 글을 작성해주세요."
+
+
+def build_content_prompt(title, prompt, budget=None):
+    """
+    글 생성 프롬프트 - 사용자 프롬프트는 줄이지 않고 공백만 정리
+    제목마다 같은 사용자 프롬프트를 앞에 두어 서버의 접두사 캐시가 적중하도록 함
+    """
+    builder = PromptBuilder(budget)
+    builder.add("prompt", prompt, required=True)
+    builder.add("title", f"제목: {title}", required=True)
+    builder.add("instruction", CONTENT_INSTRUCTION, required=True)
+    full_prompt, _, _ = builder.build()
+    return full_prompt
+
+
+def build_content_delta(title):
+    """공유 지침(사용자 프롬프트)을 등록한 모델에 보내는 제목별 요청"""
+    builder = PromptBuilder()
+    builder.add("title", f"제목: {title}", required=True)
+    builder.add("instruction", CONTENT_INSTRUCTION, required=True)
+    full_prompt, _, _ = builder.build()
+    return full_prompt
+
+
+def _content_request(title, prompt, shared):
+    if shared:
+        return build_content_delta(title)
+    return build_content_prompt(title, prompt, get_token_budget())
+
+
+def outline_mode_enabled():
+    """개요 → 섹션 병렬 생성 모드 기본값 (.env의 CONTENT_OUTLINE_MODE)"""
+    return os.getenv("CONTENT_OUTLINE_MODE", "0").lower() in ("1", "true", "yes", "on")
+
+
+def shared_prefix_enabled():
+    """일괄 생성 시 프롬프트 공유 지침 등록 여부 기본값 (.env의 CONTENT_SHARED_PREFIX)"""
+    return os.getenv("CONTENT_SHARED_PREFIX", "1").lower() not in ("0", "false", "no", "off")
+
+
+def get_max_in_flight():
+    """동시 글 생성 수 기본값 (.env의 CONTENT_MAX_IN_FLIGHT)"""
+    return int(os.getenv("CONTENT_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT))
+
+
+def generate_content(
+    model, title, prompt, use_cache=True, api_key=None, shared=False, on_usage=None
+):
+    """
+    글 하나 생성 - (본문, 캐시 적중 여부) 반환
+    shared=True면 model에 prompt가 공유 지침으로 등록되어 있으므로 제목 부분만 보냅니다.
+    """
+    full_prompt = _content_request(title, prompt, shared)
+    with get_stage_metrics().timed(STAGE_CONTENT):
+        return cached_generate(
+            model,
+            CONTENT_MODEL_NAME,
+            full_prompt,
+            use_cache=use_cache,
+            api_key=api_key,
+            on_usage=on_usage,
+        )
+
+
+async def generate_content_async(
+    model, title, prompt, use_cache=True, api_key=None, shared=False, on_usage=None
+):
+    """generate_content의 코루틴 버전"""
+    full_prompt = _content_request(title, prompt, shared)
+    with get_stage_metrics().timed(STAGE_CONTENT):
+        return await cached_generate_async(
+            model,
+            CONTENT_MODEL_NAME,
+            full_prompt,
+            use_cache=use_cache,
+            api_key=api_key,
+            on_usage=on_usage,
+        )
+
+
+class ContentStreamError(Exception):
+    """스트리밍 생성 중 실패 - partial_path에 받은 부분까지 저장됨"""
+
+    def __init__(self, message, partial_path):
+        super().__init__(message)
+        self.partial_path = partial_path
+
+
+def open_content_file(save_path, title):
+    """
+    글 저장 경로(제목_생성시각.txt)를 정하고 임시 파일을 새로 열기 - (저장 경로, 임시 경로, 파일) 반환
+    같은 파일명으로 정리되는 제목이 동시에 저장될 수 있으므로 임시 파일은 "x" 모드로 열고,
+    이미 쓰이고 있는 이름이면 _2, _3... 을 붙입니다.
+    """
+    base = f"{sanitize_filename(title)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    number = 1
+    while True:
+        name = base if number == 1 else f"{base}_{number}"
+        number += 1
+        path = os.path.join(save_path, name + ".txt")
+        part_path = path + ".part"
+        try:
+            f = open(part_path, "x", encoding="utf-8")
+        except FileExistsError:
+            continue
+        if os.path.exists(path):
+            # 같은 이름의 글이 이미 완료됨
+            f.close()
+            os.remove(part_path)
+            continue
+        return path, part_path, f
+
+
+def content_file_header(title):
+    """글 파일 머리말 (제목, 생성일시, 구분선)"""
+    return (
+        f"제목: {title}\n"
+        f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        + "=" * 50
+        + "\n\n"
+    )
+
+
+def save_content(save_path, title, content):
+    """글 전체를 임시 파일에 쓴 뒤 최종 이름으로 변경 - 저장 경로 반환"""
+    with get_stage_metrics().timed(STAGE_FILE_OUTPUT):
+        path, part_path, f = open_content_file(save_path, title)
+        with f:
+            f.write(content_file_header(title))
+            f.write(content)
+        os.replace(part_path, path)
+    return path
+
+
+class _StreamedContentFile:
+    """
+    스트리밍 글 파일 쓰기 (동기/비동기 공통)
+    임시 파일에 머리말을 쓰고 조각을 이어 기록하며, complete()에서 최종 이름으로 바꿉니다.
+    """
+
+    def __init__(self, save_path, title, on_start=None, on_chunk=None):
+        self.path, self.part_path, self.file = open_content_file(save_path, title)
+        self.header = content_file_header(title)
+        self.on_chunk = on_chunk
+        self.write_seconds = 0.0
+        self.file.write(self.header)
+        self.file.flush()
+        self.flushed_at = time.monotonic()
+        if on_start:
+            on_start(self.part_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.file.close()
+
+    def write(self, text):
+        """조각은 파일 버퍼에 쓰고 STREAM_FLUSH_INTERVAL마다 flush (실패 시 close가 남은 부분을 기록)"""
+        started = time.monotonic()
+        self.file.write(text)
+        if started - self.flushed_at >= STREAM_FLUSH_INTERVAL:
+            self.file.flush()
+            self.flushed_at = started
+        self.write_seconds += time.monotonic() - started
+        if self.on_chunk:
+            self.on_chunk(text)
+
+    def error(self, cause):
+        return ContentStreamError(f"{cause} (받은 부분: {self.part_path})", self.part_path)
+
+    def complete(self):
+        """파일을 닫은 뒤 호출 - 최종 이름으로 바꾸고 파일 쓰기 시간 기록, 저장 경로 반환"""
+        started = time.monotonic()
+        os.replace(self.part_path, self.path)
+        self.write_seconds += time.monotonic() - started
+        get_stage_metrics().record(STAGE_FILE_OUTPUT, self.write_seconds * 1000)
+        return self.path
+
+    def read_content(self, max_bytes):
+        """complete() 후 호출 - 파일에서 머리말을 뺀 본문, max_bytes를 넘으면 None"""
+        if os.path.getsize(self.path) - len(self.header.encode("utf-8")) > max_bytes:
+            return None
+        with open(self.path, "r", encoding="utf-8") as f:
+            return f.read()[len(self.header) :]
+
+
+def _cache_streamed_content(model, full_prompt, output):
+    """완료된 스트리밍 글을 파일에서 읽어 응답 캐시에 저장 (크기 제한 초과 시 건너뜀)"""
+    content = output.read_content(STREAM_CACHE_MAX_BYTES)
+    if content is not None:
+        store_response(model, CONTENT_MODEL_NAME, full_prompt, content)
+
+
+def stream_content_to_file(
+    model,
+    title,
+    prompt,
+    save_path,
+    use_cache=True,
+    api_key=None,
+    on_start=None,
+    on_chunk=None,
+    shared=False,
+    on_usage=None,
+):
+    """
+    글을 스트리밍으로 생성하며 받은 조각을 바로 파일에 기록 - 저장 경로 반환
+    on_start(part_path)는 쓰기 시작 시, on_chunk(text)는 조각마다 호출됩니다.
+    받은 조각은 파일에만 쓰고 모아 두지 않으며, 완료 후 파일을 다시 읽어 응답 캐시에 저장합니다.
+    shared, on_usage는 generate_content와 같습니다.
+    처리 시간은 글 생성 전체와, 그중 파일 쓰기에 걸린 시간을 따로 기록합니다.
+    """
+    full_prompt = _content_request(title, prompt, shared)
+    with get_stage_metrics().timed(STAGE_CONTENT):
+        with _StreamedContentFile(save_path, title, on_start, on_chunk) as output:
+            try:
+                for text in cached_generate_stream(
+                    model,
+                    CONTENT_MODEL_NAME,
+                    full_prompt,
+                    use_cache=use_cache,
+                    api_key=api_key,
+                    on_usage=on_usage,
+                    store=False,
+                ):
+                    output.write(text)
+            except Exception as e:
+                raise output.error(e) from e
+        path = output.complete()
+        _cache_streamed_content(model, full_prompt, output)
+        return path
+
+
+async def stream_content_to_file_async(
+    model,
+    title,
+    prompt,
+    save_path,
+    use_cache=True,
+    api_key=None,
+    on_start=None,
+    on_chunk=None,
+    shared=False,
+    on_usage=None,
+):
+    """
+    stream_content_to_file의 코루틴 버전 - 조각은 파일 버퍼에만 쓰고 가끔 flush하므로 루프에서 바로 실행
+    파일 이름 변경과 완료된 글을 다시 읽어 캐시에 저장하는 작업은 실행기 스레드에서 처리합니다.
+    """
+    from core.async_engine import run_blocking
+
+    full_prompt = _content_request(title, prompt, shared)
+    with get_stage_metrics().timed(STAGE_CONTENT):
+        with _StreamedContentFile(save_path, title, on_start, on_chunk) as output:
+            try:
+                async for text in cached_generate_stream_async(
+                    model,
+                    CONTENT_MODEL_NAME,
+                    full_prompt,
+                    use_cache=use_cache,
+                    api_key=api_key,
+                    on_usage=on_usage,
+                    store=False,
+                ):
+                    output.write(text)
+            except Exception as e:
+                raise output.error(e) from e
+        path = await run_blocking(output.complete)
+        await run_blocking(_cache_streamed_content, model, full_prompt, output)
+        return path
+
+
+class PromptUsage:
+    """실제로 호출한 요청의 입력 토큰과 그중 캐시 적중 토큰 합계"""
+
+    def __init__(self):
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.lock = threading.Lock()
+
+    def record(self, usage_metadata):
+        with self.lock:
+            self.requests += 1
+            self.prompt_tokens += getattr(usage_metadata, "prompt_token_count", 0) or 0
+            self.cached_tokens += getattr(usage_metadata, "cached_content_token_count", 0) or 0
+
+
+def format_shared_prefix_report(mode, shared_tokens, usage):
+    """공유 지침 등록 방식과 절감한 입력 토큰 요약 (생성 로그용)"""
+    method = "컨텍스트 캐시" if mode == SHARED_MODE_CONTEXT_CACHE else "시스템 지침"
+    if not usage.requests:
+        return f"공유 지침({method}, 약 {shared_tokens:,}토큰): 새로 호출한 요청 없음"
+    ratio = usage.cached_tokens / usage.prompt_tokens if usage.prompt_tokens else 0
+    return (
+        f"공유 지침({method}, 약 {shared_tokens:,}토큰): "
+        f"요청 {usage.requests}개, 입력 {usage.prompt_tokens:,}토큰 중 "
+        f"{usage.cached_tokens:,}토큰 캐시 적중 ({ratio:.0%}), "
+        f"절감 약 ${estimate_cached_savings(usage.cached_tokens):.4f}"
+    )
+
+
+class BatchContentEngine:
+    """여러 제목 동시 글 생성 엔진 - 생성한 글은 save_path에 파일로 저장"""
+
+    def __init__(
+        self,
+        api_key,
+        prompt,
+        save_path,
+        max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+        use_cache=True,
+        stream=False,
+        shared_prefix=None,
+        outline=None,
+    ):
+        self.api_key = api_key
+        self.prompt = prompt
+        self.save_path = save_path
+        self.max_in_flight = max_in_flight
+        self.use_cache = use_cache
+        self.stream = stream
+        self.shared_prefix = shared_prefix_enabled() if shared_prefix is None else shared_prefix
+        # 개요 모드는 부분들을 이어 붙인 뒤 저장하므로 스트리밍하지 않음
+        self.outline = outline_mode_enabled() if outline is None else outline
+        self.shared_context = None
+        self.usage = PromptUsage()
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        """아직 시작하지 않은 제목 생성 취소"""
+        self.stop_event.set()
+
+    def _open_model(self, titles):
+        """
+        생성에 사용할 모델 - 제목이 둘 이상이면 프롬프트를 공유 지침으로 등록한 모델
+        등록에 실패하면 제목마다 전체 프롬프트를 보내는 기본 모델 사용
+        """
+        self.shared_context = None
+        self.usage = PromptUsage()
+        if self.shared_prefix and len(titles) > 1:
+            try:
+                self.shared_context = open_shared_context(
+                    self.api_key, CONTENT_MODEL_NAME, self.prompt
+                )
+            except Exception:
+                self.shared_context = None
+            else:
+                return self.shared_context.model
+        return get_llm_model(self.api_key, CONTENT_MODEL_NAME)
+
+    def _close_model(self):
+        if self.shared_context is not None:
+            self.shared_context.close()
+
+    def shared_prefix_report(self):
+        """마지막 실행의 공유 지침 절감 요약 (공유 지침을 쓰지 않았으면 None)"""
+        if self.shared_context is None:
+            return None
+        return format_shared_prefix_report(
+            self.shared_context.mode, self.shared_context.shared_tokens, self.usage
+        )
+
+    def _request_kwargs(self):
+        return {
+            "use_cache": self.use_cache,
+            "api_key": self.api_key,
+            "shared": self.shared_context is not None,
+            "on_usage": self.usage.record,
+        }
+
+    def _stream_callbacks(self, index, title, on_title_started, on_chunk):
+        """stream_content_to_file의 on_start/on_chunk - 제목 위치를 붙여 전달"""
+
+        def started(part_path):
+            if on_title_started:
+                on_title_started(index, title, part_path)
+
+        def received(text):
+            if on_chunk:
+                on_chunk(index, text)
+
+        return {"on_start": started, "on_chunk": received}
+
+    def _check_stopped(self):
+        if self.stop_event.is_set():
+            raise RuntimeError("취소됨")
+
+    def generate_title(self, model, index, title, on_title_started, on_chunk):
+        """제목 하나 생성 후 저장 - (저장 경로, 캐시 적중 여부) 반환"""
+        from core.outline_generation import generate_outlined_content
+
+        self._check_stopped()
+        if self.stream and not self.outline:
+            path = stream_content_to_file(
+                model,
+                title,
+                self.prompt,
+                self.save_path,
+                **self._request_kwargs(),
+                **self._stream_callbacks(index, title, on_title_started, on_chunk),
+            )
+            return path, False
+
+        generate = generate_outlined_content if self.outline else generate_content
+        content, cache_hit = generate(model, title, self.prompt, **self._request_kwargs())
+        return save_content(self.save_path, title, content), cache_hit
+
+    def run(
+        self,
+        titles,
+        on_title_done=None,
+        on_title_failed=None,
+        on_title_started=None,
+        on_chunk=None,
+    ):
+        """
+        제목 목록 글 생성 - 성공한 개수 반환
+        on_title_done(index, title, path, cache_hit), on_title_failed(index, title, error)는
+        끝나는 순서대로 호출되며, index는 titles 안의 위치입니다.
+        스트리밍 모드에서는 on_title_started(index, title, part_path)와 on_chunk(index, text)도 호출됩니다.
+        """
+        model = self._open_model(titles)
+        success_count = 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+                futures = {
+                    executor.submit(
+                        self.generate_title, model, index, title, on_title_started, on_chunk
+                    ): index
+                    for index, title in enumerate(titles)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        path, cache_hit = future.result()
+                    except Exception as e:
+                        if on_title_failed:
+                            on_title_failed(index, titles[index], str(e))
+                        continue
+
+                    success_count += 1
+                    if on_title_done:
+                        on_title_done(index, titles[index], path, cache_hit)
+        finally:
+            self._close_model()
+        return success_count
+
+    async def generate_title_async(self, model, index, title, on_title_started, on_chunk):
+        """generate_title의 코루틴 버전"""
+        from core.async_engine import run_blocking
+        from core.outline_generation import generate_outlined_content_async
+
+        self._check_stopped()
+        if self.stream and not self.outline:
+            path = await stream_content_to_file_async(
+                model,
+                title,
+                self.prompt,
+                self.save_path,
+                **self._request_kwargs(),
+                **self._stream_callbacks(index, title, on_title_started, on_chunk),
+            )
+            return path, False
+
+        generate = generate_outlined_content_async if self.outline else generate_content_async
+        content, cache_hit = await generate(model, title, self.prompt, **self._request_kwargs())
+        # 파일 저장은 실행기 스레드에서 처리
+        return await run_blocking(save_content, self.save_path, title, content), cache_hit
+
+    async def run_async(
+        self,
+        titles,
+        on_title_done=None,
+        on_title_failed=None,
+        on_title_started=None,
+        on_chunk=None,
+    ):
+        """run의 코루틴 버전 - max_in_flight개까지 스레드 없이 동시에 생성"""
+        from core.async_engine import run_blocking
+
+        # 컨텍스트 캐시 생성/삭제는 블로킹 호출이므로 실행기 스레드에서 실행
+        model = await run_blocking(self._open_model, titles)
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        success_count = 0
+
+        async def run_title(index, title):
+            nonlocal success_count
+            async with semaphore:
+                try:
+                    path, cache_hit = await self.generate_title_async(
+                        model, index, title, on_title_started, on_chunk
+                    )
+                except Exception as e:
+                    if on_title_failed:
+                        on_title_failed(index, title, str(e))
+                    return
+
+            success_count += 1
+            if on_title_done:
+                on_title_done(index, title, path, cache_hit)
+
+        try:
+            await asyncio.gather(*(run_title(index, title) for index, title in enumerate(titles)))
+        finally:
+            await run_blocking(self._close_model)
+        return success_count
@@ -0,0 +1,344 @@
+"""
+    로컬 가짜 LLM 모듈
+
+    API 할당량을 쓰지 않고 일괄 생성 처리량을 시험하기 위한 가짜 모델입니다.
+    응답 내용은 프롬프트 해시로 정해져 같은 프롬프트에는 항상 같은 응답을 돌려주고,
+    지연 시간 분포, 오류(429/500/시간 초과) 주입 비율, 스트리밍 조각 수를 설정할 수 있습니다.
+    지연과 오류는 seed로 초기화한 난수로 뽑으므로 같은 설정이면 같은 순서로 재현됩니다.
+    시스템 지침을 등록한 모델은 서버의 접두사 캐시처럼 두 번째 요청부터 지침 토큰을
+    usage_metadata.cached_content_token_count로 보고합니다.
+    키 풀 시험용으로 "invalid"로 시작하는 API 키는 잘못된 키 오류(API key not valid)를 반환합니다.
+
+    .env 설정 예:
+        FAKE_LLM_LATENCY=lognormal:800,0.5   (fixed:ms / uniform:최소,최대 / normal:평균,표준편차 / lognormal:중앙값,sigma)
+        FAKE_LLM_ERRORS=429:0.05,500:0.02,timeout:0.01
+        FAKE_LLM_STREAM_CHUNKS=20
+        FAKE_LLM_CONTENT_CHARS=2500         (프롬프트에 "약 N자"가 있으면 N자)
+        FAKE_LLM_OUTPUT_RATE=0              (초당 출력 글자 수 - 0보다 크면 응답 길이만큼 지연 추가)
+        FAKE_LLM_TIMEOUT=5
+        FAKE_LLM_SEED=0
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from core.llm_provider import shared_prefix_key
+from core.prompt_builder import estimate_tokens
+
+_COUNT_PATTERN = re.compile(r"제목을 (\d+)개")
+_KEYWORDS_PATTERN = re.compile(r"그대로 사용하세요: (.+)")
+_SECTIONS_PATTERN = re.compile(r"소제목 (\d+)개")
+_LENGTH_PATTERN = re.compile(r"약 (\d+)자")
+
+_WORDS = (
+    "추천", "방법", "정리", "후기", "가이드", "꿀팁", "비교", "총정리", "핵심", "실전",
+    "초보", "완벽", "필수", "최신", "체크리스트", "노하우", "입문", "활용", "분석", "선택",
+)
+
+
+class FakeLLMError(Exception):
+    """가짜 모델이 주입한 오류 - code는 HTTP 상태 코드"""
+
+    code = 500
+
+
+class FakeRateLimitError(FakeLLMError):
+    """주입된 429 (ResourceExhausted)"""
+
+    code = 429
+
+
+class FakeAuthError(FakeLLMError):
+    """잘못된 API 키 (InvalidArgument)"""
+
+    code = 400
+
+
+class FakeTimeoutError(FakeLLMError, TimeoutError):
+    """주입된 시간 초과"""
+
+    code = 504
+
+
+def parse_latency_spec(spec):
+    """"종류:값,값" 형식의 지연 시간 분포 설정 파싱 - (종류, [값...])"""
+    kind, _, values = spec.partition(":")
+    kind = kind.strip().lower()
+    params = [float(value) for value in values.split(",") if value.strip()]
+    expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}
+    if kind not in expected or len(params) != expected[kind]:
+        raise ValueError(f"지연 시간 분포 형식 오류: {spec}")
+    return kind, params
+
+
+def parse_error_spec(spec):
+    """"429:0.05,500:0.02,timeout:0.01" 형식의 오류 비율 설정 파싱"""
+    rates = {}
+    for item in spec.split(","):
+        if item.strip():
+            name, _, rate = item.partition(":")
+            rates[name.strip().lower()] = float(rate)
+    return rates
+
+
+class FakeLLMConfig:
+    """가짜 모델 설정"""
+
+    def __init__(
+        self,
+        latency="fixed:0",
+        errors="",
+        stream_chunks=20,
+        content_chars=2500,
+        timeout=5.0,
+        seed=0,
+        output_rate=0,
+    ):
+        self.latency = parse_latency_spec(latency)
+        self.errors = parse_error_spec(errors)
+        self.stream_chunks = max(1, int(stream_chunks))
+        self.content_chars = int(content_chars)
+        self.timeout = float(timeout)
+        self.seed = seed
+        self.output_rate = float(output_rate)
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            latency=os.getenv("FAKE_LLM_LATENCY", "fixed:0"),
+            errors=os.getenv("FAKE_LLM_ERRORS", ""),
+            stream_chunks=int(os.getenv("FAKE_LLM_STREAM_CHUNKS", 20)),
+            content_chars=int(os.getenv("FAKE_LLM_CONTENT_CHARS", 2500)),
+            timeout=float(os.getenv("FAKE_LLM_TIMEOUT", 5)),
+            seed=int(os.getenv("FAKE_LLM_SEED", 0)),
+            output_rate=float(os.getenv("FAKE_LLM_OUTPUT_RATE", 0)),
+        )
+
+
+class _Usage:
+    def __init__(self, prompt_tokens, output_tokens, cached_tokens=0):
+        self.prompt_token_count = prompt_tokens
+        self.candidates_token_count = output_tokens
+        self.cached_content_token_count = cached_tokens
+        self.total_token_count = prompt_tokens + output_tokens
+
+
+class FakeResponse:
+    """Gemini 응답과 같은 형태 (.text, .usage_metadata)"""
+
+    def __init__(self, text, usage_metadata=None):
+        self.text = text
+        self.usage_metadata = usage_metadata
+
+
+class _TokenCount:
+    def __init__(self, total_tokens):
+        self.total_tokens = total_tokens
+
+
+class FakeModel:
+    """GenerativeModel과 같은 generate_content/count_tokens를 제공하는 가짜 모델"""
+
+    def __init__(
+        self,
+        model_name,
+        config,
+        rng,
+        rng_lock,
+        system_instruction=None,
+        seen_instructions=None,
+        api_key=None,
+    ):
+        self.model_name = model_name
+        self.invalid_key = bool(api_key) and api_key.startswith("invalid")
+        self.config = config
+        self.rng = rng
+        self.rng_lock = rng_lock
+        self.system_instruction = system_instruction
+        self.system_tokens = estimate_tokens(system_instruction) if system_instruction else 0
+        self.seen_instructions = seen_instructions if seen_instructions is not None else set()
+        # 응답 캐시에서 실제 Gemini 응답과 섞이지 않도록 캐시 키 앞에 붙이는 값
+        self.cache_prefix = "fake:" + shared_prefix_key(system_instruction)
+
+    def _prompt_usage(self, prompt):
+        """(입력 토큰 수, 캐시 적중 토큰 수) - 이미 보낸 시스템 지침은 캐시 적중으로 계산"""
+        cached_tokens = 0
+        if self.system_instruction:
+            with self.rng_lock:
+                if self.system_instruction in self.seen_instructions:
+                    cached_tokens = self.system_tokens
+                else:
+                    self.seen_instructions.add(self.system_instruction)
+        return estimate_tokens(prompt) + self.system_tokens, cached_tokens
+
+    def _sample(self):
+        """(지연 시간(초), 주입할 오류 또는 None) 추첨"""
+        if self.invalid_key:
+            return 0.0, "auth"
+        kind, params = self.config.latency
+        with self.rng_lock:
+            if kind == "fixed":
+                latency_ms = params[0]
+            elif kind == "uniform":
+                latency_ms = self.rng.uniform(*params)
+            elif kind == "normal":
+                latency_ms = self.rng.gauss(*params)
+            else:
+                latency_ms = params[0] * self.rng.lognormvariate(0, params[1])
+
+            error = None
+            roll = self.rng.random()
+            for name, rate in self.config.errors.items():
+                if roll < rate:
+                    error = name
+                    break
+                roll -= rate
+        return max(0.0, latency_ms) / 1000, error
+
+    def _raise(self, error):
+        if error == "auth":
+            raise FakeAuthError("400 API key not valid. Please pass a valid API key.")
+        if error == "429":
+            retry = self.config.timeout / 5
+            raise FakeRateLimitError(f"429 Resource has been exhausted. Please retry in {retry:.1f}s.")
+        if error == "timeout":
+            time.sleep(self.config.timeout)
+            raise FakeTimeoutError("504 Deadline Exceeded")
+        raise FakeLLMError(f"{error} Internal error")
+
+    def _text(self, prompt, generation_config):
+        """프롬프트 해시로 정해지는 응답 텍스트"""
+        digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+        words = [_WORDS[b % len(_WORDS)] for b in digest]
+
+        if generation_config and generation_config.get("response_mime_type") == "application/json":
+            sections_match = _SECTIONS_PATTERN.search(prompt)
+            if sections_match:
+                return json.dumps(
+                    {
+                        "sections": [
+                            {
+                                "heading": f"{words[i]} {words[i + 8]} {i + 1}",
+                                "points": [words[i + 16], words[i + 24]],
+                            }
+                            for i in range(min(8, int(sections_match.group(1))))
+                        ]
+                    },
+                    ensure_ascii=False,
+                )
+            match = _KEYWORDS_PATTERN.search(prompt)
+            keywords = json.loads(f"[{match.group(1)}]") if match else []
+            count_match = _COUNT_PATTERN.search(prompt)
+            count = int(count_match.group(1)) if count_match else 5
+            return json.dumps(
+                [
+                    {
+                        "keyword": keyword,
+                        "titles": [
+                            f"{keyword} {words[i]} {words[i + 1]} {i + 1}편" for i in range(count)
+                        ],
+                    }
+                    for keyword in keywords
+                ],
+                ensure_ascii=False,
+            )
+
+        count_match = _COUNT_PATTERN.search(prompt)
+        if count_match:
+            count = int(count_match.group(1))
+            return "\n".join(
+                f"{i + 1}. {words[i % 32]} {words[(i + 7) % 32]} {words[(i + 13) % 32]} {i + 1}"
+                for i in range(count)
+            )
+
+        length_match = _LENGTH_PATTERN.search(prompt)
+        content_chars = int(length_match.group(1)) if length_match else self.config.content_chars
+        paragraphs = []
+        length = 0
+        index = 0
+        while length < content_chars:
+            word = words[index % 32]
+            paragraph = f"## {word} {index + 1}\n\n" + " ".join(
+                words[(index + j) % 32] for j in range(40)
+            ) + "."
+            paragraphs.append(paragraph)
+            length += len(paragraph)
+            index += 1
+        return "\n\n".join(paragraphs)[:content_chars]
+
+    def _output_latency(self, text):
+        """출력 길이에 비례하는 생성 시간 (FAKE_LLM_OUTPUT_RATE가 0이면 0)"""
+        if self.config.output_rate <= 0:
+            return 0.0
+        return len(text) / self.config.output_rate
+
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        latency, error = self._sample()
+        text = self._text(prompt, generation_config)
+        latency += self._output_latency(text)
+        prompt_tokens, cached_tokens = self._prompt_usage(prompt)
+
+        if not stream:
+            time.sleep(latency)
+            if error:
+                self._raise(error)
+            return FakeResponse(text, _Usage(prompt_tokens, estimate_tokens(text), cached_tokens))
+        return self._stream(text, latency, error, prompt_tokens, cached_tokens)
+
+    def _pieces(self, text):
+        """응답 텍스트를 stream_chunks개 조각으로 나눔"""
+        size = max(1, -(-len(text) // self.config.stream_chunks))
+        return [text[i : i + size] for i in range(0, len(text), size)] or [""]
+
+    def _stream(self, text, latency, error, prompt_tokens, cached_tokens):
+        """지연 시간을 조각 수로 나누어 차례로 반환 (429/인증 오류는 첫 조각 전, 그 외 오류는 절반쯤에서 발생)"""
+        pieces = self._pieces(text)
+        for index, piece in enumerate(pieces):
+            time.sleep(latency / len(pieces))
+            if error and (error in ("429", "auth") or index >= len(pieces) // 2):
+                self._raise(error)
+            usage = (
+                _Usage(prompt_tokens, estimate_tokens(text), cached_tokens)
+                if index == len(pieces) - 1
+                else None
+            )
+            yield FakeResponse(piece, usage)
+
+    async def generate_content_async(self, prompt, generation_config=None, stream=False):
+        """generate_content의 코루틴 버전 - 지연 시간 동안 이벤트 루프를 막지 않음"""
+        latency, error = self._sample()
+        text = self._text(prompt, generation_config)
+        latency += self._output_latency(text)
+        prompt_tokens, cached_tokens = self._prompt_usage(prompt)
+
+        if not stream:
+            await asyncio.sleep(latency)
+            if error:
+                await self._raise_async(error)
+            return FakeResponse(text, _Usage(prompt_tokens, estimate_tokens(text), cached_tokens))
+        return self._stream_async(text, latency, error, prompt_tokens, cached_tokens)
+
+    async def _raise_async(self, error):
+        if error == "timeout":
+            await asyncio.sleep(self.config.timeout)
+            raise FakeTimeoutError("504 Deadline Exceeded")
+        self._raise(error)
+
+    async def _stream_async(self, text, latency, error, prompt_tokens, cached_tokens):
+        pieces = self._pieces(text)
+        for index, piece in enumerate(pieces):
+            await asyncio.sleep(latency / len(pieces))
+            if error and (error in ("429", "auth") or index >= len(pieces) // 2):
+                await self._raise_async(error)
+            usage = (
+                _Usage(prompt_tokens, estimate_tokens(text), cached_tokens)
+                if index == len(pieces) - 1
+                else None
+            )
+            yield FakeResponse(piece, usage)
+
+    def count_tokens(self, text):
+        return _TokenCount(estimate_tokens(text))
@@ -0,0 +1,199 @@
+"""
+    로컬 가짜 네이버 검색 서버 모듈
+
+    네이버 블로그 검색 API와 같은 형식(JSON: total, start, display, items)으로 응답하는
+    로컬 HTTP 서버입니다. 성능 측정 시 NAVER_SEARCH_URL을 이 서버 주소로 지정하면
+    실제 HTTP 클라이언트, 호출 제한기, 캐시, 페이지네이션 코드를 그대로 거치며 검색합니다.
+    검색 결과는 (키워드, 정렬, start) 해시로 정해지고, 지연 시간 분포와 오류(429/500) 비율은
+    core.fake_llm과 같은 형식으로 설정합니다.
+
+    측정 대상 프로세스의 GIL과 메모리를 나눠 쓰지 않도록 별도 프로세스로 실행할 수 있습니다:
+        python -m core.fake_naver --latency lognormal:120,0.4 --errors 429:0.02
+    시작하면 검색 주소 한 줄을 출력하고, GET /stats는 요청/주입 오류 수를 반환합니다.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from core.fake_llm import parse_error_spec, parse_latency_spec
+
+SEARCH_PATH = "/v1/search/blog"
+STATS_PATH = "/stats"
+
+_WORDS = (
+    "맛집", "후기", "추천", "여행", "코스", "정리", "방법", "가격", "메뉴", "리뷰",
+    "분위기", "주차", "예약", "데이트", "가족", "혼밥", "신상", "웨이팅", "위치", "꿀팁",
+)
+
+
+def make_search_items(query, start, display, total, sort="sim"):
+    """(키워드, 정렬, start)로 정해지는 가짜 검색 결과 항목"""
+    items = []
+    today = date.today()
+    for position in range(start, min(start + display, total + 1)):
+        digest = hashlib.sha256(f"{query}|{sort}|{position}".encode("utf-8")).digest()
+        words = [_WORDS[b % len(_WORDS)] for b in digest[:8]]
+        # 최신순이면 뒤 페이지일수록 오래된 글
+        days_ago = position // 10 if sort == "date" else digest[8] % 365
+        items.append(
+            {
+                "title": f"<b>{query}</b> {' '.join(words[:4])} {position}",
+                "link": f"https://blog.naver.com/blogger{digest[9] % 500}/{223000000000 + position}",
+                "description": f"{' '.join(words)} &amp; <b>{query}</b> 이야기",
+                "bloggername": f"블로거{digest[9] % 500}",
+                "bloggerlink": f"blog.naver.com/blogger{digest[9] % 500}",
+                "postdate": (today - timedelta(days=days_ago)).strftime("%Y%m%d"),
+            }
+        )
+    return items
+
+
+class FakeNaverServer:
+    """가짜 네이버 검색 API 서버 - start()로 백그라운드 스레드에서 실행"""
+
+    def __init__(self, latency="fixed:0", errors="", total=1000, seed=0, host="127.0.0.1", port=0):
+        self.latency = parse_latency_spec(latency)
+        self.errors = parse_error_spec(errors)
+        self.total = total
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+        self.request_count = 0
+        self.error_count = 0
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{SEARCH_PATH}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.url
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _sample(self):
+        """(지연 시간(초), 주입할 상태 코드 또는 None) 추첨"""
+        kind, params = self.latency
+        with self.rng_lock:
+            self.request_count += 1
+            if kind == "fixed":
+                latency_ms = params[0]
+            elif kind == "uniform":
+                latency_ms = self.rng.uniform(*params)
+            elif kind == "normal":
+                latency_ms = self.rng.gauss(*params)
+            else:
+                latency_ms = params[0] * self.rng.lognormvariate(0, params[1])
+
+            status = None
+            roll = self.rng.random()
+            for name, rate in self.errors.items():
+                if roll < rate:
+                    status = int(name) if name.isdigit() else 500
+                    self.error_count += 1
+                    break
+                roll -= rate
+        return max(0.0, latency_ms) / 1000, status
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def send_json(self, status, payload, headers=None):
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                if parts.path == STATS_PATH:
+                    self.send_json(
+                        200, {"requests": server.request_count, "injected_errors": server.error_count}
+                    )
+                    return
+                if parts.path != SEARCH_PATH:
+                    self.send_json(404, {"errorMessage": "Not Found", "errorCode": "404"})
+                    return
+                if not self.headers.get("X-Naver-Client-Id") or not self.headers.get(
+                    "X-Naver-Client-Secret"
+                ):
+                    self.send_json(401, {"errorMessage": "Authentication failed", "errorCode": "024"})
+                    return
+
+                latency, status = server._sample()
+                time.sleep(latency)
+                if status is not None:
+                    headers = {"Retry-After": "0.2"} if status == 429 else None
+                    self.send_json(status, {"errorMessage": "injected", "errorCode": str(status)}, headers)
+                    return
+
+                params = parse_qs(parts.query)
+                query = params.get("query", [""])[0]
+                start = int(params.get("start", ["1"])[0])
+                display = int(params.get("display", ["10"])[0])
+                sort = params.get("sort", ["sim"])[0]
+                self.send_json(
+                    200,
+                    {
+                        "lastBuildDate": time.strftime("%a, %d %b %Y %H:%M:%S +0900"),
+                        "total": server.total,
+                        "start": start,
+                        "display": display,
+                        "items": make_search_items(query, start, display, server.total, sort),
+                    },
+                )
+
+        return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="가짜 네이버 블로그 검색 API 서버")
+    parser.add_argument("--latency", default="fixed:0", help="지연 시간 분포 (ms)")
+    parser.add_argument("--errors", default="", help="오류 비율 (예: 429:0.02,500:0.01)")
+    parser.add_argument("--total", type=int, default=1000, help="키워드당 전체 결과 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--port", type=int, default=0, help="포트 (기본: 빈 포트 자동 선택)")
+    args = parser.parse_args(argv)
+
+    server = FakeNaverServer(args.latency, args.errors, args.total, args.seed, port=args.port)
+    print(server.url, flush=True)
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""
+    Gemini 모델 풀 모듈
+
+    API 키마다 전용 GenerativeServiceClient를 만들어 재사용하므로
+    전역 상태를 바꾸는 genai.configure()를 호출하지 않고, 연결(채널)도 계속 재사용됩니다.
+    genai.GenerativeModel은 요청 클라이언트를 공개 인자로 받지 않으므로, 모델(GeminiModel)은
+    generativelanguage의 공개 요청 타입으로 요청을 만들어 키 전용 클라이언트로 보내고
+    응답만 SDK의 GenerateContentResponse로 감싸 text/usage_metadata를 같은 방식으로 사용합니다.
+    (API 키, 모델명, 시스템 지침)별 모델은 최근 사용한 MAX_MODELS개까지만 보관합니다 (LRU).
+    일괄 생성에서 공유하는 긴 지침은 create_context_cache로 컨텍스트 캐시에 한 번만 등록합니다.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+from google.ai import generativelanguage as glm
+from google.api_core.client_options import ClientOptions
+from google.generativeai.types import AsyncGenerateContentResponse, GenerateContentResponse
+from core.llm_provider import shared_prefix_key
+
+# 보관할 모델 수 - 일괄 생성마다 지침이 달라도 모델이 계속 쌓이지 않도록 제한
+MAX_MODELS = 64
+
+_SCHEMA_FIELDS = ("format", "description", "nullable", "enum", "required")
+
+
+def _schema(schema):
+    """JSON 스키마 형태의 dict를 Schema로 변환 (type은 대문자 열거형)"""
+    params = {"type_": glm.Type[schema["type"].upper()]}
+    if "properties" in schema:
+        params["properties"] = {
+            name: _schema(value) for name, value in schema["properties"].items()
+        }
+    if "items" in schema:
+        params["items"] = _schema(schema["items"])
+    params.update((field, schema[field]) for field in _SCHEMA_FIELDS if field in schema)
+    return glm.Schema(**params)
+
+
+def _generation_config(generation_config):
+    """generation_config dict를 GenerationConfig로 변환"""
+    config = dict(generation_config)
+    if isinstance(config.get("response_schema"), dict):
+        config["response_schema"] = _schema(config["response_schema"])
+    return glm.GenerationConfig(**config)
+
+
+def _user_content(text):
+    return glm.Content(role="user", parts=[glm.Part(text=text)])
+
+
+class GeminiModel:
+    """
+    API 키 전용 클라이언트로 요청하는 Gemini 모델
+    core.llm_provider의 모델 인터페이스(generate_content, generate_content_async, count_tokens) 제공
+    cached_content가 있으면 지침 대신 컨텍스트 캐시 이름만 보냅니다.
+    """
+
+    def __init__(self, pool, api_key, model_name, system_instruction=None, cached_content=None):
+        self.pool = pool
+        self.api_key = api_key
+        self.model_name = model_name if "/" in model_name else f"models/{model_name}"
+        self.system_instruction = system_instruction
+        self.cached_content = cached_content
+        self.cache_prefix = shared_prefix_key(system_instruction)
+
+    def _request(self, prompt, generation_config=None):
+        params = {"model": self.model_name, "contents": [_user_content(prompt)]}
+        if self.cached_content:
+            params["cached_content"] = self.cached_content
+        elif self.system_instruction:
+            params["system_instruction"] = glm.Content(
+                parts=[glm.Part(text=self.system_instruction)]
+            )
+        if generation_config:
+            params["generation_config"] = _generation_config(generation_config)
+        return glm.GenerateContentRequest(**params)
+
+    def generate_content(self, prompt, generation_config=None, stream=False):
+        client = self.pool.client(self.api_key)
+        request = self._request(prompt, generation_config)
+        if stream:
+            return GenerateContentResponse.from_iterator(client.stream_generate_content(request))
+        return GenerateContentResponse.from_response(client.generate_content(request))
+
+    async def generate_content_async(self, prompt, generation_config=None, stream=False):
+        # 비동기 클라이언트는 이벤트 루프에 묶이므로 루프 안에서 처음 호출할 때 생성
+        client = self.pool.async_client(self.api_key)
+        request = self._request(prompt, generation_config)
+        if stream:
+            return await AsyncGenerateContentResponse.from_aiterator(
+                await client.stream_generate_content(request)
+            )
+        return AsyncGenerateContentResponse.from_response(await client.generate_content(request))
+
+    def count_tokens(self, text):
+        return self.pool.client(self.api_key).count_tokens(
+            glm.CountTokensRequest(model=self.model_name, contents=[_user_content(text)])
+        )
+
+
+class GeminiModelPool:
+    """스레드 안전 Gemini 클라이언트/모델 레지스트리"""
+
+    def __init__(self, max_models=MAX_MODELS):
+        self.max_models = max_models
+        self.clients = {}
+        self.async_clients = {}
+        self.cache_clients = {}
+        self.models = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _client(self, clients, client_class, api_key):
+        with self.lock:
+            client = clients.get(api_key)
+            if client is None:
+                client = clients[api_key] = client_class(
+                    client_options=ClientOptions(api_key=api_key)
+                )
+            return client
+
+    def client(self, api_key):
+        return self._client(self.clients, glm.GenerativeServiceClient, api_key)
+
+    def async_client(self, api_key):
+        return self._client(self.async_clients, glm.GenerativeServiceAsyncClient, api_key)
+
+    def cache_client(self, api_key):
+        return self._client(self.cache_clients, glm.CacheServiceClient, api_key)
+
+    def get_model(self, api_key, model_name, system_instruction=None):
+        """API 키 전용 클라이언트를 쓰는 모델 반환 (없으면 생성, 오래 쓰지 않은 모델부터 정리)"""
+        key = (api_key, model_name, system_instruction)
+        with self.lock:
+            model = self.models.get(key)
+            if model is None:
+                model = self.models[key] = GeminiModel(
+                    self, api_key, model_name, system_instruction
+                )
+                while len(self.models) > self.max_models:
+                    self.models.popitem(last=False)
+            else:
+                self.models.move_to_end(key)
+            return model
+
+    def create_context_cache(self, api_key, model_name, system_instruction, ttl_seconds):
+        """지침을 컨텍스트 캐시로 등록 - (캐시를 사용하는 모델, 캐시 이름) 반환"""
+        cached_content = self.cache_client(api_key).create_cached_content(
+            cached_content=glm.CachedContent(
+                model=f"models/{model_name}",
+                system_instruction=glm.Content(parts=[glm.Part(text=system_instruction)]),
+                ttl=timedelta(seconds=ttl_seconds),
+            )
+        )
+        # 요청마다 지침 대신 캐시 이름만 보냄 (응답 캐시 키는 지침 기준으로 구분)
+        model = GeminiModel(self, api_key, model_name, cached_content=cached_content.name)
+        model.cache_prefix = shared_prefix_key(system_instruction)
+        return model, cached_content.name
+
+    def delete_context_cache(self, api_key, name):
+        self.cache_client(api_key).delete_cached_content(name=name)
+
+    def clear(self):
+        """보관 중인 모델과 클라이언트 해제"""
+        with self.lock:
+            self.models.clear()
+            self.clients.clear()
+            self.async_clients.clear()
+            self.cache_clients.clear()
+
+
+_model_pool = GeminiModelPool()
+
+
+def get_gemini_model(api_key, model_name, system_instruction=None):
+    """프로그램 전체에서 공유하는 모델 풀에서 모델 반환"""
+    return _model_pool.get_model(api_key, model_name, system_instruction)
+
+
+def create_context_cache(api_key, model_name, system_instruction, ttl_seconds):
+    """공유 지침 컨텍스트 캐시 생성 - (모델, 캐시 이름)"""
+    return _model_pool.create_context_cache(api_key, model_name, system_instruction, ttl_seconds)
+
+
+def delete_context_cache(api_key, name):
+    """컨텍스트 캐시 삭제"""
+    _model_pool.delete_context_cache(api_key, name)
@@ -0,0 +1,192 @@
+"""
+    공용 HTTP 클라이언트 모듈
+
+    모든 외부 HTTP 요청이 하나의 requests.Session을 공유하여
+    연결 재사용(keep-alive)과 호스트별 연결 풀 제한을 적용합니다.
+    연결/읽기 타임아웃, 429/5xx 응답에 대한 지수 백오프 재시도,
+    엔드포인트별 응답 시간 히스토그램을 함께 제공합니다.
+"""
+
+import random
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 응답 시간 히스토그램 구간 (밀리초)
+LATENCY_BUCKETS_MS = [50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000]
+
+
+class LatencyHistogram:
+    """엔드포인트 하나의 응답 시간 분포"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS, max_samples=2000):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.samples = deque(maxlen=max_samples)
+        self.total = 0
+        self.lock = threading.Lock()
+
+    def record(self, elapsed_ms):
+        with self.lock:
+            self.counts[bisect_left(self.buckets, elapsed_ms)] += 1
+            self.samples.append(elapsed_ms)
+            self.total += 1
+
+    def percentile(self, p):
+        """최근 샘플 기준 백분위 응답 시간 (밀리초)"""
+        with self.lock:
+            samples = sorted(self.samples)
+        if not samples:
+            return 0.0
+        index = min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def snapshot(self):
+        with self.lock:
+            counts = list(self.counts)
+            total = self.total
+        labels = [f"<={b}ms" for b in self.buckets] + [f">{self.buckets[-1]}ms"]
+        return {
+            "count": total,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "histogram": dict(zip(labels, counts)),
+        }
+
+
+def _retry_after_seconds(response):
+    """Retry-After 헤더를 초 단위로 변환 (없으면 None)"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpClient:
+    """연결 풀과 재시도를 갖춘 스레드 안전 HTTP 클라이언트"""
+
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=10,
+        connect_timeout=5,
+        read_timeout=30,
+        max_retries=3,
+        backoff_base=0.5,
+        backoff_max=20,
+    ):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.latencies = {}
+        self.latencies_lock = threading.Lock()
+
+        # pool_maxsize는 호스트 하나당 유지할 최대 연결 수
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def backoff_delay(self, attempt):
+        """지수 백오프 대기 시간 (full jitter)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def record_latency(self, endpoint, elapsed_ms):
+        with self.latencies_lock:
+            histogram = self.latencies.get(endpoint)
+            if histogram is None:
+                histogram = self.latencies[endpoint] = LatencyHistogram()
+        histogram.record(elapsed_ms)
+
+    def request(self, method, url, endpoint=None, limiter=None, **kwargs):
+        """
+        HTTP 요청 - 429/5xx 응답과 연결 오류는 백오프 후 재시도
+        limiter가 주어지면 재시도를 포함한 매 시도 전에 limiter.acquire()를 호출합니다.
+        재시도 후에도 실패한 응답은 그대로 반환하고, 연결 오류는 예외로 전달합니다.
+        """
+        if endpoint is None:
+            parts = urlsplit(url)
+            endpoint = f"{parts.netloc}{parts.path}"
+        kwargs.setdefault("timeout", self.timeout)
+
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+
+            started = time.monotonic()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self.record_latency(endpoint, (time.monotonic() - started) * 1000)
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(self.backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            self.record_latency(endpoint, (time.monotonic() - started) * 1000)
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= self.max_retries:
+                return response
+
+            delay = _retry_after_seconds(response)
+            if delay is None:
+                delay = self.backoff_delay(attempt)
+            response.close()
+            time.sleep(min(delay, self.backoff_max))
+            attempt += 1
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def latency_stats(self):
+        """엔드포인트별 응답 시간 통계"""
+        with self.latencies_lock:
+            histograms = dict(self.latencies)
+        return {endpoint: h.snapshot() for endpoint, h in histograms.items()}
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client():
+    """프로그램 전체에서 공유하는 HTTP 클라이언트 반환"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HttpClient()
+        return _http_client
+
+
+def format_latency_stats(stats):
+    """응답 시간 통계를 표시용 문자열로 변환"""
+    lines = []
+    for endpoint, s in sorted(stats.items()):
+        lines.append(
+            f"{endpoint}: {s['count']}회, p50 {s['p50']:.0f}ms / p95 {s['p95']:.0f}ms / p99 {s['p99']:.0f}ms"
+        )
+    return "\n".join(lines) or "HTTP 요청 기록 없음"
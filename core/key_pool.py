@@ -0,0 +1,71 @@
+"""
+    API 키 풀 모듈
+
+    .env의 GEMINI_API_KEYS(쉼표/줄바꿈 구분)와 GEMINI_API_KEY, 또는 GUI 입력란의 여러 키를
+    하나의 키 풀로 묶습니다. 키가 하나면 기존처럼 문자열을, 여러 개면 ApiKeyPool을 반환하며
+    요청마다 사용할 키는 Gemini 제한기(core.rate_limiter)가 키별 상태를 보고 고릅니다.
+"""
+
+import os
+import re
+
+_KEY_SEPARATOR = re.compile(r"[\s,;]+")
+
+
+class NoUsableKeyError(Exception):
+    """풀의 모든 키가 인증 오류로 사용 중지됨"""
+
+
+class ApiKeyPool:
+    """요청을 나누어 보낼 API 키 목록 (중복 제거, 순서 유지)"""
+
+    def __init__(self, keys):
+        self.keys = list(dict.fromkeys(key.strip() for key in keys if key and key.strip()))
+        if not self.keys:
+            raise ValueError("API 키가 없습니다.")
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def __repr__(self):
+        return f"ApiKeyPool({', '.join('…' + key[-4:] for key in self.keys)})"
+
+
+def parse_api_keys(text):
+    """쉼표/공백/줄바꿈으로 구분한 키 목록 (#으로 시작하는 줄은 주석)"""
+    keys = []
+    for line in (text or "").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            keys.extend(key for key in _KEY_SEPARATOR.split(line) if key)
+    return keys
+
+
+def env_api_keys():
+    """.env의 GEMINI_API_KEYS와 GEMINI_API_KEY에 지정된 키 목록"""
+    keys = parse_api_keys(os.getenv("GEMINI_API_KEYS", ""))
+    keys.extend(parse_api_keys(os.getenv("GEMINI_API_KEY", "")))
+    return list(dict.fromkeys(keys))
+
+
+def resolve_api_keys(input_text=""):
+    """
+    사용할 Gemini API 키 - 환경변수를 먼저, 없으면 입력란의 키를 사용
+    키가 없으면 None, 하나면 문자열, 여러 개면 ApiKeyPool 반환
+    """
+    keys = env_api_keys() or list(dict.fromkeys(parse_api_keys(input_text)))
+    if not keys:
+        return None
+    if len(keys) == 1:
+        return keys[0]
+    return ApiKeyPool(keys)
+
+
+def pool_keys(api_key):
+    """키 하나 또는 키 풀을 키 목록으로 변환"""
+    if isinstance(api_key, ApiKeyPool):
+        return api_key.keys
+    return [api_key]
@@ -0,0 +1,230 @@
+"""
+    LLM 제공자 모듈
+
+    제목/글 생성 코드는 get_llm_model(api_key, model_name)로 모델을 얻고
+    generate_content(prompt, generation_config=None, stream=False)와 count_tokens(text)만 사용합니다.
+    사용할 제공자는 .env의 LLM_PROVIDER로 고르며(gemini 기본, fake는 로컬 가짜 모델),
+    register_provider로 다른 제공자를 추가할 수 있습니다.
+
+    일괄 생성처럼 같은 지침을 여러 요청이 공유할 때는 open_shared_context로 지침을 한 번 등록하고
+    요청마다 달라지는 부분만 보냅니다. Gemini는 지침이 충분히 길면 컨텍스트 캐시를 만들고,
+    아니면 시스템 지침으로 등록합니다 (서버의 접두사 캐시가 적중하면 캐시 토큰으로 과금).
+
+    api_key 자리에 키 풀(core.key_pool.ApiKeyPool)을 넘기면 키별 모델을 묶은 PooledModel을 반환하며,
+    요청마다 어느 키의 모델로 보낼지는 응답 캐시 호출 시 Gemini 제한기가 정합니다.
+"""
+
+import hashlib
+import os
+import random
+import threading
+from core.key_pool import ApiKeyPool
+
+DEFAULT_PROVIDER = "gemini"
+
+# 컨텍스트 캐시를 만들 최소 토큰 수 - 이보다 짧은 지침은 API가 캐시를 거부하므로 시스템 지침 사용
+DEFAULT_CONTEXT_CACHE_MIN_TOKENS = 4096
+DEFAULT_CONTEXT_CACHE_TTL = 3600
+
+SHARED_MODE_CONTEXT_CACHE = "context_cache"
+SHARED_MODE_SYSTEM_INSTRUCTION = "system_instruction"
+
+
+def shared_prefix_key(system_instruction):
+    """응답 캐시 키 구분용 - 같은 요청이라도 등록된 지침이 다르면 다른 응답"""
+    if not system_instruction:
+        return ""
+    return f"sys:{hashlib.sha256(system_instruction.encode('utf-8')).hexdigest()[:16]}:"
+
+
+class SharedContext:
+    """여러 요청이 공유하는 지침 - model은 지침이 등록된 모델"""
+
+    def __init__(self, model, mode, shared_tokens, on_close=None):
+        self.model = model
+        self.mode = mode
+        self.shared_tokens = shared_tokens
+        self.on_close = on_close
+
+    def close(self):
+        """컨텍스트 캐시 삭제 - 실패해도 TTL이 지나면 서버에서 삭제됨"""
+        if self.on_close:
+            try:
+                self.on_close()
+            except Exception:
+                pass
+            self.on_close = None
+
+
+class PooledModel:
+    """키 풀의 키별 모델 묶음 - for_key(키)로 해당 키의 모델 반환"""
+
+    def __init__(self, pool, model_for_key):
+        self.pool = pool
+        self.model_for_key = model_for_key
+        # 같은 제공자/지침이면 키가 달라도 응답이 같으므로 첫 키 모델의 캐시 구분값 사용
+        self.cache_prefix = getattr(self.for_key(None), "cache_prefix", "")
+
+    def for_key(self, api_key):
+        return self.model_for_key(api_key or self.pool.keys[0])
+
+    def count_tokens(self, text):
+        return self.for_key(None).count_tokens(text)
+
+
+class LLMProvider:
+    """LLM 제공자 기본 클래스"""
+
+    name = ""
+
+    def get_model(self, api_key, model_name, system_instruction=None):
+        """generate_content/count_tokens를 제공하는 모델 객체 반환"""
+        raise NotImplementedError
+
+    def open_shared_context(self, api_key, model_name, shared_text):
+        """공유 지침을 시스템 지침으로 등록한 모델 반환"""
+        from core.prompt_builder import estimate_tokens
+
+        model = self.get_model(api_key, model_name, system_instruction=shared_text)
+        return SharedContext(model, SHARED_MODE_SYSTEM_INSTRUCTION, estimate_tokens(shared_text))
+
+
+class GeminiProvider(LLMProvider):
+    """Google Gemini - API 키별 모델 풀 사용"""
+
+    name = "gemini"
+
+    def get_model(self, api_key, model_name, system_instruction=None):
+        # google.generativeai는 실제로 사용할 때만 불러옴
+        from core.gemini_pool import get_gemini_model
+
+        return get_gemini_model(api_key, model_name, system_instruction)
+
+    def open_shared_context(self, api_key, model_name, shared_text):
+        """지침이 충분히 길면 컨텍스트 캐시로 한 번만 등록 - 만들 수 없으면 시스템 지침 사용"""
+        from core.gemini_pool import create_context_cache, delete_context_cache
+        from core.prompt_builder import estimate_tokens
+
+        tokens = estimate_tokens(shared_text)
+        min_tokens = int(
+            os.getenv("GEMINI_CONTEXT_CACHE_MIN_TOKENS", DEFAULT_CONTEXT_CACHE_MIN_TOKENS)
+        )
+        if tokens >= min_tokens:
+            ttl = int(os.getenv("GEMINI_CONTEXT_CACHE_TTL", DEFAULT_CONTEXT_CACHE_TTL))
+            try:
+                model, cache_name = create_context_cache(api_key, model_name, shared_text, ttl)
+            except Exception:
+                # 캐시를 지원하지 않는 모델이거나 최소 토큰 수 미달
+                pass
+            else:
+                return SharedContext(
+                    model,
+                    SHARED_MODE_CONTEXT_CACHE,
+                    tokens,
+                    on_close=lambda: delete_context_cache(api_key, cache_name),
+                )
+        return super().open_shared_context(api_key, model_name, shared_text)
+
+
+class FakeProvider(LLMProvider):
+    """로컬 가짜 모델 - 네트워크와 API 할당량을 사용하지 않음"""
+
+    name = "fake"
+
+    def __init__(self, config=None):
+        from core.fake_llm import FakeLLMConfig
+
+        self.config = config or FakeLLMConfig.from_env()
+        self.rng = random.Random(self.config.seed)
+        self.rng_lock = threading.Lock()
+        # 서버의 접두사 캐시 흉내 - 한 번 보낸 시스템 지침은 이후 요청에서 캐시 토큰으로 보고
+        self.seen_instructions = set()
+        self.models = {}
+        self.lock = threading.Lock()
+
+    def get_model(self, api_key, model_name, system_instruction=None):
+        from core.fake_llm import FakeModel
+
+        key = (api_key, model_name, system_instruction)
+        with self.lock:
+            model = self.models.get(key)
+            if model is None:
+                model = self.models[key] = FakeModel(
+                    model_name,
+                    self.config,
+                    self.rng,
+                    self.rng_lock,
+                    system_instruction=system_instruction,
+                    seen_instructions=self.seen_instructions,
+                    api_key=api_key,
+                )
+            return model
+
+
+_provider_factories = {
+    GeminiProvider.name: GeminiProvider,
+    FakeProvider.name: FakeProvider,
+}
+_providers = {}
+_providers_lock = threading.Lock()
+
+
+def register_provider(name, factory):
+    """제공자 등록 - factory()는 LLMProvider 객체를 반환"""
+    with _providers_lock:
+        _provider_factories[name] = factory
+        _providers.pop(name, None)
+
+
+def get_provider(name=None):
+    """이름(기본: .env의 LLM_PROVIDER)에 해당하는 제공자 반환"""
+    name = (name or os.getenv("LLM_PROVIDER") or DEFAULT_PROVIDER).lower()
+    with _providers_lock:
+        provider = _providers.get(name)
+        if provider is None:
+            factory = _provider_factories.get(name)
+            if factory is None:
+                raise ValueError(f"알 수 없는 LLM 제공자입니다: {name}")
+            provider = _providers[name] = factory()
+        return provider
+
+
+def get_llm_model(api_key, model_name, system_instruction=None):
+    """현재 제공자의 모델 반환 (api_key가 키 풀이면 PooledModel)"""
+    provider = get_provider()
+    if isinstance(api_key, ApiKeyPool):
+        return PooledModel(
+            api_key, lambda key: provider.get_model(key, model_name, system_instruction)
+        )
+    return provider.get_model(api_key, model_name, system_instruction)
+
+
+def open_shared_context(api_key, model_name, shared_text):
+    """
+    현재 제공자에 공유 지침 등록 - 사용 후 close() 호출
+    키 풀이면 키마다 등록하고 (컨텍스트 캐시는 키의 프로젝트별로 만들어짐) 한 번에 닫습니다.
+    """
+    provider = get_provider()
+    if not isinstance(api_key, ApiKeyPool):
+        return provider.open_shared_context(api_key, model_name, shared_text)
+
+    contexts = {}
+    try:
+        for key in api_key:
+            contexts[key] = provider.open_shared_context(key, model_name, shared_text)
+    except Exception:
+        for context in contexts.values():
+            context.close()
+        raise
+
+    def close_all():
+        for context in contexts.values():
+            context.close()
+
+    first = contexts[api_key.keys[0]]
+    return SharedContext(
+        PooledModel(api_key, lambda key: contexts[key].model),
+        first.mode,
+        first.shared_tokens,
+        on_close=close_all,
+    )
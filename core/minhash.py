@@ -0,0 +1,110 @@
+"""
+    MinHash 유사 문서 탐지 모듈
+
+    문자 n-gram 집합의 자카드 유사도를 MinHash 서명으로 추정합니다.
+    서명은 해시 한 번으로 모든 구간을 채우는 one-permutation 방식으로 계산하여
+    문서 길이에 비례하는 비용만 듭니다. 빈 구간은 오른쪽 구간 값을 빌려 채웁니다(densification).
+    LSHIndex는 서명을 band 단위로 버킷에 나누어 유사 후보만 빠르게 찾습니다 (글 하나당 조회 비용 상한 있음).
+    해시는 zlib.crc32를 사용하므로 서명은 실행이 바뀌어도 동일합니다.
+"""
+
+import zlib
+from collections import Counter
+from itertools import chain
+from operator import eq
+
+DEFAULT_NUM_BINS = 128
+_EMPTY = 1 << 40
+_DENSIFY_OFFSET = 1 << 32
+
+
+def char_shingles(text, k=3):
+    """
+    공백을 정리한 소문자 텍스트의 문자 k-gram 집합
+    글자마다 인코딩하지 않도록 UTF-32 바이트열을 4바이트 단위로 잘라 사용합니다.
+    """
+    text = " ".join(text.lower().split())
+    if not text:
+        return set()
+    data = text.encode("utf-32-le")
+    width = 4 * k
+    if len(data) <= width:
+        return {data}
+    return {data[i : i + width] for i in range(0, len(data) - width + 4, 4)}
+
+
+class MinHasher:
+    """one-permutation MinHash 서명 생성기"""
+
+    def __init__(self, num_bins=DEFAULT_NUM_BINS):
+        self.num_bins = num_bins
+
+    def signature(self, shingles):
+        """shingle(bytes) 집합의 서명 (길이 num_bins 튜플)"""
+        n = self.num_bins
+        # 내림차순으로 덮어쓰면 구간마다 최솟값만 남음
+        hashes = sorted(map(zlib.crc32, shingles), reverse=True)
+        bins = {h % n: h // n for h in hashes}
+        if not bins:
+            return (_EMPTY,) * n
+
+        signature = list(map(bins.get, range(n)))
+        if len(bins) < n:
+            # 빈 구간은 오른쪽에서 가장 가까운 값으로 채움 (거리만큼 오프셋)
+            for i in range(n):
+                if signature[i] is None:
+                    distance = 1
+                    while (i + distance) % n not in bins:
+                        distance += 1
+                    signature[i] = bins[(i + distance) % n] + distance * _DENSIFY_OFFSET
+        return tuple(signature)
+
+    def text_signature(self, text, k=3):
+        return self.signature(char_shingles(text, k))
+
+
+def similarity(sig1, sig2):
+    """두 서명의 추정 자카드 유사도"""
+    if not sig1 or len(sig1) != len(sig2):
+        return 0.0
+    return sum(map(eq, sig1, sig2)) / len(sig1)
+
+
+class LSHIndex:
+    """
+    MinHash 서명 LSH 버킷 색인 (bands * rows = 서명 길이)
+    어휘가 좁은 글들은 여러 버킷을 통째로 공유하므로 후보가 전체 글 수에 가깝게 커질 수 있습니다.
+    candidates는 버킷마다 최근 max_bucket개만 보고, min_bands개 이상 band가 겹친 키만
+    겹친 수가 많은 순으로 최대 max_candidates개까지 돌려주어 조회 비용을 일정하게 유지합니다.
+    """
+
+    def __init__(self, bands=16, rows=8, min_bands=2, max_bucket=64, max_candidates=32):
+        self.bands = bands
+        self.rows = rows
+        self.min_bands = min_bands
+        self.max_bucket = max_bucket
+        self.max_candidates = max_candidates
+        self.buckets = [{} for _ in range(bands)]
+
+    def band_keys(self, signature):
+        r = self.rows
+        return [tuple(signature[i * r : (i + 1) * r]) for i in range(self.bands)]
+
+    def add(self, key, signature):
+        for band, band_key in zip(self.buckets, self.band_keys(signature)):
+            band.setdefault(band_key, []).append(key)
+
+    def candidates(self, signature):
+        """min_bands개 이상 버킷을 공유하는 키 목록 (겹친 band 수가 많은 순)"""
+        counts = Counter(
+            chain.from_iterable(
+                band[band_key][-self.max_bucket :]
+                for band, band_key in zip(self.buckets, self.band_keys(signature))
+                if band_key in band
+            )
+        )
+        return [
+            key
+            for key, count in counts.most_common(self.max_candidates)
+            if count >= self.min_bands
+        ]
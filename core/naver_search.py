@@ -0,0 +1,314 @@
+"""
+    네이버 블로그 검색 모듈
+
+    네이버 검색 API 호출과 페이지네이션 로직을 담당합니다.
+    Qt 의존성이 없으므로 워커와 다른 모듈에서 공통으로 사용할 수 있습니다.
+    _async로 끝나는 함수는 공용 asyncio 루프(core.async_engine)에서 실행하는 코루틴 버전입니다.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from core.http_client import get_http_client
+from core.normalizer import canonicalize_link, clean_text
+from core.rate_limiter import ApiRateLimiter
+from core.search_cache import get_search_cache
+
+NAVER_BLOG_SEARCH_URL = "https://openapi.naver.com/v1/search/blog"
+
+# 네이버 검색 API 제한값
+MAX_DISPLAY = 100  # 한 번에 가져올 수 있는 최대 결과 수
+MAX_START = 1000  # start 파라미터 최대값
+MAX_RESULTS = 1000  # 페이지네이션으로 가져올 수 있는 최대 결과 수
+
+# 네이버 검색 API 호출 한도 (애플리케이션 단위)
+REQUESTS_PER_SECOND = 10
+REQUESTS_PER_DAY = 25000
+
+# 모든 검색 요청이 공유하는 호출 제한기
+rate_limiter = ApiRateLimiter(REQUESTS_PER_SECOND, REQUESTS_PER_DAY, name="naver/blog")
+
+
+class NaverSearchError(Exception):
+    """네이버 검색 API 오류"""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def parse_blog_item(item):
+    """API 응답 항목을 블로그 글 딕셔너리로 변환"""
+    return {
+        "title": clean_text(item.get("title", "")),
+        "description": clean_text(item.get("description", "")),
+        "link": canonicalize_link(item.get("link", "")),
+        "bloggername": clean_text(item.get("bloggername", "")),
+        "postdate": item.get("postdate", ""),
+    }
+
+
+def _search_request(keyword, client_id, client_secret, start, display, sort):
+    """검색 요청 인자 (url, headers, params, endpoint, limiter)"""
+    return {
+        # NAVER_SEARCH_URL로 로컬 가짜 서버 등 다른 주소를 사용할 수 있음 (성능 측정용)
+        "url": os.getenv("NAVER_SEARCH_URL") or NAVER_BLOG_SEARCH_URL,
+        "headers": {
+            "X-Naver-Client-Id": client_id,
+            "X-Naver-Client-Secret": client_secret,
+        },
+        "params": {"query": keyword, "display": str(display), "start": str(start), "sort": sort},
+        "endpoint": "naver/blog",
+        "limiter": rate_limiter,
+    }
+
+
+def _parse_search_response(response):
+    """검색 응답을 (블로그 글 목록, 전체 결과 수)로 변환"""
+    if response.status_code != 200:
+        raise NaverSearchError(
+            f"네이버 API 오류: {response.status_code}", response.status_code
+        )
+
+    data = response.json()
+    blog_posts = [parse_blog_item(item) for item in data.get("items", [])]
+    return blog_posts, data.get("total", 0)
+
+
+def _cached_page(keyword, sort, start, display):
+    return get_search_cache().get(keyword, sort, start, display)
+
+
+def _store_page(keyword, sort, start, display, blog_posts, total):
+    get_search_cache().put(keyword, sort, start, display, blog_posts, total)
+
+
+def search_blog_page(
+    keyword, client_id, client_secret, start=1, display=20, sort="sim", use_cache=True
+):
+    """검색 결과 한 페이지 요청 - (블로그 글 목록, 전체 결과 수) 반환"""
+    if use_cache:
+        cached = _cached_page(keyword, sort, start, display)
+        if cached is not None:
+            return cached
+
+    response = get_http_client().get(
+        **_search_request(keyword, client_id, client_secret, start, display, sort)
+    )
+    blog_posts, total = _parse_search_response(response)
+
+    if use_cache:
+        _store_page(keyword, sort, start, display, blog_posts, total)
+    return blog_posts, total
+
+
+async def search_blog_page_async(
+    keyword, client_id, client_secret, start=1, display=20, sort="sim", use_cache=True
+):
+    """search_blog_page의 코루틴 버전 - 캐시(SQLite) 읽기/쓰기는 실행기 스레드에서 처리"""
+    from core.async_engine import get_async_http_client, run_blocking
+
+    if use_cache:
+        cached = await run_blocking(_cached_page, keyword, sort, start, display)
+        if cached is not None:
+            return cached
+
+    response = await get_async_http_client().get(
+        **_search_request(keyword, client_id, client_secret, start, display, sort)
+    )
+    blog_posts, total = _parse_search_response(response)
+
+    if use_cache:
+        await run_blocking(_store_page, keyword, sort, start, display, blog_posts, total)
+    return blog_posts, total
+
+
+def page_starts(total, display=MAX_DISPLAY, max_results=MAX_RESULTS):
+    """전체 결과 수 기준으로 요청할 start 값 목록 계산"""
+    limit = min(total, max_results, MAX_RESULTS)
+    return [start for start in range(1, limit + 1, display) if start <= MAX_START]
+
+
+class _DeepSearchPages:
+    """딥 검색 페이지 모음 (동기/비동기 공통) - 도착한 페이지 전달과 순서대로 합치기"""
+
+    def __init__(self, display, max_results, on_page):
+        self.display = min(display, MAX_DISPLAY, max_results)
+        self.max_results = max_results
+        self.on_page = on_page
+        self.pages = {}
+
+    def add(self, start, blog_posts):
+        self.pages[start] = blog_posts
+        if self.on_page:
+            self.on_page(start, blog_posts)
+
+    def remaining(self, total):
+        """첫 페이지 이후 요청할 start 값 목록"""
+        return page_starts(total, self.display, self.max_results)[1:]
+
+    def merge(self):
+        """페이지 순서대로 합치기"""
+        results = []
+        for start in sorted(self.pages):
+            results.extend(self.pages[start])
+        return results[: self.max_results]
+
+
+def deep_search(
+    keyword,
+    client_id,
+    client_secret,
+    max_results=MAX_RESULTS,
+    display=MAX_DISPLAY,
+    sort="sim",
+    max_workers=4,
+    on_page=None,
+    use_cache=True,
+):
+    """
+    페이지네이션을 따라 최대 max_results개까지 검색
+    첫 페이지로 전체 결과 수를 확인한 뒤 나머지 페이지는 동시에 요청합니다.
+    on_page(start, blog_posts)는 페이지가 도착할 때마다 호출됩니다 (순서 보장 안 됨).
+    첫 페이지 이후 실패한 페이지는 건너뛰고 받은 페이지만 합쳐 반환합니다 (첫 페이지 실패는 예외).
+    """
+    pages = _DeepSearchPages(display, max_results, on_page)
+    first_page, total = search_blog_page(
+        keyword,
+        client_id,
+        client_secret,
+        start=1,
+        display=pages.display,
+        sort=sort,
+        use_cache=use_cache,
+    )
+    pages.add(1, first_page)
+
+    remaining = pages.remaining(total)
+    if remaining:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    search_blog_page,
+                    keyword,
+                    client_id,
+                    client_secret,
+                    start,
+                    pages.display,
+                    sort,
+                    use_cache,
+                ): start
+                for start in remaining
+            }
+            for future in as_completed(futures):
+                try:
+                    blog_posts, _ = future.result()
+                except Exception:
+                    continue
+                pages.add(futures[future], blog_posts)
+
+    return pages.merge()
+
+
+async def deep_search_async(
+    keyword,
+    client_id,
+    client_secret,
+    max_results=MAX_RESULTS,
+    display=MAX_DISPLAY,
+    sort="sim",
+    on_page=None,
+    use_cache=True,
+):
+    """deep_search의 코루틴 버전 - 나머지 페이지는 스레드 없이 동시에 요청 (실패한 페이지는 건너뜀)"""
+    pages = _DeepSearchPages(display, max_results, on_page)
+    first_page, total = await search_blog_page_async(
+        keyword, client_id, client_secret, 1, pages.display, sort, use_cache
+    )
+    pages.add(1, first_page)
+
+    async def fetch(start):
+        try:
+            blog_posts, _ = await search_blog_page_async(
+                keyword, client_id, client_secret, start, pages.display, sort, use_cache
+            )
+        except Exception:
+            return
+        pages.add(start, blog_posts)
+
+    remaining = pages.remaining(total)
+    if remaining:
+        await asyncio.gather(*(fetch(start) for start in remaining))
+    return pages.merge()
+
+
+def _unique_links(blog_posts):
+    """링크가 같은 글은 처음 나온 것만 남김"""
+    seen = set()
+    unique = []
+    for post in blog_posts:
+        if post["link"] not in seen:
+            seen.add(post["link"])
+            unique.append(post)
+    return unique
+
+
+def incremental_search(
+    keyword, client_id, client_secret, store, display=MAX_DISPLAY, max_results=MAX_RESULTS
+):
+    """
+    마지막 수집 이후의 새 글만 검색하여 store에 합치기
+    최신순(sort=date)으로 페이지를 넘기다가 워터마크보다 오래된 글을 만나면 멈춥니다.
+    처음 수집하는 키워드는 딥 검색으로 가져옵니다.
+    (새로 추가된 글 목록, 요청한 페이지 수) 반환
+    """
+    watermark = store.get_watermark(keyword)
+    if watermark is None:
+        fetched_pages = []
+        blog_posts = deep_search(
+            keyword,
+            client_id,
+            client_secret,
+            max_results=max_results,
+            display=display,
+            sort="date",
+            on_page=lambda start, _: fetched_pages.append(start),
+            use_cache=False,
+        )
+        blog_posts = _unique_links(blog_posts)
+        store.merge_posts(keyword, blog_posts)
+        return blog_posts, len(fetched_pages)
+
+    new_posts = []
+    seen_links = set()
+    request_count = 0
+    for start in page_starts(max_results, display, max_results):
+        blog_posts, total = search_blog_page(
+            keyword,
+            client_id,
+            client_secret,
+            start=start,
+            display=display,
+            sort="date",
+            use_cache=False,
+        )
+        request_count += 1
+
+        reached_seen = False
+        for post in blog_posts:
+            if post["postdate"] < watermark:
+                reached_seen = True
+                break
+            # 작성일은 날짜 단위라 워터마크 당일 글은 링크로 확인
+            # 페이지를 넘기는 사이 새 글이 올라오면 같은 글이 다음 페이지에 다시 나오므로 한 번만 추가
+            if post["link"] in seen_links:
+                continue
+            seen_links.add(post["link"])
+            if not store.has_link(keyword, post["link"]):
+                new_posts.append(post)
+
+        if reached_seen or len(blog_posts) < display or start + display > total:
+            break
+
+    store.merge_posts(keyword, new_posts)
+    return new_posts, request_count
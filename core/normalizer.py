@@ -0,0 +1,91 @@
+"""
+    검색 결과 정규화 모듈
+
+    clean_text: HTML 태그 제거와 엔티티 디코딩을 정규식 한 번으로 처리
+    canonicalize_link: 같은 글을 가리키는 링크를 하나의 형태로 통일
+    dedupe_posts: 같은 링크와 거의 같은 내용(MinHash)의 글 제거
+"""
+
+import html
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from core.minhash import LSHIndex, MinHasher, similarity
+
+# 태그 또는 엔티티 하나에 매칭 (엔티티만 그룹 1에 잡힘)
+_MARKUP_PATTERN = re.compile(r"<[^>]*>|(&(?:#\d+|#[xX][0-9a-fA-F]+|[A-Za-z][A-Za-z0-9]*);)")
+
+# 링크에서 제거할 추적용 파라미터
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "from", "trackingCode")
+
+DEFAULT_DUPLICATE_THRESHOLD = 0.8
+
+
+def _replace_markup(match):
+    entity = match.group(1)
+    return html.unescape(entity) if entity else ""
+
+
+def clean_text(text):
+    """HTML 태그 제거, 엔티티 디코딩, 공백 정리"""
+    if not text:
+        return ""
+    return " ".join(_MARKUP_PATTERN.sub(_replace_markup, text).split())
+
+
+def canonicalize_link(link):
+    """링크 정규화 - 네이버 블로그 모바일/PostView 링크를 blog.naver.com/아이디/글번호 형태로 통일"""
+    if not link:
+        return ""
+
+    parts = urlsplit(link.strip())
+    host = parts.netloc.lower()
+    if host.startswith("m."):
+        host = host[2:]
+    path = parts.path.rstrip("/") or "/"
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith(_TRACKING_PARAMS)
+    ]
+
+    if host == "blog.naver.com":
+        params = dict(query)
+        if "blogId" in params and "logNo" in params:
+            path = f"/{params['blogId']}/{params['logNo']}"
+            query = []
+
+    return urlunsplit(("https", host, path, urlencode(sorted(query)), ""))
+
+
+def dedupe_posts(blog_posts, threshold=DEFAULT_DUPLICATE_THRESHOLD):
+    """
+    중복 글 제거 (먼저 나온 글 유지, 순서 보존)
+    링크가 같거나 제목+설명의 추정 유사도가 threshold 이상이면 중복으로 봅니다.
+    """
+    hasher = MinHasher()
+    index = LSHIndex()
+    signatures = []
+    seen_links = set()
+    kept = []
+
+    for post in blog_posts:
+        link = post.get("link", "")
+        if link and link in seen_links:
+            continue
+
+        text = f"{post.get('title', '')} {post.get('description', '')}".strip()
+        if text:
+            signature = hasher.text_signature(text)
+            if any(
+                similarity(signature, signatures[i]) >= threshold
+                for i in index.candidates(signature)
+            ):
+                continue
+            index.add(len(signatures), signature)
+            signatures.append(signature)
+
+        if link:
+            seen_links.add(link)
+        kept.append(post)
+
+    return kept
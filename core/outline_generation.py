@@ -0,0 +1,358 @@
+"""
+    개요 → 섹션 병렬 글 생성 모듈
+
+    긴 글을 한 번에 순서대로 생성하면 글 길이만큼 시간이 걸리므로,
+    먼저 소제목 개요(JSON)를 만들고 서론/각 소제목 본문/결론을 동시에 생성한 뒤 순서대로 이어 붙입니다.
+    모든 부분 요청은 같은 사용자 프롬프트, 제목, 전체 개요를 앞에 두므로 문체와 흐름이 맞춰지고
+    전체 시간은 개요 생성 + 가장 오래 걸린 부분 생성 시간에 가깝습니다.
+"""
+
+import asyncio
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from core.content_generation import CONTENT_MODEL_NAME
+from core.prompt_builder import PromptBuilder, estimate_cost, estimate_tokens, get_token_budget
+from core.response_cache import cached_generate, cached_generate_async
+from core.stage_metrics import (
+    STAGE_CONTENT,
+    STAGE_OUTLINE,
+    STAGE_SECTION,
+    get_stage_metrics,
+)
+
+DEFAULT_OUTLINE_SECTIONS = 4
+
+# 모델이 개요를 길게 만들어도 글 하나의 동시 부분 요청 수가 커지지 않도록 소제목 수 제한
+MAX_OUTLINE_SECTIONS = 8
+
+# 개요 요청 하나의 예상 출력 토큰 수 (비용 추정용)
+OUTPUT_TOKENS_PER_OUTLINE = 300
+
+# 글 전체 목표 길이 (자) - 서론/결론에 각 10%, 나머지를 소제목에 나눔
+DEFAULT_TARGET_CHARS = 2500
+
+PART_INTRO = "intro"
+PART_CONCLUSION = "conclusion"
+CONCLUSION_HEADING = "마무리"
+
+# 개요 응답 스키마 (Gemini structured output)
+OUTLINE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "sections": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "heading": {"type": "string"},
+                    "points": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["heading", "points"],
+            },
+        },
+    },
+    "required": ["sections"],
+}
+
+_HEADING_MARK_PATTERN = re.compile(r"^[#*\s]+|[*\s]+$")
+
+
+class OutlineParseError(Exception):
+    """개요 응답 형식 오류"""
+
+
+def outline_generation_config():
+    """개요 요청에 사용할 structured output 설정"""
+    return {
+        "response_mime_type": "application/json",
+        "response_schema": OUTLINE_SCHEMA,
+    }
+
+
+def _builder(title, prompt):
+    """공통 앞부분 (사용자 프롬프트, 제목) - prompt가 None이면 공유 지침으로 등록된 것으로 보고 생략"""
+    builder = PromptBuilder(get_token_budget())
+    if prompt is not None:
+        builder.add("prompt", prompt, required=True)
+    builder.add("title", f"제목: {title}", required=True)
+    return builder
+
+
+def build_outline_prompt(title, prompt, sections=DEFAULT_OUTLINE_SECTIONS):
+    """개요 생성 프롬프트"""
+    builder = _builder(title, prompt)
+    builder.add(
+        "instruction",
+        f"위 지침에 따라 이 제목으로 쓸 블로그 글의 개요를 소제목 {sections}개로 작성해주세요.\n"
+        "각 소제목에는 다룰 핵심 내용을 2~4개 적고, 서론과 결론은 개요에 넣지 마세요.\n"
+        '{"sections": [{"heading": "소제목", "points": ["핵심 내용"]}]} 형식의 JSON으로만 답하세요.',
+        required=True,
+    )
+    full_prompt, _, _ = builder.build()
+    return full_prompt
+
+
+def parse_outline(text):
+    """
+    개요 JSON 응답 파싱 - {"sections": [{"heading", "points"}]} 반환
+    형식이 다르거나 소제목이 없으면 OutlineParseError, MAX_OUTLINE_SECTIONS개를 넘는 소제목은 버림
+    """
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise OutlineParseError(f"JSON 형식이 아닙니다: {e}")
+
+    if isinstance(data, dict):
+        data = data.get("sections")
+    if not isinstance(data, list):
+        raise OutlineParseError("sections 배열이 없습니다.")
+
+    sections = []
+    for entry in data:
+        if not isinstance(entry, dict) or not isinstance(entry.get("heading"), str):
+            raise OutlineParseError("소제목 항목 형식이 올바르지 않습니다.")
+        points = entry.get("points") or []
+        if not isinstance(points, list) or not all(isinstance(p, str) for p in points):
+            raise OutlineParseError(f"'{entry['heading']}'의 points가 문자열 배열이 아닙니다.")
+        heading = entry["heading"].strip()
+        if heading:
+            sections.append({"heading": heading, "points": [p.strip() for p in points if p.strip()]})
+    if not sections:
+        raise OutlineParseError("개요에 소제목이 없습니다.")
+    return {"sections": sections[:MAX_OUTLINE_SECTIONS]}
+
+
+def format_outline(outline):
+    """부분 생성 프롬프트에 넣는 개요 텍스트"""
+    lines = []
+    for number, section in enumerate(outline["sections"], 1):
+        lines.append(f"{number}. {section['heading']}")
+        lines.extend(f"- {point}" for point in section["points"])
+    return "\n".join(lines)
+
+
+def section_lengths(outline, target_chars=DEFAULT_TARGET_CHARS):
+    """(서론/결론 길이, 소제목 하나 길이) - 자 단위"""
+    edge = max(100, target_chars // 10)
+    body = max(200, (target_chars - 2 * edge) // len(outline["sections"]))
+    return edge, body
+
+
+def build_section_prompt(title, prompt, outline, part, chars):
+    """
+    부분 생성 프롬프트 - part는 PART_INTRO, PART_CONCLUSION 또는 소제목 번호(0부터)
+    모든 부분이 같은 앞부분(프롬프트, 제목, 개요)을 공유하고 마지막 지시만 다름
+    """
+    builder = _builder(title, prompt)
+    builder.add("outline", f"글 개요:\n{format_outline(outline)}", required=True)
+    if part == PART_INTRO:
+        instruction = (
+            f"위 개요 전체를 자연스럽게 소개하는 서론을 약 {chars}자로 작성해주세요.\n"
+            "소제목 없이 본문만 작성하세요."
+        )
+    elif part == PART_CONCLUSION:
+        instruction = (
+            f"위 개요 전체를 정리하는 결론(요약)을 약 {chars}자로 작성해주세요.\n"
+            "소제목 없이 본문만 작성하세요."
+        )
+    else:
+        heading = outline["sections"][part]["heading"]
+        instruction = (
+            f"위 개요의 {part + 1}번째 소제목 '{heading}' 부분의 본문만 약 {chars}자로 작성해주세요.\n"
+            "소제목 줄은 쓰지 말고, 서론/결론이나 다른 소제목의 내용은 쓰지 마세요."
+        )
+    builder.add("instruction", instruction, required=True)
+    full_prompt, _, _ = builder.build()
+    return full_prompt
+
+
+def estimate_outlined_batch(
+    titles, prompt, sections=DEFAULT_OUTLINE_SECTIONS, target_chars=DEFAULT_TARGET_CHARS
+):
+    """
+    개요 모드 일괄 생성의 예상 토큰/비용 - estimate_batch와 같은 형식
+    글마다 개요 요청 1회와 서론/소제목/결론 요청을 보내므로, 소제목 sections개짜리
+    자리 표시 개요로 부분 프롬프트를 만들어 셉니다. 출력은 한글 글자당 약 1토큰으로 봅니다.
+    """
+    sections = min(sections, MAX_OUTLINE_SECTIONS)
+    outline = {
+        "sections": [
+            {"heading": f"소제목 {number}", "points": ["핵심 내용"] * 3}
+            for number in range(1, sections + 1)
+        ]
+    }
+    edge, body = section_lengths(outline, target_chars)
+    parts = [(PART_INTRO, edge)] + [(part, body) for part in range(sections)]
+    parts.append((PART_CONCLUSION, edge))
+
+    input_tokens = 0
+    for title in titles:
+        input_tokens += estimate_tokens(build_outline_prompt(title, prompt, sections))
+        input_tokens += sum(
+            estimate_tokens(build_section_prompt(title, prompt, outline, part, chars))
+            for part, chars in parts
+        )
+    output_tokens = (OUTPUT_TOKENS_PER_OUTLINE + sum(chars for _, chars in parts)) * len(titles)
+    return {
+        "requests": (len(parts) + 1) * len(titles),
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cost": estimate_cost(input_tokens, output_tokens),
+    }
+
+
+def _strip_heading(body, heading):
+    """모델이 지시와 달리 소제목 줄을 붙였으면 제거"""
+    body = body.strip()
+    first, _, rest = body.partition("\n")
+    if first.lstrip().startswith("#") or _HEADING_MARK_PATTERN.sub("", first) == heading:
+        return rest.strip()
+    return body
+
+
+def stitch_sections(outline, intro, bodies, conclusion):
+    """서론 + 소제목별 본문 + 결론을 순서대로 이어 붙인 글"""
+    parts = [intro.strip()]
+    for section, body in zip(outline["sections"], bodies):
+        parts.append(f"## {section['heading']}\n\n{_strip_heading(body, section['heading'])}")
+    parts.append(f"## {CONCLUSION_HEADING}\n\n{conclusion.strip()}")
+    return "\n\n".join(part for part in parts if part)
+
+
+class _OutlinedPost:
+    """
+    개요 모드 글 하나의 상태 (동기/비동기 공통)
+    개요 요청과 부분 요청 프롬프트, 진행 표시, 이어 붙이기를 담당하고 호출 방식만 호출하는 쪽이 정합니다.
+    """
+
+    def __init__(self, title, prompt, shared, sections, target_chars, on_progress):
+        self.title = title
+        # shared=True면 prompt가 공유 지침으로 모델에 등록되어 있으므로 요청에서 뺌
+        self.request_prompt = None if shared else prompt
+        self.sections = sections
+        self.target_chars = target_chars
+        self.on_progress = on_progress
+        self.outline = None
+        self.lengths = None
+        self.total = 0
+        self.done = 0
+        self.lock = threading.Lock()
+
+    def outline_prompt(self):
+        return build_outline_prompt(self.title, self.request_prompt, self.sections)
+
+    def set_outline(self, text):
+        """개요 응답 파싱 - 생성할 부분 목록 (서론, 소제목 번호들, 결론) 반환"""
+        self.outline = parse_outline(text)
+        self.lengths = section_lengths(self.outline, self.target_chars)
+        parts = [PART_INTRO] + list(range(len(self.outline["sections"]))) + [PART_CONCLUSION]
+        self.total = len(parts) + 1
+        self.part_done()
+        return parts
+
+    def part_prompt(self, part):
+        edge, body = self.lengths
+        chars = body if isinstance(part, int) else edge
+        return build_section_prompt(self.title, self.request_prompt, self.outline, part, chars)
+
+    def part_done(self):
+        """개요 또는 부분 하나 완료 - on_progress(완료 수, 전체 수) 호출"""
+        with self.lock:
+            self.done += 1
+            done = self.done
+        if self.on_progress:
+            self.on_progress(done, self.total)
+
+    def stitch(self, outline_hit, results):
+        """부분 결과 [(텍스트, 캐시 적중)]를 이어 붙여 (본문, 캐시 적중 여부) 반환"""
+        texts = [text for text, _ in results]
+        cache_hit = outline_hit and all(hit for _, hit in results)
+        return stitch_sections(self.outline, texts[0], texts[1:-1], texts[-1]), cache_hit
+
+
+def generate_outlined_content(
+    model,
+    title,
+    prompt,
+    use_cache=True,
+    api_key=None,
+    shared=False,
+    on_usage=None,
+    sections=DEFAULT_OUTLINE_SECTIONS,
+    target_chars=DEFAULT_TARGET_CHARS,
+    on_progress=None,
+):
+    """
+    개요를 만든 뒤 서론/소제목/결론을 동시에 생성해 이어 붙임 - (본문, 캐시 적중 여부) 반환
+    shared=True면 model에 prompt가 공유 지침으로 등록되어 있으므로 요청에서 prompt를 뺍니다.
+    on_progress(완료 부분 수, 전체 부분 수)는 부분이 끝날 때마다 호출됩니다 (개요 포함).
+    부분 하나라도 실패하면 예외를 그대로 전달합니다.
+    """
+    metrics = get_stage_metrics()
+    post = _OutlinedPost(title, prompt, shared, sections, target_chars, on_progress)
+    request = {"use_cache": use_cache, "api_key": api_key, "on_usage": on_usage}
+    with metrics.timed(STAGE_CONTENT):
+        with metrics.timed(STAGE_OUTLINE):
+            text, outline_hit = cached_generate(
+                model,
+                CONTENT_MODEL_NAME,
+                post.outline_prompt(),
+                generation_config=outline_generation_config(),
+                validate=parse_outline,
+                **request,
+            )
+        parts = post.set_outline(text)
+
+        def generate_part(part):
+            with metrics.timed(STAGE_SECTION):
+                result = cached_generate(model, CONTENT_MODEL_NAME, post.part_prompt(part), **request)
+            post.part_done()
+            return result
+
+        with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+            results = list(executor.map(generate_part, parts))
+
+    return post.stitch(outline_hit, results)
+
+
+async def generate_outlined_content_async(
+    model,
+    title,
+    prompt,
+    use_cache=True,
+    api_key=None,
+    shared=False,
+    on_usage=None,
+    sections=DEFAULT_OUTLINE_SECTIONS,
+    target_chars=DEFAULT_TARGET_CHARS,
+    on_progress=None,
+):
+    """generate_outlined_content의 코루틴 버전 - 부분 요청을 스레드 없이 동시에 보냄"""
+    metrics = get_stage_metrics()
+    post = _OutlinedPost(title, prompt, shared, sections, target_chars, on_progress)
+    request = {"use_cache": use_cache, "api_key": api_key, "on_usage": on_usage}
+    with metrics.timed(STAGE_CONTENT):
+        with metrics.timed(STAGE_OUTLINE):
+            text, outline_hit = await cached_generate_async(
+                model,
+                CONTENT_MODEL_NAME,
+                post.outline_prompt(),
+                generation_config=outline_generation_config(),
+                validate=parse_outline,
+                **request,
+            )
+        parts = post.set_outline(text)
+
+        async def generate_part(part):
+            with metrics.timed(STAGE_SECTION):
+                result = await cached_generate_async(
+                    model, CONTENT_MODEL_NAME, post.part_prompt(part), **request
+                )
+            post.part_done()
+            return result
+
+        results = await asyncio.gather(*(generate_part(part) for part in parts))
+
+    return post.stitch(outline_hit, results)
@@ -0,0 +1,196 @@
+"""
+    수집한 블로그 글 저장소 모듈
+
+    검색으로 수집한 글을 키워드별로 SQLite 파일에 누적 저장하고,
+    키워드마다 마지막으로 수집한 글의 작성일(postdate)을 워터마크로 기록합니다.
+    제목/설명/블로거명은 FTS5 전문 색인으로 관리되어 API 호출 없이 검색할 수 있습니다.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from utils.utils import get_data_dir
+
+POST_FIELDS = ("title", "description", "link", "bloggername", "postdate")
+
+
+class PostStore:
+    """키워드별 블로그 글 저장소"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS posts (
+                keyword TEXT NOT NULL,
+                link TEXT NOT NULL,
+                title TEXT NOT NULL,
+                description TEXT NOT NULL,
+                bloggername TEXT NOT NULL,
+                postdate TEXT NOT NULL,
+                collected_at REAL NOT NULL,
+                PRIMARY KEY (keyword, link)
+            );
+            CREATE INDEX IF NOT EXISTS idx_posts_keyword_postdate
+                ON posts (keyword, postdate);
+            CREATE TABLE IF NOT EXISTS watermarks (
+                keyword TEXT PRIMARY KEY,
+                postdate TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            """
+        )
+        self.init_fts()
+        self.conn.commit()
+
+    def init_fts(self):
+        """전문 색인 테이블과 동기화 트리거 생성 (기존 글은 최초 1회 색인)"""
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'"
+        ).fetchone()
+        self.conn.executescript(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5 (
+                title, description, bloggername,
+                content = 'posts', content_rowid = 'rowid',
+                tokenize = 'unicode61', prefix = '2 3'
+            );
+            CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+                INSERT INTO posts_fts (rowid, title, description, bloggername)
+                VALUES (new.rowid, new.title, new.description, new.bloggername);
+            END;
+            CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+                INSERT INTO posts_fts (posts_fts, rowid, title, description, bloggername)
+                VALUES ('delete', old.rowid, old.title, old.description, old.bloggername);
+            END;
+            """
+        )
+        if not exists:
+            self.conn.execute("INSERT INTO posts_fts (posts_fts) VALUES ('rebuild')")
+
+    def get_watermark(self, keyword):
+        """마지막으로 수집한 글의 작성일 (YYYYMMDD, 없으면 None)"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT postdate FROM watermarks WHERE keyword = ?", (keyword,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def has_link(self, keyword, link):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM posts WHERE keyword = ? AND link = ?", (keyword, link)
+            ).fetchone()
+        return row is not None
+
+    def _insert_posts(self, keyword, blog_posts, now):
+        rows = [
+            (keyword,) + tuple(post.get(field, "") for field in POST_FIELDS) + (now,)
+            for post in blog_posts
+            if post.get("link")
+        ]
+        cursor = self.conn.executemany(
+            "INSERT OR IGNORE INTO posts "
+            "(keyword, title, description, link, bloggername, postdate, collected_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        return cursor.rowcount, rows
+
+    def add_posts(self, keyword, blog_posts):
+        """수집한 글 저장 (워터마크는 그대로) - 실제로 추가된 글 수 반환"""
+        with self.lock:
+            added, _ = self._insert_posts(keyword, blog_posts, time.time())
+            self.conn.commit()
+        return added
+
+    def merge_posts(self, keyword, blog_posts):
+        """최신순으로 수집한 새 글 추가 후 워터마크 갱신 - 실제로 추가된 글 수 반환"""
+        now = time.time()
+        with self.lock:
+            added, rows = self._insert_posts(keyword, blog_posts, now)
+
+            latest = max((row[5] for row in rows if row[5]), default=None)
+            if latest:
+                self.conn.execute(
+                    "INSERT INTO watermarks (keyword, postdate, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(keyword) DO UPDATE SET "
+                    "postdate = MAX(postdate, excluded.postdate), updated_at = excluded.updated_at",
+                    (keyword, latest, now),
+                )
+            self.conn.commit()
+        return added
+
+    def get_posts(self, keyword, limit=None):
+        """키워드로 수집된 글 목록 (최신순)"""
+        query = (
+            "SELECT title, description, link, bloggername, postdate FROM posts "
+            "WHERE keyword = ? ORDER BY postdate DESC, collected_at DESC"
+        )
+        params = (keyword,)
+        if limit:
+            query += " LIMIT ?"
+            params += (limit,)
+        with self.lock:
+            rows = self.conn.execute(query, params).fetchall()
+        return [dict(zip(POST_FIELDS, row)) for row in rows]
+
+    def search(self, query, limit=100, keyword=None):
+        """
+        저장된 글 전문 검색 (관련도순)
+        검색어의 각 단어를 접두어로 검색하므로 '맛집'으로 '맛집을', '맛집추천'도 찾습니다.
+        """
+        terms = [term.replace('"', '""') for term in query.split()]
+        if not terms:
+            return []
+        match = " ".join(f'"{term}"*' for term in terms)
+
+        sql = (
+            "SELECT p.keyword, p.title, p.description, p.link, p.bloggername, p.postdate "
+            "FROM posts_fts JOIN posts AS p ON p.rowid = posts_fts.rowid "
+            "WHERE posts_fts MATCH ?"
+        )
+        params = [match]
+        if keyword:
+            sql += " AND p.keyword = ?"
+            params.append(keyword)
+        sql += " ORDER BY bm25(posts_fts) LIMIT ?"
+        # 같은 글이 여러 키워드로 저장되어 있을 수 있어 여유 있게 가져온 뒤 링크로 중복 제거
+        params.append(limit * 2)
+
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+
+        results = []
+        seen_links = set()
+        for row in rows:
+            post = dict(zip(POST_FIELDS, row[1:]))
+            if post["link"] in seen_links:
+                continue
+            seen_links.add(post["link"])
+            post["keyword"] = row[0]
+            results.append(post)
+            if len(results) >= limit:
+                break
+        return results
+
+    def count(self):
+        """저장된 글 수"""
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+
+_post_store = None
+_post_store_lock = threading.Lock()
+
+
+def get_post_store():
+    """프로그램 전체에서 공유하는 글 저장소 반환"""
+    global _post_store
+    with _post_store_lock:
+        if _post_store is None:
+            _post_store = PostStore(os.path.join(get_data_dir(), "posts.db"))
+        return _post_store
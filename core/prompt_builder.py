@@ -0,0 +1,166 @@
+"""
+    토큰 예산 기반 프롬프트 구성 모듈
+
+    프롬프트를 우선순위가 있는 구역(section)으로 나누어 조립하고,
+    전송 전에 토큰 수를 추정하여 예산을 넘으면 우선순위가 낮은 구역부터 줄입니다.
+    토큰 수는 로컬 추정기로 계산하며, GEMINI_EXACT_TOKEN_COUNT를 켜면 get_token_counter(model)로
+    Gemini count_tokens를 사용해 예산을 검사합니다.
+"""
+
+import os
+import re
+import textwrap
+from functools import lru_cache, partial
+
+DEFAULT_TOKEN_BUDGET = 8000
+
+# 100만 토큰당 가격 (USD) - gemini-2.0-flash 기준, .env로 변경 가능
+DEFAULT_INPUT_PRICE_PER_M = 0.10
+DEFAULT_OUTPUT_PRICE_PER_M = 0.40
+
+# 캐시된 입력 토큰 할인율 (캐시 적중 토큰은 입력 가격의 25%로 과금)
+CACHED_INPUT_DISCOUNT = 0.75
+
+# 한글/한자/가나는 글자당 약 1토큰, 그 외 연속 문자는 약 4글자당 1토큰
+_CJK_RANGES = "\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u4e00-\u9fff\uac00-\ud7a3"
+_CJK_PATTERN = re.compile(f"[{_CJK_RANGES}]")
+_OTHER_PATTERN = re.compile(f"[^\\s{_CJK_RANGES}]+")
+
+
+class TokenBudgetExceeded(Exception):
+    """필수 구역만으로도 토큰 예산을 넘는 경우"""
+
+
+def estimate_tokens(text):
+    """로컬 토큰 수 추정"""
+    if not text:
+        return 0
+    cjk = len(_CJK_PATTERN.findall(text))
+    other = sum((len(run) + 3) // 4 for run in _OTHER_PATTERN.findall(text))
+    return cjk + other
+
+
+def count_tokens_exact(model, text):
+    """Gemini API로 정확한 토큰 수 계산 (실패하면 로컬 추정값)"""
+    try:
+        return model.count_tokens(text).total_tokens
+    except Exception:
+        return estimate_tokens(text)
+
+
+def get_token_budget():
+    """요청당 토큰 예산 (.env의 GEMINI_PROMPT_TOKEN_BUDGET)"""
+    return int(os.getenv("GEMINI_PROMPT_TOKEN_BUDGET", DEFAULT_TOKEN_BUDGET))
+
+
+def use_exact_token_count():
+    """Gemini count_tokens 사용 여부 (.env의 GEMINI_EXACT_TOKEN_COUNT)"""
+    return os.getenv("GEMINI_EXACT_TOKEN_COUNT", "").lower() in ("1", "true", "yes")
+
+
+def get_token_counter(model=None):
+    """
+    예산 검사에 쓸 토큰 계산기 - 정확한 계산이 켜져 있고 모델이 있으면 count_tokens, 아니면 로컬 추정기
+    조립이 끝난 프롬프트를 다시 셀 때 요청하지 않도록 최근 결과를 보관합니다.
+    """
+    if model is None or not use_exact_token_count():
+        return estimate_tokens
+    return lru_cache(maxsize=4)(partial(count_tokens_exact, model))
+
+
+def estimate_cost(input_tokens, output_tokens):
+    """예상 비용 (USD)"""
+    input_price = float(os.getenv("GEMINI_INPUT_PRICE_PER_M", DEFAULT_INPUT_PRICE_PER_M))
+    output_price = float(os.getenv("GEMINI_OUTPUT_PRICE_PER_M", DEFAULT_OUTPUT_PRICE_PER_M))
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+def estimate_cached_savings(cached_tokens):
+    """캐시 적중 입력 토큰으로 절감한 비용 (USD)"""
+    input_price = float(os.getenv("GEMINI_INPUT_PRICE_PER_M", DEFAULT_INPUT_PRICE_PER_M))
+    return cached_tokens * input_price * CACHED_INPUT_DISCOUNT / 1_000_000
+
+
+def estimate_batch(prompts, output_tokens_per_request):
+    """일괄 요청의 예상 토큰/비용 - {'requests', 'input_tokens', 'output_tokens', 'cost'}"""
+    input_tokens = sum(estimate_tokens(prompt) for prompt in prompts)
+    output_tokens = output_tokens_per_request * len(prompts)
+    return {
+        "requests": len(prompts),
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cost": estimate_cost(input_tokens, output_tokens),
+    }
+
+
+def format_estimate(estimate):
+    """예상 토큰/비용 표시 문자열"""
+    return (
+        f"요청 {estimate['requests']}회, 입력 약 {estimate['input_tokens']:,}토큰 + "
+        f"출력 약 {estimate['output_tokens']:,}토큰, 예상 비용 약 ${estimate['cost']:.4f}"
+    )
+
+
+class PromptBuilder:
+    """
+    우선순위 구역으로 프롬프트 조립
+    required 구역은 줄이지 않고, 나머지는 priority가 낮은 구역의 마지막 줄부터 제거합니다.
+    """
+
+    def __init__(self, budget=None, counter=estimate_tokens):
+        self.budget = budget
+        self.counter = counter
+        self.sections = []
+
+    def add(self, name, text, priority=0, required=False):
+        """
+        구역 추가 - 공통 들여쓰기, 줄 끝 공백, 연속된 빈 줄은 정리됩니다
+        줄 사이의 상대적인 들여쓰기(하위 목록, 형식 템플릿 등)는 그대로 유지합니다.
+        """
+        lines = []
+        for line in textwrap.dedent(text).strip("\n").split("\n"):
+            line = line.rstrip()
+            if line or (lines and lines[-1]):
+                lines.append(line)
+        while lines and not lines[-1]:
+            lines.pop()
+        self.sections.append(
+            {"name": name, "lines": lines, "priority": priority, "required": required}
+        )
+        return self
+
+    def _render(self):
+        return "\n\n".join(
+            "\n".join(section["lines"]) for section in self.sections if section["lines"]
+        )
+
+    def _trim_once(self):
+        """가장 낮은 우선순위 구역의 마지막 줄 제거 후 반환 - 더 줄일 수 없으면 None"""
+        candidates = [s for s in self.sections if not s["required"] and s["lines"]]
+        if not candidates:
+            return None
+        section = min(candidates, key=lambda s: s["priority"])
+        section["trimmed"] = True
+        return section["lines"].pop()
+
+    def build(self):
+        """
+        (프롬프트, 토큰 수, 줄인 구역 이름 목록) 반환
+        줄을 하나씩 뺄 때는 로컬 추정치로 빼고, 예산 안으로 들어오면 counter로 전체를 다시 셉니다.
+        counter가 count_tokens여도 요청 수가 줄인 줄 수만큼 늘지 않습니다.
+        """
+        prompt = self._render()
+        tokens = self.counter(prompt)
+        while self.budget and tokens > self.budget:
+            while tokens > self.budget:
+                line = self._trim_once()
+                if line is None:
+                    raise TokenBudgetExceeded(
+                        f"필수 프롬프트만으로 토큰 예산을 초과합니다 ({tokens}/{self.budget})"
+                    )
+                tokens -= estimate_tokens(line)
+            prompt = self._render()
+            tokens = self.counter(prompt)
+
+        trimmed = [s["name"] for s in self.sections if s.get("trimmed")]
+        return prompt, tokens, trimmed
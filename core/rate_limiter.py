@@ -0,0 +1,510 @@
+"""
+    API 호출 속도 제한 모듈
+
+    TokenBucket: 초당 요청 수 제한 (토큰 버킷)
+    DailyQuota: 일일 호출 한도 관리 (이름을 주면 프로세스 간에 공유)
+    ApiRateLimiter: 초당 제한과 일일 한도를 함께 적용
+    GeminiRateLimiter: API 키별 분당 요청 수(RPM)/분당 토큰 수(TPM) 제한과 429 재시도,
+                       키 풀에서 요청마다 사용할 키 선택과 키별 상태(정상/대기/사용 중지) 관리
+"""
+
+import asyncio
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from datetime import date
+from core.key_pool import NoUsableKeyError, pool_keys
+from utils.utils import get_data_dir
+
+DEFAULT_GEMINI_RPM = 15
+DEFAULT_GEMINI_TPM = 1_000_000
+
+# 429 오류 메시지의 재시도 대기 시간 ("retry_delay { seconds: 34 }", "retry in 34.5s")
+_RETRY_DELAY_PATTERN = re.compile(
+    r"retry(?:_delay)?\s*(?:\{\s*seconds:|in)\s*(\d+(?:\.\d+)?)", re.I
+)
+
+
+class QuotaExceededError(Exception):
+    """일일 호출 한도 초과"""
+
+
+class TokenBucket:
+    """토큰 버킷 - 초당 rate개씩 충전되고 최대 capacity개까지 보관"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def available(self):
+        """현재 남은 토큰 수"""
+        with self.lock:
+            self._refill()
+            return self.tokens
+
+    def consume(self, tokens):
+        """대기 없이 토큰 차감 (음수가 되면 이후 충전에서 갚음)"""
+        with self.lock:
+            self._refill()
+            self.tokens -= tokens
+
+    def _reserve(self, tokens):
+        """
+        토큰이 충분하면 차감하고 0, 부족하면 기다려야 할 시간(초) 반환
+        capacity보다 큰 요청은 버킷이 가득 찼을 때 통과시키고 부족분은 이후 충전에서 갚습니다.
+        """
+        with self.lock:
+            self._refill()
+            needed = min(tokens, self.capacity)
+            if self.tokens >= needed:
+                self.tokens -= tokens
+                return 0.0
+            return (needed - self.tokens) / self.rate
+
+    def acquire(self, tokens=1, timeout=None):
+        """토큰을 얻을 때까지 대기 후 차감 - timeout 안에 얻지 못하면 False 반환"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens=1):
+        """acquire의 코루틴 버전 - 이벤트 루프를 막지 않고 대기"""
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+class DailyQuota:
+    """
+    일일 호출 한도 - 날짜가 바뀌면 초기화
+    name을 주면 사용량을 데이터 폴더의 quota.db에 날짜와 함께 기록하므로
+    예약 실행한 blog_cli.py처럼 여러 프로세스가 같은 한도를 나눠 씁니다.
+    파일은 처음 차감할 때 열므로 모듈 전역으로 만들어도 .env의 데이터 폴더 설정을 따릅니다.
+    """
+
+    def __init__(self, limit, name=None, db_path=None):
+        self.limit = limit
+        self.name = name
+        self.db_path = db_path
+        self.used = 0
+        self.day = date.today()
+        self.lock = threading.Lock()
+        self.conn = None
+
+    def _connect(self):
+        if self.conn is None:
+            if self.db_path is None:
+                self.db_path = os.path.join(get_data_dir(), "quota.db")
+            # 트랜잭션은 직접 관리 (BEGIN IMMEDIATE로 다른 프로세스와 차감 순서를 맞춤)
+            self.conn = sqlite3.connect(
+                self.db_path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            # 요청마다 기록하므로 WAL 모드로 쓰기 비용을 줄임
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS daily_quota (
+                    name TEXT PRIMARY KEY,
+                    day TEXT NOT NULL,
+                    used INTEGER NOT NULL
+                )
+                """
+            )
+        return self.conn
+
+    def _reset_if_new_day(self):
+        today = date.today()
+        if today != self.day:
+            self.day = today
+            self.used = 0
+
+    def _load(self, conn):
+        """기록된 오늘 사용량을 self.used에 반영 (다른 날짜 기록이면 0)"""
+        self.day = date.today()
+        row = conn.execute(
+            "SELECT day, used FROM daily_quota WHERE name = ?", (self.name,)
+        ).fetchone()
+        self.used = row[1] if row and row[0] == self.day.isoformat() else 0
+
+    def _check(self, count):
+        if self.used + count > self.limit:
+            raise QuotaExceededError(f"일일 호출 한도 초과 ({self.used}/{self.limit})")
+
+    def consume(self, count=1):
+        """호출 한도 차감 - 한도 초과 시 QuotaExceededError"""
+        with self.lock:
+            if self.name is None:
+                self._reset_if_new_day()
+                self._check(count)
+                self.used += count
+                return
+
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._load(conn)
+                self._check(count)
+                conn.execute(
+                    "INSERT OR REPLACE INTO daily_quota VALUES (?, ?, ?)",
+                    (self.name, self.day.isoformat(), self.used + count),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self.used += count
+
+    @property
+    def remaining(self):
+        with self.lock:
+            if self.name is None:
+                self._reset_if_new_day()
+            else:
+                self._load(self._connect())
+            return self.limit - self.used
+
+
+class ApiRateLimiter:
+    """초당 요청 수와 일일 한도를 함께 적용하는 제한기"""
+
+    def __init__(self, per_second, per_day, name=None):
+        self.bucket = TokenBucket(per_second)
+        self.quota = DailyQuota(per_day, name)
+
+    def acquire(self):
+        """요청 1회 허가 - 일일 한도 초과 시 QuotaExceededError"""
+        self.quota.consume()
+        self.bucket.acquire()
+
+    async def acquire_async(self):
+        from core.async_engine import run_blocking
+
+        # 한도를 프로세스 간에 나눠 쓰면 SQLite 기록이 필요하므로 루프 밖에서 차감
+        await run_blocking(self.quota.consume)
+        await self.bucket.acquire_async()
+
+    @property
+    def remaining_today(self):
+        return self.quota.remaining
+
+
+def is_rate_limit_error(error):
+    """429 (ResourceExhausted) 오류인지 확인"""
+    code = getattr(error, "code", None)
+    return code == 429 or type(error).__name__ in ("ResourceExhausted", "TooManyRequests")
+
+
+def is_auth_error(error):
+    """잘못되었거나 권한이 없는 API 키 오류인지 확인"""
+    code = getattr(error, "code", None)
+    if code in (401, 403) or type(error).__name__ in ("Unauthenticated", "PermissionDenied"):
+        return True
+    message = str(error)
+    return "API_KEY_INVALID" in message or "API key not valid" in message
+
+
+def parse_retry_delay(error):
+    """서버가 제안한 재시도 대기 시간(초) - 없으면 None"""
+    for detail in getattr(error, "details", None) or []:
+        retry_delay = getattr(detail, "retry_delay", None)
+        if retry_delay is not None:
+            seconds = getattr(retry_delay, "seconds", 0) + getattr(retry_delay, "nanos", 0) / 1e9
+            if seconds > 0:
+                return float(seconds)
+    match = _RETRY_DELAY_PATTERN.search(str(error))
+    if match:
+        return float(match.group(1))
+    return None
+
+
+class GeminiRateLimiter:
+    """
+    API 키별 Gemini 호출 제한기
+    요청 수와 토큰 수를 각각 분당 한도를 충전 속도로 하는 토큰 버킷으로 관리하고,
+    한도가 부족하면 실패시키지 않고 대기열처럼 기다립니다.
+    429 응답을 받으면 해당 키 전체를 서버가 제안한 시간만큼 쉬게 한 뒤 재시도하고,
+    인증 오류를 받은 키는 사용 중지합니다.
+
+    api_key 자리에 ApiKeyPool을 넘기면 요청마다 사용 중지/대기 중이 아닌 키 가운데
+    진행 중인 요청이 가장 적고 남은 한도가 가장 많은 키를 골라 사용합니다.
+    """
+
+    def __init__(self, rpm, tpm, max_retries=3, backoff_base=2, backoff_max=60):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.keys = {}
+        self.lock = threading.Lock()
+
+    def _state(self, api_key):
+        with self.lock:
+            state = self.keys.get(api_key)
+            if state is None:
+                state = self.keys[api_key] = {
+                    "requests": TokenBucket(self.rpm / 60, self.rpm),
+                    "tokens": TokenBucket(self.tpm / 60, self.tpm),
+                    "cooldown_until": 0.0,
+                    "rate_limited": 0,
+                    "in_flight": 0,
+                    "completed": 0,
+                    "tokens_used": 0,
+                    "errors": 0,
+                    "disabled": None,
+                }
+            return state
+
+    def _headroom(self, state, tokens):
+        """(지금 바로 보낼 수 없는지, 남은 한도 비율) - 키 선택 정렬용"""
+        requests = state["requests"].available()
+        token_count = state["tokens"].available()
+        blocked = requests < 1 or token_count < min(tokens, state["tokens"].capacity)
+        return blocked, min(requests / self.rpm, token_count / self.tpm)
+
+    def _select(self, api_key, tokens):
+        """
+        요청을 보낼 키 선택 후 진행 중 요청 수 증가
+        대기 중이 아닌 키 가운데 바로 보낼 수 있는 키 → 진행 중 요청이 적은 키 → 남은 한도가 많은 키 순
+        모든 키가 대기 중이면 가장 먼저 풀리는 키를 고릅니다.
+        """
+        keys = pool_keys(api_key)
+        states = [(key, self._state(key)) for key in keys]
+        with self.lock:
+            usable = [(key, state) for key, state in states if not state["disabled"]]
+            if not usable:
+                if len(keys) == 1:
+                    raise NoUsableKeyError(
+                        f"API 키 …{keys[0][-4:]} 사용 중지됨: {states[0][1]['disabled']}"
+                    )
+                raise NoUsableKeyError(f"사용 가능한 API 키가 없습니다 ({len(keys)}개 모두 인증 오류)")
+
+            now = time.monotonic()
+            ready = [(key, state) for key, state in usable if state["cooldown_until"] <= now]
+            if ready:
+                def load(item):
+                    blocked, headroom = self._headroom(item[1], tokens)
+                    return blocked, item[1]["in_flight"], -headroom
+
+                key, state = min(ready, key=load)
+            else:
+                key, state = min(usable, key=lambda item: item[1]["cooldown_until"])
+            state["in_flight"] += 1
+        return key, state
+
+    def acquire(self, api_key, tokens):
+        """
+        요청 1회와 토큰 tokens개를 얻을 때까지 대기 - 사용할 키 반환
+        요청이 끝나면 release(키)를 호출해야 합니다.
+        """
+        key, state = self._select(api_key, tokens)
+        try:
+            while True:
+                wait = state["cooldown_until"] - time.monotonic()
+                if wait <= 0:
+                    break
+                time.sleep(wait)
+            state["requests"].acquire()
+            state["tokens"].acquire(tokens)
+        except BaseException:
+            self.release(key)
+            raise
+        return key
+
+    async def acquire_async(self, api_key, tokens):
+        """acquire의 코루틴 버전"""
+        key, state = self._select(api_key, tokens)
+        try:
+            while True:
+                wait = state["cooldown_until"] - time.monotonic()
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            await state["requests"].acquire_async()
+            await state["tokens"].acquire_async(tokens)
+        except BaseException:
+            self.release(key)
+            raise
+        return key
+
+    def release(self, api_key, error=None):
+        """요청 종료 기록 - 인증 오류로 끝났으면 해당 키 사용 중지"""
+        state = self._state(api_key)
+        with self.lock:
+            state["in_flight"] -= 1
+            if error is None:
+                state["completed"] += 1
+            else:
+                state["errors"] += 1
+                if is_auth_error(error):
+                    state["disabled"] = str(error).splitlines()[0][:200] or type(error).__name__
+
+    def has_usable_key(self, api_key):
+        """사용 중지되지 않은 키가 남아 있는지"""
+        return any(not self._state(key)["disabled"] for key in pool_keys(api_key))
+
+    def enable(self, api_key):
+        """사용 중지한 키를 다시 사용 (키를 고친 뒤 호출)"""
+        with self.lock:
+            state = self.keys.get(api_key)
+            if state is not None:
+                state["disabled"] = None
+
+    def record_usage(self, api_key, estimated_tokens, actual_tokens):
+        """응답 후 실제 사용 토큰과 추정치의 차이를 반영"""
+        state = self._state(api_key)
+        with self.lock:
+            state["tokens_used"] += actual_tokens or estimated_tokens
+        if actual_tokens and actual_tokens != estimated_tokens:
+            state["tokens"].consume(actual_tokens - estimated_tokens)
+
+    def penalize(self, api_key, delay):
+        """429 응답 후 해당 키의 모든 요청을 delay초 동안 대기시킴"""
+        state = self._state(api_key)
+        with self.lock:
+            state["rate_limited"] += 1
+            state["cooldown_until"] = max(state["cooldown_until"], time.monotonic() + delay)
+
+    def retry_delay(self, error, attempt):
+        """재시도 대기 시간 - 서버 제안값이 없으면 지수 백오프 (full jitter)"""
+        delay = parse_retry_delay(error)
+        if delay is None:
+            delay = random.uniform(0, self.backoff_base * (2 ** attempt))
+        return min(delay, self.backoff_max)
+
+    def should_retry(self, api_key, key, error, attempt):
+        """실패한 요청을 다시 보낼지 - 429는 키를 쉬게 하고, 인증 오류는 다른 키가 남았으면 재시도"""
+        if is_auth_error(error):
+            return self.has_usable_key(api_key)
+        if not is_rate_limit_error(error) or attempt >= self.max_retries:
+            return False
+        self.penalize(key, self.retry_delay(error, attempt))
+        return True
+
+    def call(self, api_key, tokens, func, actual_tokens=None):
+        """
+        제한을 지키며 func(키) 호출 - 429 오류는 max_retries번까지 대기 후 재시도
+        다른 오류나 재시도 후에도 계속되는 429는 그대로 전달합니다.
+        actual_tokens(응답)가 주어지면 응답의 실제 사용 토큰으로 한도를 보정합니다.
+        """
+        attempt = 0
+        while True:
+            key = self.acquire(api_key, tokens)
+            try:
+                response = func(key)
+            except Exception as e:
+                self.release(key, e)
+                if not self.should_retry(api_key, key, e, attempt):
+                    raise
+                attempt += 1
+                continue
+            self.release(key)
+            self.record_usage(key, tokens, actual_tokens(response) if actual_tokens else None)
+            return response
+
+    async def call_async(self, api_key, tokens, func, actual_tokens=None):
+        """call의 코루틴 버전 - func(키)는 코루틴을 반환"""
+        attempt = 0
+        while True:
+            key = await self.acquire_async(api_key, tokens)
+            try:
+                response = await func(key)
+            except Exception as e:
+                self.release(key, e)
+                if not self.should_retry(api_key, key, e, attempt):
+                    raise
+                attempt += 1
+                continue
+            self.release(key)
+            self.record_usage(key, tokens, actual_tokens(response) if actual_tokens else None)
+            return response
+
+    def stats(self):
+        """키별 상태, 남은 요청/토큰 수, 진행 중/완료/오류 요청 수, 사용 토큰, 429 횟수"""
+        with self.lock:
+            items = list(self.keys.items())
+        now = time.monotonic()
+        stats = {}
+        for api_key, state in items:
+            if state["disabled"]:
+                health = "disabled"
+            elif state["cooldown_until"] > now:
+                health = "cooldown"
+            else:
+                health = "ok"
+            stats[api_key] = {
+                "health": health,
+                "disabled_reason": state["disabled"],
+                "cooldown": max(0.0, state["cooldown_until"] - now),
+                "requests": int(state["requests"].available()),
+                "tokens": int(state["tokens"].available()),
+                "in_flight": state["in_flight"],
+                "completed": state["completed"],
+                "errors": state["errors"],
+                "tokens_used": state["tokens_used"],
+                "rate_limited": state["rate_limited"],
+            }
+        return stats
+
+
+_HEALTH_LABELS = {"ok": "정상", "cooldown": "대기", "disabled": "사용 중지"}
+
+
+def format_limiter_stats(stats):
+    """Gemini 제한기 통계를 표시용 문자열로 변환 (API 키는 끝 4자리만 표시)"""
+    lines = []
+    for api_key, s in stats.items():
+        health = _HEALTH_LABELS[s["health"]]
+        if s["health"] == "cooldown":
+            health += f" {s['cooldown']:.0f}초"
+        elif s["health"] == "disabled":
+            health += f" ({s['disabled_reason']})"
+        lines.append(
+            f"Gemini …{api_key[-4:]} [{health}]: 완료 {s['completed']}회 / 진행 {s['in_flight']}개 / "
+            f"오류 {s['errors']}회, 사용 토큰 {s['tokens_used']:,}, "
+            f"남은 요청 {s['requests']}회 / 토큰 {s['tokens']:,}, 429 대기 {s['rate_limited']}회"
+        )
+    return "\n".join(lines) or "Gemini 요청 기록 없음"
+
+
+def format_key_usage(stats):
+    """상태바용 키별 사용량 요약 (예: "…ab12 정상 12회 | …cd34 대기 3회")"""
+    return " | ".join(
+        f"…{api_key[-4:]} {_HEALTH_LABELS[s['health']]} {s['completed']}회"
+        for api_key, s in stats.items()
+    )
+
+
+_gemini_limiter = None
+_gemini_limiter_lock = threading.Lock()
+
+
+def get_gemini_limiter():
+    """프로그램 전체에서 공유하는 Gemini 제한기 반환 (.env의 GEMINI_RPM, GEMINI_TPM)"""
+    global _gemini_limiter
+    with _gemini_limiter_lock:
+        if _gemini_limiter is None:
+            _gemini_limiter = GeminiRateLimiter(
+                int(os.getenv("GEMINI_RPM", DEFAULT_GEMINI_RPM)),
+                int(os.getenv("GEMINI_TPM", DEFAULT_GEMINI_TPM)),
+            )
+        return _gemini_limiter
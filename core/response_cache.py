@@ -0,0 +1,508 @@
+"""
+    Gemini 응답 캐시 모듈
+
+    (모델명, 전체 프롬프트, 생성 설정)의 해시를 키로 생성 결과를 저장합니다.
+    최근 응답은 메모리에, 전체 응답은 SQLite 파일에 보관하며
+    각 계층은 저장 용량(바이트)을 넘으면 가장 오래 사용하지 않은 응답부터 삭제합니다.
+    캐시에 없어 실제로 호출할 때는 API 키별 공용 제한기(RPM/TPM)를 거칩니다.
+    _async로 끝나는 함수는 공용 asyncio 루프에서 실행하는 코루틴 버전입니다.
+    validate(text)를 넘기면 응답이 형식 검사를 통과한 경우에만 캐시에 저장하고,
+    캐시된 응답이 검사를 통과하지 못하면 새로 생성합니다 (잘못된 응답이 재실행마다 반복되지 않도록).
+    on_usage(usage_metadata)를 넘기면 실제로 호출한 응답의 토큰 사용량(캐시 적중 토큰 포함)을 전달합니다.
+    api_key가 키 풀(ApiKeyPool)이면 제한기가 요청마다 고른 키의 모델(model.for_key)로 호출합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from core.prompt_builder import estimate_tokens
+from core.rate_limiter import get_gemini_limiter
+from utils.utils import get_data_dir
+
+DEFAULT_MEMORY_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_DISK_MAX_BYTES = 200 * 1024 * 1024
+
+
+def make_cache_key(model_name, prompt, generation_config=None):
+    """캐시 키 (sha256 hex)"""
+    payload = json.dumps(
+        [model_name, prompt, generation_config or {}],
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """메모리 + 디스크 2단계 응답 캐시"""
+
+    def __init__(
+        self,
+        db_path,
+        memory_max_bytes=DEFAULT_MEMORY_MAX_BYTES,
+        disk_max_bytes=DEFAULT_DISK_MAX_BYTES,
+    ):
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.memory = OrderedDict()
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+        )
+        self.conn.commit()
+        self.disk_bytes = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def _remember(self, key, text, size):
+        """메모리 계층에 저장 후 용량 초과분 삭제"""
+        if key in self.memory:
+            self.memory_bytes -= self.memory.pop(key)[1]
+        if size > self.memory_max_bytes:
+            return
+        self.memory[key] = (text, size)
+        self.memory_bytes += size
+        while self.memory_bytes > self.memory_max_bytes:
+            _, (_, evicted_size) = self.memory.popitem(last=False)
+            self.memory_bytes -= evicted_size
+
+    def get(self, key):
+        """캐시된 응답 텍스트 반환 (없으면 None)"""
+        with self.lock:
+            entry = self.memory.get(key)
+            if entry is not None:
+                self.memory.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+            row = self.conn.execute(
+                "SELECT text, size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self.conn.commit()
+            self._remember(key, row[0], row[1])
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, text):
+        """응답 저장 후 디스크 용량 초과분 삭제"""
+        size = len(text.encode("utf-8"))
+        now = time.time()
+        with self.lock:
+            self._remember(key, text, size)
+
+            old = self.conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, text, size, now, now),
+            )
+            self.disk_bytes += size - (old[0] if old else 0)
+
+            if self.disk_bytes > self.disk_max_bytes:
+                freed = 0
+                evict_keys = []
+                for evict_key, evict_size in self.conn.execute(
+                    "SELECT key, size FROM responses WHERE key != ? ORDER BY accessed_at", (key,)
+                ):
+                    if self.disk_bytes - freed <= self.disk_max_bytes:
+                        break
+                    evict_keys.append((evict_key,))
+                    freed += evict_size
+                self.conn.executemany("DELETE FROM responses WHERE key = ?", evict_keys)
+                self.disk_bytes -= freed
+            self.conn.commit()
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self.lock:
+            self.memory.clear()
+            self.memory_bytes = 0
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+            self.disk_bytes = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_bytes": self.memory_bytes,
+                "disk_bytes": self.disk_bytes,
+            }
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """프로그램 전체에서 공유하는 응답 캐시 반환"""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache(
+                os.path.join(get_data_dir(), "response_cache.db"),
+                disk_max_bytes=int(os.getenv("RESPONSE_CACHE_MAX_BYTES", DEFAULT_DISK_MAX_BYTES)),
+            )
+        return _response_cache
+
+
+def _model_cache_key(model, model_name, prompt, generation_config):
+    """모델 제공자별 캐시 키 - 가짜 모델 등은 cache_prefix로 실제 응답과 구분"""
+    return make_cache_key(
+        getattr(model, "cache_prefix", "") + model_name, prompt, generation_config
+    )
+
+
+def store_response(model, model_name, prompt, text, generation_config=None):
+    """직접 모은 응답 저장 (파일로 바로 쓴 스트리밍 글을 다시 읽어 저장하는 경우 등)"""
+    get_response_cache().put(_model_cache_key(model, model_name, prompt, generation_config), text)
+
+
+def _model_for_key(model, api_key):
+    """키 풀 모델이면 제한기가 고른 키의 모델 반환"""
+    for_key = getattr(model, "for_key", None)
+    return for_key(api_key) if for_key else model
+
+
+def _usage_tokens(response):
+    """응답의 실제 사용 토큰 수 (없으면 None)"""
+    usage = getattr(response, "usage_metadata", None)
+    return getattr(usage, "total_token_count", None) or None
+
+
+def _passes(text, validate):
+    """캐시된 응답이 형식 검사를 통과하는지 여부"""
+    if validate is None:
+        return True
+    try:
+        validate(text)
+    except Exception:
+        return False
+    return True
+
+
+def _generation_kwargs(generation_config):
+    return {"generation_config": generation_config} if generation_config else {}
+
+
+def _response_text(response, on_usage, validate):
+    """응답 텍스트 - 사용량 전달 후 형식 검사 (실패하면 예외를 그대로 전달하고 캐시에 저장하지 않음)"""
+    if on_usage and getattr(response, "usage_metadata", None) is not None:
+        on_usage(response.usage_metadata)
+    text = response.text
+    if validate:
+        validate(text)
+    return text
+
+
+class _StreamState:
+    """
+    스트리밍 응답 처리 상태 (동기/비동기 공통)
+    조각마다 사용량과 텍스트를 꺼내고, 실패한 시도의 키 반납과 재시도 여부를 정합니다.
+    첫 조각을 받은 뒤의 실패는 이미 전달한 조각이 있으므로 재시도하지 않습니다.
+    """
+
+    def __init__(self, prompt, api_key, store):
+        self.api_key = api_key
+        self.limiter = get_gemini_limiter() if api_key is not None else None
+        self.tokens = estimate_tokens(prompt)
+        self.store = store
+        self.attempt = 0
+        self.received = False
+        self.chunks = []
+        self.usage = None
+        self.usage_metadata = None
+
+    def acquire(self):
+        return self.limiter.acquire(self.api_key, self.tokens) if self.limiter else None
+
+    async def acquire_async(self):
+        return await self.limiter.acquire_async(self.api_key, self.tokens) if self.limiter else None
+
+    def text(self, chunk):
+        """조각의 텍스트 (종료 정보 등 텍스트가 없는 조각은 None)"""
+        if _usage_tokens(chunk):
+            self.usage = _usage_tokens(chunk)
+            self.usage_metadata = chunk.usage_metadata
+        try:
+            text = chunk.text
+        except ValueError:
+            return None
+        if not text:
+            return None
+        self.received = True
+        if self.store:
+            self.chunks.append(text)
+        return text
+
+    def retry(self, selected_key, error):
+        """실패한 시도의 키 반납 - 다시 시도할 수 있으면 True"""
+        if self.limiter is None:
+            return False
+        self.limiter.release(selected_key, error)
+        if self.received or not self.limiter.should_retry(
+            self.api_key, selected_key, error, self.attempt
+        ):
+            return False
+        self.attempt += 1
+        return True
+
+    def release(self, selected_key):
+        if self.limiter is not None:
+            self.limiter.release(selected_key)
+
+    def finish(self, selected_key, on_usage):
+        """완료 처리 - 캐시에 저장할 전체 텍스트 반환 (store=False면 None)"""
+        if self.limiter is not None:
+            self.limiter.record_usage(selected_key, self.tokens, self.usage)
+        if on_usage and self.usage_metadata is not None:
+            on_usage(self.usage_metadata)
+        return "".join(self.chunks) if self.store else None
+
+
+def cached_generate(
+    model,
+    model_name,
+    prompt,
+    generation_config=None,
+    use_cache=True,
+    api_key=None,
+    on_usage=None,
+    validate=None,
+):
+    """
+    캐시를 거쳐 Gemini 응답 텍스트 생성 - (텍스트, 캐시 적중 여부) 반환
+    use_cache=False면 캐시를 읽지 않고 새로 생성한 결과로 캐시를 갱신합니다.
+    api_key가 주어지면 해당 키의 RPM/TPM 한도를 기다린 뒤 호출하고, 429는 재시도합니다.
+    validate(text)가 예외를 내면 캐시에 저장하지 않고 그 예외를 그대로 전달합니다.
+    """
+    cache = get_response_cache()
+    key = _model_cache_key(model, model_name, prompt, generation_config)
+    if use_cache:
+        text = cache.get(key)
+        if text is not None and _passes(text, validate):
+            return text, True
+
+    kwargs = _generation_kwargs(generation_config)
+
+    def generate(selected_key=None):
+        return _model_for_key(model, selected_key).generate_content(prompt, **kwargs)
+
+    if api_key is None:
+        response = generate()
+    else:
+        response = get_gemini_limiter().call(
+            api_key, estimate_tokens(prompt), generate, actual_tokens=_usage_tokens
+        )
+    text = _response_text(response, on_usage, validate)
+    cache.put(key, text)
+    return text, False
+
+
+def cached_generate_stream(
+    model,
+    model_name,
+    prompt,
+    generation_config=None,
+    use_cache=True,
+    api_key=None,
+    on_usage=None,
+    store=True,
+):
+    """
+    캐시를 거쳐 Gemini 응답을 스트리밍으로 생성 - 텍스트 조각을 차례로 반환하는 제너레이터
+    캐시 적중 시 전체 텍스트를 한 번에 반환하고, 스트림이 끝까지 완료된 경우에만 캐시에 저장합니다.
+    store=False면 받은 조각을 모아 두지 않고 캐시에도 저장하지 않습니다
+    (긴 글을 파일로 바로 쓰는 경우 - 완료된 파일을 읽어 store_response로 저장).
+    api_key가 주어지면 제한기를 거치며, 첫 조각을 받기 전의 429만 재시도합니다.
+    """
+    cache = get_response_cache()
+    key = _model_cache_key(model, model_name, prompt, generation_config)
+    if use_cache:
+        text = cache.get(key)
+        if text is not None:
+            yield text
+            return
+
+    kwargs = _generation_kwargs(generation_config)
+    state = _StreamState(prompt, api_key, store)
+    while True:
+        selected_key = state.acquire()
+        try:
+            key_model = _model_for_key(model, selected_key)
+            for chunk in key_model.generate_content(prompt, stream=True, **kwargs):
+                text = state.text(chunk)
+                if text:
+                    yield text
+        except Exception as e:
+            if state.retry(selected_key, e):
+                continue
+            raise
+        except BaseException:
+            # 소비자가 스트림을 중간에 닫은 경우
+            state.release(selected_key)
+            raise
+        state.release(selected_key)
+        break
+
+    text = state.finish(selected_key, on_usage)
+    if text is not None:
+        cache.put(key, text)
+
+
+async def _generate_async(model, prompt, **kwargs):
+    """모델의 generate_content_async 호출 - 없으면 실행기 스레드에서 generate_content 호출"""
+    if hasattr(model, "generate_content_async"):
+        return await model.generate_content_async(prompt, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(model.generate_content, prompt, **kwargs))
+
+
+async def _generate_stream_async(model, prompt, **kwargs):
+    """스트리밍 응답 조각을 차례로 반환하는 비동기 제너레이터"""
+    if hasattr(model, "generate_content_async"):
+        response = await model.generate_content_async(prompt, stream=True, **kwargs)
+        async for chunk in response:
+            yield chunk
+        return
+
+    # 비동기 API가 없는 모델은 실행기 스레드에서 동기 스트림을 읽어 큐로 전달
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+
+    def produce():
+        try:
+            for chunk in model.generate_content(prompt, stream=True, **kwargs):
+                loop.call_soon_threadsafe(queue.put_nowait, ("chunk", chunk))
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, ("error", e))
+        else:
+            loop.call_soon_threadsafe(queue.put_nowait, ("done", None))
+
+    loop.run_in_executor(None, produce)
+    while True:
+        kind, value = await queue.get()
+        if kind == "chunk":
+            yield value
+        elif kind == "error":
+            raise value
+        else:
+            return
+
+
+async def cached_generate_async(
+    model,
+    model_name,
+    prompt,
+    generation_config=None,
+    use_cache=True,
+    api_key=None,
+    on_usage=None,
+    validate=None,
+):
+    """
+    cached_generate의 코루틴 버전 - (텍스트, 캐시 적중 여부) 반환
+    캐시(SQLite) 읽기/쓰기는 루프를 막지 않도록 실행기 스레드에서 처리합니다.
+    """
+    from core.async_engine import run_blocking
+
+    cache = await run_blocking(get_response_cache)
+    key = _model_cache_key(model, model_name, prompt, generation_config)
+    if use_cache:
+        text = await run_blocking(cache.get, key)
+        if text is not None and _passes(text, validate):
+            return text, True
+
+    kwargs = _generation_kwargs(generation_config)
+
+    async def generate(selected_key=None):
+        return await _generate_async(_model_for_key(model, selected_key), prompt, **kwargs)
+
+    if api_key is None:
+        response = await generate()
+    else:
+        response = await get_gemini_limiter().call_async(
+            api_key, estimate_tokens(prompt), generate, actual_tokens=_usage_tokens
+        )
+    text = _response_text(response, on_usage, validate)
+    await run_blocking(cache.put, key, text)
+    return text, False
+
+
+async def cached_generate_stream_async(
+    model,
+    model_name,
+    prompt,
+    generation_config=None,
+    use_cache=True,
+    api_key=None,
+    on_usage=None,
+    store=True,
+):
+    """cached_generate_stream의 코루틴 버전 - 텍스트 조각을 차례로 반환하는 비동기 제너레이터"""
+    from core.async_engine import run_blocking
+
+    cache = await run_blocking(get_response_cache)
+    key = _model_cache_key(model, model_name, prompt, generation_config)
+    if use_cache:
+        text = await run_blocking(cache.get, key)
+        if text is not None:
+            yield text
+            return
+
+    kwargs = _generation_kwargs(generation_config)
+    state = _StreamState(prompt, api_key, store)
+    while True:
+        selected_key = await state.acquire_async()
+        try:
+            key_model = _model_for_key(model, selected_key)
+            async for chunk in _generate_stream_async(key_model, prompt, **kwargs):
+                text = state.text(chunk)
+                if text:
+                    yield text
+        except Exception as e:
+            if state.retry(selected_key, e):
+                continue
+            raise
+        except BaseException:
+            # 소비자가 스트림을 중간에 닫은 경우
+            state.release(selected_key)
+            raise
+        state.release(selected_key)
+        break
+
+    text = state.finish(selected_key, on_usage)
+    if text is not None:
+        await run_blocking(cache.put, key, text)
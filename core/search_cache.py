@@ -0,0 +1,122 @@
+"""
+    네이버 검색 결과 캐시 모듈
+
+    (키워드, 정렬, start, display) 단위로 검색 결과를 SQLite 파일에 저장합니다.
+    저장 후 TTL이 지난 결과는 사용하지 않으며,
+    최대 항목 수를 넘으면 가장 오래 사용하지 않은 결과부터 삭제합니다 (LRU).
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from utils.utils import get_data_dir
+
+DEFAULT_TTL = 6 * 60 * 60  # 6시간
+DEFAULT_MAX_ENTRIES = 5000
+
+
+class SearchCache:
+    """검색 결과 TTL/LRU 캐시"""
+
+    def __init__(self, db_path, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                keyword TEXT NOT NULL,
+                sort TEXT NOT NULL,
+                start INTEGER NOT NULL,
+                display INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (keyword, sort, start, display)
+            )
+            """
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_search_cache_accessed ON search_cache (accessed_at)"
+        )
+        self.conn.commit()
+
+    def get(self, keyword, sort, start, display):
+        """캐시된 (블로그 글 목록, 전체 결과 수) 반환 - 없거나 만료되면 None"""
+        now = time.time()
+        key = (keyword, sort, start, display)
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT payload, created_at FROM search_cache "
+                "WHERE keyword = ? AND sort = ? AND start = ? AND display = ?",
+                key,
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                return None
+
+            self.conn.execute(
+                "UPDATE search_cache SET accessed_at = ? "
+                "WHERE keyword = ? AND sort = ? AND start = ? AND display = ?",
+                (now,) + key,
+            )
+            self.conn.commit()
+            self.hits += 1
+
+        data = json.loads(row[0])
+        return data["items"], data["total"]
+
+    def put(self, keyword, sort, start, display, blog_posts, total):
+        """검색 결과 저장 후 만료/초과 항목 정리"""
+        now = time.time()
+        payload = json.dumps({"items": blog_posts, "total": total}, ensure_ascii=False)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (keyword, sort, start, display, payload, now, now),
+            )
+            self.conn.execute(
+                "DELETE FROM search_cache WHERE created_at < ?", (now - self.ttl,)
+            )
+            self.conn.execute(
+                "DELETE FROM search_cache WHERE rowid IN ("
+                "SELECT rowid FROM search_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self.conn.commit()
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self.lock:
+            self.conn.execute("DELETE FROM search_cache")
+            self.conn.commit()
+
+    def stats(self):
+        """캐시 적중/미적중 통계"""
+        with self.lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+
+_search_cache = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache():
+    """프로그램 전체에서 공유하는 검색 캐시 반환 (.env 로드 후 최초 호출 시 생성)"""
+    global _search_cache
+    with _search_cache_lock:
+        if _search_cache is None:
+            _search_cache = SearchCache(
+                os.path.join(get_data_dir(), "search_cache.db"),
+                ttl=int(os.getenv("SEARCH_CACHE_TTL", DEFAULT_TTL)),
+                max_entries=int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            )
+        return _search_cache
@@ -0,0 +1,71 @@
+"""
+    단계별 처리 시간 측정 모듈
+
+    검색(키워드 하나), 제목 생성(요청 하나), 글 생성(글 하나), 파일 저장(글 하나)마다
+    걸린 시간을 단계 이름별 히스토그램에 기록합니다.
+    GUI 워커와 명령줄 실행기가 같은 엔진을 쓰므로 어느 쪽으로 실행해도 같은 기준으로 측정됩니다.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from core.http_client import LatencyHistogram
+
+STAGE_SEARCH = "search"
+STAGE_TITLES = "titles"
+STAGE_CONTENT = "content"
+STAGE_FILE_OUTPUT = "file_output"
+# 개요 → 섹션 병렬 생성 모드: 개요 요청 하나, 서론/소제목/결론 요청 하나
+STAGE_OUTLINE = "outline"
+STAGE_SECTION = "section"
+
+# 백분위 계산에 사용할 최근 샘플 수
+MAX_SAMPLES = 10000
+
+
+class StageMetrics:
+    """단계 이름별 처리 시간 히스토그램 모음"""
+
+    def __init__(self, max_samples=MAX_SAMPLES):
+        self.max_samples = max_samples
+        self.stages = {}
+        self.lock = threading.Lock()
+
+    def record(self, stage, elapsed_ms):
+        with self.lock:
+            histogram = self.stages.get(stage)
+            if histogram is None:
+                histogram = self.stages[stage] = LatencyHistogram(max_samples=self.max_samples)
+        histogram.record(elapsed_ms)
+
+    @contextmanager
+    def timed(self, stage):
+        """with 블록 실행 시간 기록 (예외로 끝나도 기록)"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(stage, (time.monotonic() - started) * 1000)
+
+    def reset(self):
+        with self.lock:
+            self.stages = {}
+
+    def snapshot(self):
+        """단계별 {count, p50, p95, p99, histogram}"""
+        with self.lock:
+            stages = dict(self.stages)
+        return {stage: h.snapshot() for stage, h in stages.items()}
+
+
+_stage_metrics = None
+_stage_metrics_lock = threading.Lock()
+
+
+def get_stage_metrics():
+    """프로그램 전체에서 공유하는 단계별 처리 시간 기록 반환"""
+    global _stage_metrics
+    with _stage_metrics_lock:
+        if _stage_metrics is None:
+            _stage_metrics = StageMetrics()
+        return _stage_metrics
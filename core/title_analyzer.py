@@ -0,0 +1,119 @@
+"""
+    블로그 제목 패턴 분석 모듈
+
+    검색된 글 전체의 제목을 한 번 순회하며 길이 분포, 자주 쓰인 단어/단어쌍,
+    질문형/리스트형/비교형 등 제목 패턴 빈도를 계산합니다.
+    결과는 format_analysis로 짧은 요약문이 되어 제목 생성 프롬프트에 들어갑니다.
+"""
+
+import re
+from collections import Counter
+
+_TOKEN_PATTERN = re.compile(r"[가-힣A-Za-z0-9]+")
+_PARTICLE_SUFFIXES = ("에서", "으로", "까지", "부터", "은", "는", "이", "가", "을", "를", "의", "에", "로", "와", "과", "도")
+
+# 제목 패턴 (이름, 표시명, 정규식)
+TITLE_PATTERNS = [
+    ("question", "질문형", re.compile(r"\?|어떻게|왜 |무엇|뭘까|할까|일까|인가요|나요")),
+    ("list", "리스트형", re.compile(r"\d+\s*(가지|개|곳|선|위|단계|종)|TOP\s*\d+|BEST\s*\d+", re.I)),
+    ("comparison", "비교형", re.compile(r"\bvs\b|VS|비교|차이|장단점")),
+    ("howto", "방법/가이드형", re.compile(r"방법|하는 ?법|가이드|총정리|정리|꿀팁|팁")),
+    ("review", "후기/리뷰형", re.compile(r"후기|리뷰|내돈내산|솔직")),
+    ("emotional", "감성/강조형", re.compile(r"!|최고|진짜|완벽|강추|필수|놓치")),
+    ("bracket", "말머리 사용", re.compile(r"[\[\]【】()<>]")),
+    ("year", "연도 표기", re.compile(r"20\d\d")),
+]
+
+LENGTH_BUCKETS = [(0, 20, "20자 이하"), (21, 30, "21~30자"), (31, 40, "31~40자"), (41, 10**6, "41자 이상")]
+
+
+def _tokens(title):
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(title.lower()):
+        for suffix in _PARTICLE_SUFFIXES:
+            if len(token) > len(suffix) + 1 and token.endswith(suffix):
+                token = token[: -len(suffix)]
+                break
+        if len(token) >= 2:
+            tokens.append(token)
+    return tokens
+
+
+def _percentile(sorted_values, p):
+    if not sorted_values:
+        return 0
+    index = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def analyze_titles(blog_posts, top_n=15):
+    """제목 특징 분석 결과 딕셔너리 반환"""
+    lengths = []
+    words = Counter()
+    bigrams = Counter()
+    pattern_counts = Counter()
+
+    for post in blog_posts:
+        title = post.get("title", "")
+        if not title:
+            continue
+        lengths.append(len(title))
+
+        tokens = _tokens(title)
+        # 한 제목 안에서 반복된 단어는 한 번만 집계
+        words.update(set(tokens))
+        bigrams.update(set(zip(tokens, tokens[1:])))
+
+        for name, _, pattern in TITLE_PATTERNS:
+            if pattern.search(title):
+                pattern_counts[name] += 1
+
+    lengths.sort()
+    total = len(lengths)
+    return {
+        "count": total,
+        "length": {
+            "mean": round(sum(lengths) / total, 1) if total else 0,
+            "p10": _percentile(lengths, 10),
+            "median": _percentile(lengths, 50),
+            "p90": _percentile(lengths, 90),
+            "buckets": {
+                label: sum(1 for n in lengths if low <= n <= high)
+                for low, high, label in LENGTH_BUCKETS
+            },
+        },
+        "top_words": words.most_common(top_n),
+        "top_bigrams": [(" ".join(pair), n) for pair, n in bigrams.most_common(top_n // 2)],
+        "patterns": {name: pattern_counts[name] for name, _, _ in TITLE_PATTERNS},
+    }
+
+
+def format_analysis(analysis):
+    """분석 결과를 프롬프트용 요약문으로 변환"""
+    total = analysis["count"]
+    if not total:
+        return "분석할 제목이 없습니다."
+
+    def ratio(n):
+        return f"{n * 100 // total}%"
+
+    length = analysis["length"]
+    buckets = ", ".join(f"{label} {ratio(n)}" for label, n in length["buckets"].items())
+    labels = {name: label for name, label, _ in TITLE_PATTERNS}
+    patterns = ", ".join(
+        f"{labels[name]} {ratio(n)}"
+        for name, n in sorted(analysis["patterns"].items(), key=lambda x: -x[1])
+        if n
+    )
+    words = ", ".join(f"{word}({n})" for word, n in analysis["top_words"])
+    bigrams = ", ".join(f"{pair}({n})" for pair, n in analysis["top_bigrams"])
+
+    lines = [
+        f"- 분석한 제목 수: {total}개",
+        f"- 제목 길이: 평균 {length['mean']}자, 중앙값 {length['median']}자 "
+        f"(10~90%: {length['p10']}~{length['p90']}자) / {buckets}",
+        f"- 자주 쓰인 단어: {words or '없음'}",
+        f"- 자주 쓰인 표현: {bigrams or '없음'}",
+        f"- 제목 패턴 비율: {patterns or '특정 패턴 없음'}",
+    ]
+    return "\n".join(lines)
@@ -0,0 +1,304 @@
+"""
+    블로그 제목 생성 프롬프트/응답 처리 모듈
+
+    단일 키워드: 번호 목록 형태의 응답을 정규식으로 파싱
+    다중 키워드: 여러 키워드의 분석 결과를 한 번에 보내고
+                 구조화된 JSON 응답(키워드별 제목 배열)을 엄격하게 파싱
+"""
+
+import asyncio
+import json
+import re
+from core.prompt_builder import PromptBuilder, estimate_tokens
+from core.response_cache import cached_generate, cached_generate_async
+from core.stage_metrics import STAGE_TITLES, get_stage_metrics
+from core.title_analyzer import analyze_titles, format_analysis
+
+TITLE_MODEL_NAME = "gemini-2.0-flash-exp"
+
+# 제목 하나당 예상 출력 토큰 수 (비용 추정용)
+OUTPUT_TOKENS_PER_TITLE = 40
+
+# "1. 제목", "2) 제목", "- 제목" 형태의 줄에서 앞의 표시만 제거
+_NUMBERED_LINE_PATTERN = re.compile(r"^\s*\**\s*(?:\d+\s*[.)]\s*|[-*•]\s+)(.+?)\s*$")
+
+# 다중 키워드 응답 스키마 (Gemini structured output)
+BATCH_TITLE_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "keyword": {"type": "string"},
+            "titles": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["keyword", "titles"],
+    },
+}
+
+
+class TitleParseError(Exception):
+    """제목 생성 응답 형식 오류"""
+
+
+def build_title_prompt(blog_posts, count, budget=None, counter=estimate_tokens):
+    """
+    단일 키워드 제목 생성 프롬프트 - 예산을 넘으면 대표 제목, 분석 결과 순으로 줄임
+    counter는 예산 검사용 토큰 계산기 (get_token_counter)
+    """
+    # 검색된 글 전체의 제목 패턴을 로컬에서 분석
+    analysis = format_analysis(analyze_titles(blog_posts))
+    sample_titles = "\n".join(
+        f"{i}. {post['title']}" for i, post in enumerate(blog_posts[:5], 1)
+    )
+
+    builder = PromptBuilder(budget, counter)
+    builder.add(
+        "header",
+        "다음은 특정 키워드로 검색한 상위 블로그 글들의 제목을 분석한 결과입니다:",
+        required=True,
+    )
+    builder.add("analysis", analysis, priority=2)
+    builder.add("samples", f"대표 제목:\n{sample_titles}", priority=1)
+    builder.add(
+        "instruction",
+        f"""
+        위 분석 결과(길이, 핵심 키워드, 제목 패턴)를 참고하여
+        SEO에 최적화되고 클릭률이 높은 블로그 제목을 {count}개 생성해주세요.
+        독자의 관심을 끄는 표현(감정적 표현, 호기심 유발 등)을 적절히 활용해주세요.
+
+        제목만 번호와 함께 나열해주세요.
+        """,
+        required=True,
+    )
+    prompt, _, _ = builder.build()
+    return prompt
+
+
+def parse_numbered_line(line):
+    """번호 목록 한 줄에서 제목 추출 (형식이 아니면 None)"""
+    match = _NUMBERED_LINE_PATTERN.match(line)
+    if not match:
+        return None
+    return match.group(1).strip("*\"' ") or None
+
+
+def parse_numbered_titles(text):
+    """번호 목록 응답에서 제목 목록 추출"""
+    titles = []
+    for line in text.strip().split("\n"):
+        title = parse_numbered_line(line)
+        if title:
+            titles.append(title)
+    return titles
+
+
+def group_posts_by_keyword(blog_posts):
+    """키워드 태그별로 글 묶기 (처음 등장한 키워드 순서 유지)"""
+    groups = {}
+    for post in blog_posts:
+        groups.setdefault(post.get("keyword", ""), []).append(post)
+    return groups
+
+
+def build_batch_title_prompt(corpora, count, budget=None, counter=estimate_tokens):
+    """
+    다중 키워드 제목 생성 프롬프트 - corpora: {키워드: 블로그 글 목록}
+    예산을 넘으면 키워드별 대표 제목, 분석 결과 순으로 줄임
+    """
+    builder = PromptBuilder(budget, counter)
+    builder.add(
+        "header",
+        "다음은 여러 키워드로 검색한 상위 블로그 글 제목을 키워드별로 분석한 결과입니다.",
+        required=True,
+    )
+    for keyword, blog_posts in corpora.items():
+        sample_titles = "\n".join(f"  - {post['title']}" for post in blog_posts[:3])
+        builder.add(f"keyword:{keyword}", f"### 키워드: {keyword}", required=True)
+        builder.add(f"analysis:{keyword}", format_analysis(analyze_titles(blog_posts)), priority=2)
+        builder.add(f"samples:{keyword}", f"- 대표 제목:\n{sample_titles}", priority=1)
+
+    keywords = ", ".join(json.dumps(keyword, ensure_ascii=False) for keyword in corpora)
+    builder.add(
+        "instruction",
+        "각 키워드마다 분석 결과(길이, 핵심 키워드, 제목 패턴)를 참고하여 "
+        f"SEO에 최적화되고 클릭률이 높은 블로그 제목을 {count}개씩 생성해주세요.\n"
+        f"keyword 값은 다음 중 하나를 그대로 사용하세요: {keywords}\n"
+        "각 제목은 번호나 기호 없이 제목 문장만 작성하세요.",
+        required=True,
+    )
+    prompt, _, _ = builder.build()
+    return prompt
+
+
+def build_batch_title_requests(
+    corpora, count, keywords_per_request=5, budget=None, counter=estimate_tokens
+):
+    """키워드를 요청 단위로 나누어 [(키워드 목록, 프롬프트)] 반환"""
+    keywords = list(corpora)
+    requests = []
+    for i in range(0, len(keywords), keywords_per_request):
+        chunk = keywords[i : i + keywords_per_request]
+        prompt = build_batch_title_prompt(
+            {keyword: corpora[keyword] for keyword in chunk}, count, budget, counter
+        )
+        requests.append((chunk, prompt))
+    return requests
+
+
+def batch_generation_config():
+    """다중 키워드 요청에 사용할 structured output 설정"""
+    return {
+        "response_mime_type": "application/json",
+        "response_schema": BATCH_TITLE_SCHEMA,
+    }
+
+
+def parse_batch_titles(text, keywords):
+    """
+    다중 키워드 JSON 응답 파싱 - {키워드: 제목 목록} 반환
+    스키마와 다르거나 요청하지 않은 키워드가 있으면 TitleParseError
+    """
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise TitleParseError(f"JSON 형식이 아닙니다: {e}")
+
+    if not isinstance(data, list):
+        raise TitleParseError("응답 최상위가 배열이 아닙니다.")
+
+    expected = set(keywords)
+    results = {}
+    for entry in data:
+        if not isinstance(entry, dict):
+            raise TitleParseError("배열 항목이 객체가 아닙니다.")
+        keyword = entry.get("keyword")
+        titles = entry.get("titles")
+        if keyword not in expected:
+            raise TitleParseError(f"요청하지 않은 키워드입니다: {keyword}")
+        if not isinstance(titles, list) or not all(isinstance(t, str) for t in titles):
+            raise TitleParseError(f"'{keyword}'의 titles가 문자열 배열이 아닙니다.")
+        results.setdefault(keyword, []).extend(t.strip() for t in titles if t.strip())
+    return results
+
+
+def generate_titles(model, prompt, use_cache=True, api_key=None):
+    """단일 키워드 제목 생성 - (제목 목록, 캐시 적중 여부) 반환"""
+    with get_stage_metrics().timed(STAGE_TITLES):
+        text, cache_hit = cached_generate(
+            model, TITLE_MODEL_NAME, prompt, use_cache=use_cache, api_key=api_key
+        )
+    return parse_numbered_titles(text), cache_hit
+
+
+async def generate_titles_async(model, prompt, use_cache=True, api_key=None):
+    """generate_titles의 코루틴 버전"""
+    with get_stage_metrics().timed(STAGE_TITLES):
+        text, cache_hit = await cached_generate_async(
+            model, TITLE_MODEL_NAME, prompt, use_cache=use_cache, api_key=api_key
+        )
+    return parse_numbered_titles(text), cache_hit
+
+
+def _batch_request_kwargs(chunk, use_cache, api_key):
+    """요청 하나의 cached_generate 인자 - 형식이 올바른 응답만 캐시에 저장"""
+    return {
+        "generation_config": batch_generation_config(),
+        "use_cache": use_cache,
+        "api_key": api_key,
+        "validate": lambda text: parse_batch_titles(text, chunk),
+    }
+
+
+def _report_chunk_titles(chunk, chunk_titles, results, on_keyword_done, on_keyword_failed):
+    """요청 하나의 파싱 결과를 키워드별로 results에 넣고 콜백 호출"""
+    for keyword in chunk:
+        titles = chunk_titles.get(keyword)
+        if titles:
+            results[keyword] = titles
+            if on_keyword_done:
+                on_keyword_done(keyword, titles)
+        elif on_keyword_failed:
+            on_keyword_failed(keyword, "응답에 제목이 없습니다.")
+
+
+def _report_chunk_error(chunk, error, on_keyword_failed):
+    if on_keyword_failed:
+        for keyword in chunk:
+            on_keyword_failed(keyword, f"제목 생성 오류: {str(error)}")
+
+
+def generate_batch_titles(
+    model,
+    requests,
+    use_cache=True,
+    api_key=None,
+    on_request=None,
+    on_keyword_done=None,
+    on_keyword_failed=None,
+):
+    """
+    build_batch_title_requests 결과를 차례로 요청 - {키워드: 제목 목록} 반환
+    on_request(번호, 전체 요청 수)는 요청 전에, on_keyword_done(keyword, titles),
+    on_keyword_failed(keyword, error)는 응답을 파싱한 뒤 키워드마다 호출됩니다.
+    """
+    results = {}
+    for index, (chunk, prompt) in enumerate(requests, 1):
+        if on_request:
+            on_request(index, len(requests))
+        try:
+            with get_stage_metrics().timed(STAGE_TITLES):
+                text, _ = cached_generate(
+                    model,
+                    TITLE_MODEL_NAME,
+                    prompt,
+                    **_batch_request_kwargs(chunk, use_cache, api_key),
+                )
+            chunk_titles = parse_batch_titles(text, chunk)
+        except Exception as e:
+            _report_chunk_error(chunk, e, on_keyword_failed)
+            continue
+
+        _report_chunk_titles(chunk, chunk_titles, results, on_keyword_done, on_keyword_failed)
+    return results
+
+
+async def generate_batch_titles_async(
+    model,
+    requests,
+    use_cache=True,
+    api_key=None,
+    on_request=None,
+    on_keyword_done=None,
+    on_keyword_failed=None,
+):
+    """
+    generate_batch_titles의 코루틴 버전 - 요청들을 차례로 보내지 않고 동시에 보냄
+    on_keyword_done은 실행기 스레드에서 호출하므로 제목 색인 기록 같은 블로킹 작업을 해도 됩니다.
+    """
+    from core.async_engine import run_blocking
+
+    results = {}
+
+    async def run_request(index, chunk, prompt):
+        if on_request:
+            on_request(index, len(requests))
+        try:
+            with get_stage_metrics().timed(STAGE_TITLES):
+                text, _ = await cached_generate_async(
+                    model,
+                    TITLE_MODEL_NAME,
+                    prompt,
+                    **_batch_request_kwargs(chunk, use_cache, api_key),
+                )
+            chunk_titles = parse_batch_titles(text, chunk)
+        except Exception as e:
+            _report_chunk_error(chunk, e, on_keyword_failed)
+            return
+        await run_blocking(
+            _report_chunk_titles, chunk, chunk_titles, results, on_keyword_done, on_keyword_failed
+        )
+
+    await asyncio.gather(
+        *(run_request(index, chunk, prompt) for index, (chunk, prompt) in enumerate(requests, 1))
+    )
+    return results
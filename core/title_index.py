@@ -0,0 +1,180 @@
+"""
+    생성 제목 중복 색인 모듈
+
+    지금까지 생성한 제목을 SQLite 파일에 누적 저장하고,
+    새 제목과 문자 n-gram 자카드 유사도가 높은 기존 제목이 있는지 찾습니다.
+    제목마다 MinHash 서명을 band로 나눈 해시를 색인 테이블에 저장하므로
+    조회는 band 수만큼의 색인 탐색과 후보 서명 비교만으로 끝나고, 제목 전체를 메모리에 올리지 않습니다.
+    같은 키워드의 제목은 키워드 n-gram 때문에 여러 band를 통째로 공유하므로 (core.minhash.LSHIndex와 같이)
+    band마다 최근 MAX_BUCKET개만 보고, MIN_BANDS개 이상 겹친 제목을 겹친 수가 많은 순으로
+    MAX_CANDIDATES개까지만 비교하여 제목이 많이 쌓여도 조회 비용을 일정하게 유지합니다.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from array import array
+from core.minhash import MinHasher, char_shingles
+from utils.utils import get_data_dir
+
+# 제목은 짧으므로 64구간 서명을 16 band x 4 row로 나눔 (유사도 약 0.5부터 후보)
+TITLE_NUM_BINS = 64
+TITLE_BANDS = 16
+TITLE_ROWS = 4
+DEFAULT_THRESHOLD = 0.7
+
+# 후보 조회 상한 - band별 최근 제목 수, 후보가 되는 최소 겹친 band 수, 비교할 최대 후보 수
+MAX_BUCKET = 64
+MIN_BANDS = 2
+MAX_CANDIDATES = 32
+
+# band마다 최근 MAX_BUCKET개 제목을 모아 겹친 band 수로 후보 선정
+_BUCKET_SQL = (
+    "SELECT * FROM (SELECT title_id FROM title_bands"
+    f" WHERE band_key = ? ORDER BY title_id DESC LIMIT {MAX_BUCKET})"
+)
+_CANDIDATES_SQL = f"""
+    SELECT title, signature FROM titles WHERE id IN (
+        SELECT title_id FROM ({" UNION ALL ".join([_BUCKET_SQL] * TITLE_BANDS)})
+        GROUP BY title_id HAVING COUNT(*) >= {MIN_BANDS}
+        ORDER BY COUNT(*) DESC LIMIT {MAX_CANDIDATES}
+    )
+"""
+
+
+def _pack_signature(signature):
+    """서명을 32비트 배열 바이트열로 변환 (하위 32비트만 비교에 사용)"""
+    return array("I", (value & 0xFFFFFFFF for value in signature)).tobytes()
+
+
+def _band_keys(packed):
+    """band별 색인 키 - 상위 비트는 band 번호, 하위 32비트는 band 바이트열의 crc32"""
+    width = TITLE_ROWS * 4
+    return [
+        (band << 32) | zlib.crc32(packed[band * width : (band + 1) * width])
+        for band in range(TITLE_BANDS)
+    ]
+
+
+def _packed_similarity(packed1, packed2):
+    """두 압축 서명의 추정 자카드 유사도"""
+    sig1 = array("I", packed1)
+    sig2 = array("I", packed2)
+    return sum(1 for a, b in zip(sig1, sig2) if a == b) / len(sig1)
+
+
+class TitleIndex:
+    """생성 제목 유사 중복 색인"""
+
+    def __init__(self, db_path, threshold=DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.hasher = MinHasher(TITLE_NUM_BINS)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS titles (
+                id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL UNIQUE,
+                signature BLOB NOT NULL,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS title_bands (
+                band_key INTEGER NOT NULL,
+                title_id INTEGER NOT NULL,
+                PRIMARY KEY (band_key, title_id)
+            ) WITHOUT ROWID;
+            """
+        )
+        self.conn.commit()
+
+    def _signature(self, title):
+        return _pack_signature(self.hasher.signature(char_shingles(title)))
+
+    def _find(self, title, packed):
+        """가장 유사한 기존 제목 (제목, 유사도) - 임계값 미만이면 None"""
+        if self.conn.execute("SELECT 1 FROM titles WHERE title = ?", (title,)).fetchone():
+            return title, 1.0
+
+        rows = self.conn.execute(_CANDIDATES_SQL, _band_keys(packed)).fetchall()
+
+        best = None
+        for other_title, other_packed in rows:
+            score = _packed_similarity(packed, other_packed)
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (other_title, score)
+        return best
+
+    def _insert(self, title, packed, now):
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO titles (title, signature, created_at) VALUES (?, ?, ?)",
+            (title, packed, now),
+        )
+        if cursor.rowcount:
+            title_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO title_bands VALUES (?, ?)",
+                [(key, title_id) for key in _band_keys(packed)],
+            )
+
+    def find_similar(self, title):
+        """유사한 기존 제목 (제목, 유사도) 반환 - 없으면 None"""
+        packed = self._signature(title)
+        with self.lock:
+            return self._find(title, packed)
+
+    def add(self, titles):
+        """제목 저장 (이미 있는 제목은 무시)"""
+        now = time.time()
+        with self.lock:
+            for title in titles:
+                self._insert(title, self._signature(title), now)
+            self.conn.commit()
+
+    def check_and_add(self, titles):
+        """
+        새 제목마다 [(제목, 유사한 기존 제목 또는 None, 유사도)] 반환
+        중복이 아닌 제목은 바로 저장되므로 같은 목록 안의 비슷한 제목도 걸러집니다.
+        """
+        now = time.time()
+        results = []
+        with self.lock:
+            for title in titles:
+                packed = self._signature(title)
+                match = self._find(title, packed)
+                if match:
+                    results.append((title, match[0], match[1]))
+                else:
+                    self._insert(title, packed, now)
+                    results.append((title, None, 0.0))
+            self.conn.commit()
+        return results
+
+    def count(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM titles").fetchone()[0]
+
+    def clear(self):
+        """저장된 제목 전체 삭제"""
+        with self.lock:
+            self.conn.execute("DELETE FROM titles")
+            self.conn.execute("DELETE FROM title_bands")
+            self.conn.commit()
+
+
+_title_index = None
+_title_index_lock = threading.Lock()
+
+
+def get_title_index():
+    """프로그램 전체에서 공유하는 제목 색인 반환"""
+    global _title_index
+    with _title_index_lock:
+        if _title_index is None:
+            _title_index = TitleIndex(
+                os.path.join(get_data_dir(), "title_index.db"),
+                threshold=float(os.getenv("TITLE_DUP_THRESHOLD", DEFAULT_THRESHOLD)),
+            )
+        return _title_index
@@ -3,171 +3,598 @@
 
     이 모듈은 블로그 생성기의 모든 백그라운드 작업을 처리하는 워커 클래스들을 포함합니다.
     NaverSearchWorker: 네이버 블로그 검색
+    BatchSearchWorker: 다중 키워드 일괄 검색
     TitleGenerateWorker: AI 제목 생성
-    ContentGenerateWorker: AI 글 생성
+    BatchTitleGenerateWorker: 다중 키워드 AI 제목 일괄 생성
+    BatchContentGenerateWorker: 여러 제목 AI 글 동시 생성
     TistoryPublishWorker: 티스토리 발행
+
+    Async로 시작하는 워커는 같은 신호를 가진 비동기 버전으로, 작업마다 스레드를 만들지 않고
+    공용 asyncio 루프(core.async_engine)에서 코루틴으로 실행합니다 (.env의 NETWORK_ENGINE=async).
+    두 버전은 _...Job 클래스의 진행 표시/결과 처리를 공유하고, 네트워크 호출 부분만 다릅니다.
 """
 
+import concurrent.futures
 import os
-import requests
 from datetime import datetime
-from PyQt5.QtCore import QThread, pyqtSignal
-import google.generativeai as genai
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, UnexpectedAlertPresentException
 import time
-
-class NaverSearchWorker(QThread):
+from core.batch_search import BatchSearchEngine
+from core.async_engine import get_async_engine, run_blocking
+from core.content_generation import DEFAULT_MAX_IN_FLIGHT, BatchContentEngine
+from core.llm_provider import get_llm_model
+from core.naver_search import (
+    MAX_RESULTS,
+    NaverSearchError,
+    deep_search,
+    deep_search_async,
+    incremental_search,
+    search_blog_page,
+    search_blog_page_async,
+)
+from core.normalizer import dedupe_posts
+from core.post_store import get_post_store
+from core.prompt_builder import get_token_budget, get_token_counter, use_exact_token_count
+from core.response_cache import cached_generate_stream, cached_generate_stream_async
+from core.title_generation import (
+    TITLE_MODEL_NAME,
+    build_batch_title_requests,
+    build_title_prompt,
+    generate_batch_titles,
+    generate_batch_titles_async,
+    generate_titles,
+    generate_titles_async,
+    group_posts_by_keyword,
+    parse_numbered_line,
+)
+from core.title_index import get_title_index
+
+
+def use_async_engine():
+    """.env의 NETWORK_ENGINE=async면 검색/생성 워커 대신 비동기 워커 사용"""
+    return os.getenv("NETWORK_ENGINE", "thread").lower() == "async"
+
+
+class _NaverSearchJob:
+    """네이버 검색 워커 공통 부분 - 검색 호출을 뺀 진행 표시와 결과 처리"""
+
+    def __init__(
+        self,
+        keyword,
+        client_id,
+        client_secret,
+        deep=False,
+        max_results=MAX_RESULTS,
+        use_cache=True,
+        incremental=False,
+    ):
+        super().__init__()
+        self.keyword = keyword
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.deep = deep
+        self.max_results = max_results
+        self.use_cache = use_cache
+        self.incremental = incremental
+        self.received_count = 0
+
+    def search_args(self):
+        return self.keyword, self.client_id, self.client_secret
+
+    def deep_kwargs(self):
+        return {"max_results": self.max_results, "on_page": self.on_page, "use_cache": self.use_cache}
+
+    def page_kwargs(self):
+        return {"display": 20, "use_cache": self.use_cache}
+
+    def search_incremental(self):
+        """증분 검색 - 워터마크 확인과 저장소 병합이 순서대로 이어지는 블로킹 작업"""
+        store = get_post_store()
+        new_posts, request_count = incremental_search(
+            self.keyword,
+            self.client_id,
+            self.client_secret,
+            store,
+            max_results=self.max_results,
+        )
+        blog_posts = store.get_posts(self.keyword, limit=self.max_results)
+        self.progress.emit(
+            f"새 글 {len(new_posts)}개 수집 (요청 {request_count}회), 누적 {len(blog_posts)}개"
+        )
+        return blog_posts
+
+    def finish(self, blog_posts):
+        """중복 제거 후 저장소에 보관하고 완료 신호 전달 (증분 검색 결과는 이미 저장됨)"""
+        found_count = len(blog_posts)
+        blog_posts = dedupe_posts(blog_posts)
+        if not self.incremental:
+            get_post_store().add_posts(self.keyword, blog_posts)
+            self.progress.emit(
+                f"검색 완료: {len(blog_posts)}개 글 발견 (중복 {found_count - len(blog_posts)}개 제거)"
+            )
+        self.search_completed.emit(blog_posts)
+
+    def fail(self, error):
+        if isinstance(error, NaverSearchError):
+            self.search_failed.emit(str(error))
+        else:
+            self.search_failed.emit(f"검색 오류: {str(error)}")
+
+    def on_page(self, start, blog_posts):
+        """페이지 도착 시 부분 결과 전달"""
+        self.received_count += len(blog_posts)
+        self.page_received.emit(blog_posts)
+        self.progress.emit(f"네이버 블로그 검색 중... ({self.received_count}개 수신)")
+
+
+class NaverSearchWorker(_NaverSearchJob, QThread):
     """네이버 블로그 검색 워커"""
 
     search_completed = pyqtSignal(list)
     search_failed = pyqtSignal(str)
     progress = pyqtSignal(str)
-
-    def __init__(self, keyword, client_id, client_secret):
-        super().__init__()
-        self.keyword = keyword
-        self.client_id = client_id
-        self.client_secret = client_secret
+    page_received = pyqtSignal(list)  # 딥 검색 시 페이지 단위 부분 결과
 
     def run(self):
         try:
             self.progress.emit("네이버 블로그 검색 중...")
 
-            url = "https://openapi.naver.com/v1/search/blog"
-            headers = {
-                "X-Naver-Client-Id": self.client_id,
-                "X-Naver-Client-Secret": self.client_secret,
-            }
-            params = {"query": self.keyword, "display": 20, "sort": "sim"}
-
-            response = requests.get(url, headers=headers, params=params)
-
-            if response.status_code == 200:
-                data = response.json()
-                blog_posts = []
-
-                for item in data.get("items", []):
-                    blog_post = {
-                        "title": item.get("title", "")
-                        .replace("<b>", "")
-                        .replace("</b>", ""),
-                        "description": item.get("description", "")
-                        .replace("<b>", "")
-                        .replace("</b>", ""),
-                        "link": item.get("link", ""),
-                        "bloggername": item.get("bloggername", ""),
-                        "postdate": item.get("postdate", ""),
-                    }
-                    blog_posts.append(blog_post)
-
-                self.progress.emit(f"검색 완료: {len(blog_posts)}개 글 발견")
-                self.search_completed.emit(blog_posts)
+            if self.incremental:
+                blog_posts = self.search_incremental()
+            elif self.deep:
+                blog_posts = deep_search(*self.search_args(), **self.deep_kwargs())
             else:
-                self.search_failed.emit(f"네이버 API 오류: {response.status_code}")
+                blog_posts, _ = search_blog_page(*self.search_args(), **self.page_kwargs())
+
+            self.finish(blog_posts)
 
         except Exception as e:
-            self.search_failed.emit(f"검색 오류: {str(e)}")
+            self.fail(e)
+
+
+class _BatchSearchJob:
+    """다중 키워드 일괄 검색 워커 공통 부분"""
+
+    def __init__(self, keywords, client_id, client_secret, max_in_flight=4, deep=False):
+        super().__init__()
+        self.keywords = keywords
+        self.done_count = 0
+        self.engine = BatchSearchEngine(
+            client_id, client_secret, max_in_flight=max_in_flight, deep=deep
+        )
+
+    def begin(self):
+        self.progress.emit(f"{len(self.keywords)}개 키워드 일괄 검색 중...")
+        return {"on_keyword_done": self.on_keyword_done, "on_keyword_failed": self.on_keyword_failed}
+
+    def finish(self, blog_posts):
+        self.progress.emit(f"일괄 검색 완료: {len(blog_posts)}개 글 발견")
+        self.batch_completed.emit(blog_posts)
+
+    def stop(self):
+        """남은 키워드 검색 취소"""
+        self.engine.stop()
+
+    def on_keyword_done(self, keyword, blog_posts):
+        self.done_count += 1
+        self.keyword_completed.emit(keyword, blog_posts)
+        self.progress.emit(f"일괄 검색 중... ({self.done_count}/{len(self.keywords)}) {keyword}")
+
+    def on_keyword_failed(self, keyword, error):
+        self.done_count += 1
+        self.keyword_failed.emit(keyword, error)
+
 
-class TitleGenerateWorker(QThread):
+class BatchSearchWorker(_BatchSearchJob, QThread):
+    """다중 키워드 일괄 검색 워커"""
+
+    keyword_completed = pyqtSignal(str, list)  # keyword, blog_posts
+    keyword_failed = pyqtSignal(str, str)  # keyword, error
+    batch_completed = pyqtSignal(list)
+    progress = pyqtSignal(str)
+
+    def run(self):
+        callbacks = self.begin()
+        self.finish(self.engine.run(self.keywords, **callbacks))
+
+
+class _TitleGenerateJob:
+    """제목 생성 워커 공통 부분 - 프롬프트 준비, 스트리밍 줄 처리, 결과 전달"""
+
+    def __init__(self, blog_posts, count, api_key, use_cache=True, stream=False):
+        super().__init__()
+        self.blog_posts = blog_posts
+        self.count = count
+        self.api_key = api_key
+        self.use_cache = use_cache
+        self.stream = stream
+
+    def prepare(self):
+        """(모델, 프롬프트) - 정확한 토큰 수를 세면 API를 호출하므로 블로킹 작업"""
+        self.progress.emit("제목 생성 중...")
+
+        model = get_llm_model(self.api_key, TITLE_MODEL_NAME)
+
+        # 정확한 토큰 계산이 켜져 있으면 count_tokens 기준으로 예산을 검사 (같은 프롬프트는 다시 요청하지 않음)
+        counter = get_token_counter(model)
+        prompt = build_title_prompt(self.blog_posts, self.count, get_token_budget(), counter)
+        if use_exact_token_count():
+            self.progress.emit(f"제목 생성 중... (입력 {counter(prompt):,}토큰)")
+        self.streamed_titles = []
+        self.buffer = ""
+        return model, prompt
+
+    def request_kwargs(self):
+        return {"use_cache": self.use_cache, "api_key": self.api_key}
+
+    def receive(self, chunk):
+        """스트리밍 응답 조각 - 새로 완성된 줄의 제목 목록 반환"""
+        self.buffer += chunk
+        *lines, self.buffer = self.buffer.split("\n")
+        return [title for title in map(parse_numbered_line, lines) if title]
+
+    def end_stream(self):
+        """마지막 줄의 제목 목록 반환"""
+        title = parse_numbered_line(self.buffer)
+        self.buffer = ""
+        return [title] if title else []
+
+    def check_titles(self, titles):
+        """이전 제목 색인과 비교 후 저장 - [(제목, 유사 제목 또는 None, 유사도)] (SQLite 블로킹 작업)"""
+        return get_title_index().check_and_add(titles)
+
+    def emit_streamed(self, titles):
+        """스트리밍 중 완성된 제목을 색인과 비교하여 전달"""
+        if not titles:
+            return
+        checked = self.check_titles(titles)
+        self.streamed_titles.extend(checked)
+        self.title_streamed.emit(checked)
+        self.progress.emit(f"제목 생성 중... ({len(self.streamed_titles)}/{self.count})")
+
+    def finish(self, checked, cache_hit=False):
+        cache_note = " (캐시)" if cache_hit else ""
+        self.progress.emit(f"제목 생성 완료: {len(checked)}개{cache_note}")
+        self.titles_generated.emit(checked)
+
+    def fail(self, error):
+        self.generation_failed.emit(f"제목 생성 오류: {str(error)}")
+
+
+class TitleGenerateWorker(_TitleGenerateJob, QThread):
     """블로그 제목 생성 워커"""
 
-    titles_generated = pyqtSignal(list)
+    titles_generated = pyqtSignal(list)  # [(제목, 유사 제목 또는 None, 유사도)]
+    title_streamed = pyqtSignal(list)  # 스트리밍 모드에서 새로 완성된 줄의 제목 (형식 동일)
     generation_failed = pyqtSignal(str)
     progress = pyqtSignal(str)
 
-    def __init__(self, blog_posts, count, api_key):
+    def run(self):
+        try:
+            model, prompt = self.prepare()
+            if self.stream:
+                for chunk in cached_generate_stream(
+                    model, TITLE_MODEL_NAME, prompt, **self.request_kwargs()
+                ):
+                    self.emit_streamed(self.receive(chunk))
+                self.emit_streamed(self.end_stream())
+                self.finish(self.streamed_titles)
+            else:
+                titles, cache_hit = generate_titles(model, prompt, **self.request_kwargs())
+                self.finish(self.check_titles(titles), cache_hit)
+
+        except Exception as e:
+            self.fail(e)
+
+
+class _BatchTitleGenerateJob:
+    """다중 키워드 제목 일괄 생성 워커 공통 부분"""
+
+    def __init__(self, blog_posts, count, api_key, keywords_per_request=5, use_cache=True):
         super().__init__()
         self.blog_posts = blog_posts
         self.count = count
         self.api_key = api_key
+        self.keywords_per_request = keywords_per_request
+        self.use_cache = use_cache
+        self.started_count = 0
+
+    def prepare(self):
+        """(모델, 요청 목록) - 실패하면 generation_failed를 보내고 None"""
+        self.corpora = group_posts_by_keyword(self.blog_posts)
+        try:
+            model = get_llm_model(self.api_key, TITLE_MODEL_NAME)
+            requests = build_batch_title_requests(
+                self.corpora,
+                self.count,
+                self.keywords_per_request,
+                get_token_budget(),
+                get_token_counter(model),
+            )
+        except Exception as e:
+            self.generation_failed.emit(f"제목 생성 오류: {str(e)}")
+            return None
+        return model, requests
+
+    def request_kwargs(self):
+        return {
+            "use_cache": self.use_cache,
+            "api_key": self.api_key,
+            "on_request": self.on_request,
+            "on_keyword_done": self.on_keyword_done,
+            "on_keyword_failed": self.keyword_failed.emit,
+        }
+
+    def finish(self, results, requests):
+        self.progress.emit(
+            f"제목 일괄 생성 완료: {len(results)}/{len(self.corpora)}개 키워드, 요청 {len(requests)}회"
+        )
+        self.batch_completed.emit(results)
+
+    def on_keyword_done(self, keyword, titles):
+        """키워드 제목을 이전 제목 색인과 비교하여 [(제목, 유사 제목 또는 None, 유사도)]로 전달"""
+        self.keyword_titles_generated.emit(keyword, get_title_index().check_and_add(titles))
+
+    def on_request(self, index, total):
+        # 비동기 버전은 요청이 순서대로 시작하지 않으므로 시작한 요청 수로 표시
+        self.started_count += 1
+        self.progress.emit(f"제목 일괄 생성 중... ({self.started_count}/{total} 요청)")
+
+
+class BatchTitleGenerateWorker(_BatchTitleGenerateJob, QThread):
+    """다중 키워드 제목 일괄 생성 워커 - 여러 키워드를 한 번의 요청으로 처리"""
+
+    keyword_titles_generated = pyqtSignal(str, list)  # keyword, [(제목, 유사 제목 또는 None, 유사도)]
+    keyword_failed = pyqtSignal(str, str)  # keyword, error
+    batch_completed = pyqtSignal(dict)  # {keyword: titles}
+    generation_failed = pyqtSignal(str)  # 모델 준비/요청 구성 실패 (요청 전)
+    progress = pyqtSignal(str)
 
     def run(self):
+        prepared = self.prepare()
+        if prepared is None:
+            return
+        model, requests = prepared
+        self.finish(generate_batch_titles(model, requests, **self.request_kwargs()), requests)
+
+
+class _BatchContentGenerateJob:
+    """여러 제목 글 동시 생성 워커 공통 부분"""
+
+    def __init__(
+        self,
+        titles,
+        prompt,
+        api_key,
+        save_path,
+        max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+        use_cache=True,
+        stream=False,
+        outline=False,
+    ):
+        super().__init__()
+        self.titles = titles
+        self.done_count = 0
+        self.engine = BatchContentEngine(
+            api_key,
+            prompt,
+            save_path,
+            max_in_flight=max_in_flight,
+            use_cache=use_cache,
+            stream=stream,
+            outline=outline,
+        )
+
+    def begin(self):
+        self.progress.emit(
+            f"{len(self.titles)}개 글 생성 중... (동시 {self.engine.max_in_flight}개)"
+        )
+        return {
+            "on_title_done": self.on_title_done,
+            "on_title_failed": self.on_title_failed,
+            "on_title_started": self.content_started.emit,
+            "on_chunk": self.content_chunk.emit,
+        }
+
+    def fail(self, error):
+        self.progress.emit(f"글 생성 오류: {str(error)}")
+
+    def finish(self):
+        report = self.engine.shared_prefix_report()
+        if report:
+            self.shared_prefix_report.emit(report)
+        self.batch_completed.emit()
+
+    def stop(self):
+        """남은 제목 생성 취소"""
+        self.engine.stop()
+
+    def on_title_done(self, index, title, path, cache_hit):
+        self.done_count += 1
+        self.content_generated.emit(index, title, path)
+        cache_note = " (캐시)" if cache_hit else ""
+        self.progress.emit(f"글 생성 중... ({self.done_count}/{len(self.titles)}) {title}{cache_note}")
+
+    def on_title_failed(self, index, title, error):
+        self.done_count += 1
+        self.content_failed.emit(index, title, f"글 생성 오류: {error}")
+
+
+class BatchContentGenerateWorker(_BatchContentGenerateJob, QThread):
+    """여러 제목 글 동시 생성 워커 - 글은 워커에서 파일로 저장하고 결과는 끝나는 순서대로 전달"""
+
+    content_generated = pyqtSignal(int, str, str)  # index, title, 저장 경로
+    content_failed = pyqtSignal(int, str, str)  # index, title, error
+    content_started = pyqtSignal(int, str, str)  # 스트리밍 모드: index, title, 임시 파일 경로
+    content_chunk = pyqtSignal(int, str)  # 스트리밍 모드: index, 받은 텍스트 조각
+    shared_prefix_report = pyqtSignal(str)  # 공유 지침으로 절감한 입력 토큰 요약
+    batch_completed = pyqtSignal()
+    progress = pyqtSignal(str)
+
+    def run(self):
+        callbacks = self.begin()
         try:
-            self.progress.emit("제목 생성 중...")
+            self.engine.run(self.titles, **callbacks)
+        except Exception as e:
+            self.fail(e)
+        self.finish()
 
-            # Gemini API 설정
-            genai.configure(api_key=self.api_key)
-            model = genai.GenerativeModel("gemini-2.0-flash-exp")
 
-            # 블로그 글 내용 요약
-            content_summary = ""
-            for i, post in enumerate(self.blog_posts[:10], 1):
-                content_summary += f"{i}. {post['title']}\n{post['description']}\n\n"
+class AsyncWorker(QObject):
+    """
+    비동기 워커 기본 클래스 - QThread 워커처럼 start()로 시작하고 같은 방식으로 신호를 연결
+    start()는 run_async() 코루틴을 공용 이벤트 루프에 넘기고 바로 반환합니다.
+    신호는 루프 스레드(또는 run_blocking의 실행기 스레드)에서 보내지며
+    Qt가 GUI 스레드의 슬롯으로 전달합니다 (QueuedConnection).
+    """
 
-            prompt = f"""
-                다음은 특정 키워드로 검색한 상위 블로그 글들의 제목과 내용입니다:
+    finished = pyqtSignal()
 
-                {content_summary}
+    def __init__(self):
+        super().__init__()
+        self.future = None
 
-                위 내용들을 분석하여 SEO에 최적화되고 클릭률이 높은 블로그 제목을 {self.count}개 생성해주세요.
-                1. 제목의 구조적 특징(길이, 문장 구조, 문체 등)
-                2. 자주 사용되는 핵심 키워드와 표현
-                3. 제목 구성의 패턴(예: 질문형, 리스트형, 비교형 등)
-                4. 독자의 관심을 끌기 위한 기법(감정적 표현, 호기심 유발 등)
-                5. 제목의 SEO 최적화 특징
+    def start(self):
+        self.future = get_async_engine().submit(self._run())
 
-                제목만 번호와 함께 나열해주세요.
-                """
+    async def _run(self):
+        try:
+            await self.run_async()
+        finally:
+            self.finished.emit()
+
+    async def run_async(self):
+        raise NotImplementedError
+
+    def isRunning(self):
+        return self.future is not None and not self.future.done()
+
+    def wait(self, msecs=None):
+        """작업이 끝날 때까지 대기 - 시간 안에 끝나지 않으면 False"""
+        if self.future is None:
+            return True
+        try:
+            self.future.result(None if msecs is None else msecs / 1000)
+        except concurrent.futures.TimeoutError:
+            return False
+        except Exception:
+            pass
+        return True
+
+
+class AsyncNaverSearchWorker(_NaverSearchJob, AsyncWorker):
+    """NaverSearchWorker의 비동기 버전"""
+
+    search_completed = pyqtSignal(list)
+    search_failed = pyqtSignal(str)
+    progress = pyqtSignal(str)
+    page_received = pyqtSignal(list)
 
-            response = model.generate_content(prompt)
-            content = response.text
+    async def run_async(self):
+        try:
+            self.progress.emit("네이버 블로그 검색 중...")
 
-            # 제목 추출
-            titles = []
-            lines = content.strip().split("\n")
-            for line in lines:
-                line = line.strip()
-                if line and (line[0].isdigit() or line.startswith("-")):
-                    title = line.split(".", 1)[-1].split("-", 1)[-1].strip()
-                    if title:
-                        titles.append(title)
+            if self.incremental:
+                blog_posts = await run_blocking(self.search_incremental)
+            elif self.deep:
+                blog_posts = await deep_search_async(*self.search_args(), **self.deep_kwargs())
+            else:
+                blog_posts, _ = await search_blog_page_async(
+                    *self.search_args(), **self.page_kwargs()
+                )
 
-            self.progress.emit(f"제목 생성 완료: {len(titles)}개")
-            self.titles_generated.emit(titles)
+            # 중복 제거와 저장소 기록은 실행기 스레드에서 처리
+            await run_blocking(self.finish, blog_posts)
 
         except Exception as e:
-            self.generation_failed.emit(f"제목 생성 오류: {str(e)}")
+            self.fail(e)
 
 
-class ContentGenerateWorker(QThread):
-    """Gemini 글 생성 워커"""
+class AsyncBatchSearchWorker(_BatchSearchJob, AsyncWorker):
+    """BatchSearchWorker의 비동기 버전"""
 
-    content_generated = pyqtSignal(str, str)  # title, content
-    generation_failed = pyqtSignal(str)
+    keyword_completed = pyqtSignal(str, list)
+    keyword_failed = pyqtSignal(str, str)
+    batch_completed = pyqtSignal(list)
     progress = pyqtSignal(str)
 
-    def __init__(self, title, prompt, api_key):
-        super().__init__()
-        self.title = title
-        self.prompt = prompt
-        self.api_key = api_key
+    async def run_async(self):
+        callbacks = self.begin()
+        self.finish(await self.engine.run_async(self.keywords, **callbacks))
 
-    def run(self):
+
+class AsyncTitleGenerateWorker(_TitleGenerateJob, AsyncWorker):
+    """TitleGenerateWorker의 비동기 버전"""
+
+    titles_generated = pyqtSignal(list)
+    title_streamed = pyqtSignal(list)
+    generation_failed = pyqtSignal(str)
+    progress = pyqtSignal(str)
+
+    async def run_async(self):
         try:
-            self.progress.emit(f"'{self.title}' 글 생성 중...")
+            model, prompt = await run_blocking(self.prepare)
+            # 제목 색인 비교/저장은 SQLite 작업이므로 실행기 스레드에서 처리
+            if self.stream:
+                async for chunk in cached_generate_stream_async(
+                    model, TITLE_MODEL_NAME, prompt, **self.request_kwargs()
+                ):
+                    titles = self.receive(chunk)
+                    if titles:
+                        await run_blocking(self.emit_streamed, titles)
+                await run_blocking(self.emit_streamed, self.end_stream())
+                self.finish(self.streamed_titles)
+            else:
+                titles, cache_hit = await generate_titles_async(
+                    model, prompt, **self.request_kwargs()
+                )
+                self.finish(await run_blocking(self.check_titles, titles), cache_hit)
 
-            # Gemini API 설정
-            genai.configure(api_key=self.api_key)
-            model = genai.GenerativeModel("gemini-2.0-flash-exp")
+        except Exception as e:
+            self.fail(e)
 
-            full_prompt = f"""
-                제목: {self.title}
 
-                {self.prompt}
+class AsyncBatchTitleGenerateWorker(_BatchTitleGenerateJob, AsyncWorker):
+    """BatchTitleGenerateWorker의 비동기 버전 - 요청들을 동시에 보냄"""
 
-                위 제목으로 블로그 글을 작성해주세요.
-            """
-            response = model.generate_content(full_prompt)
-            content = response.text
+    keyword_titles_generated = pyqtSignal(str, list)
+    keyword_failed = pyqtSignal(str, str)
+    batch_completed = pyqtSignal(dict)
+    generation_failed = pyqtSignal(str)
+    progress = pyqtSignal(str)
 
-            self.progress.emit("글 생성 완료")
-            self.content_generated.emit(self.title, content)
+    async def run_async(self):
+        # 모델 준비와 프롬프트 조립(정확한 토큰 계산 시 API 호출)은 블로킹 작업
+        prepared = await run_blocking(self.prepare)
+        if prepared is None:
+            return
+        model, requests = prepared
+        results = await generate_batch_titles_async(model, requests, **self.request_kwargs())
+        self.finish(results, requests)
+
+
+class AsyncBatchContentGenerateWorker(_BatchContentGenerateJob, AsyncWorker):
+    """BatchContentGenerateWorker의 비동기 버전"""
+
+    content_generated = pyqtSignal(int, str, str)
+    content_failed = pyqtSignal(int, str, str)
+    content_started = pyqtSignal(int, str, str)
+    content_chunk = pyqtSignal(int, str)
+    shared_prefix_report = pyqtSignal(str)
+    batch_completed = pyqtSignal()
+    progress = pyqtSignal(str)
 
+    async def run_async(self):
+        callbacks = self.begin()
+        try:
+            await self.engine.run_async(self.titles, **callbacks)
         except Exception as e:
-            self.generation_failed.emit(f"글 생성 오류: {str(e)}")
+            self.fail(e)
+        self.finish()
 
 
 class TistoryPublishWorker(QThread):
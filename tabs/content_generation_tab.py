@@ -1,13 +1,29 @@
 import os
-from datetime import datetime
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTextEdit, QListWidget, QGroupBox, QMessageBox, QFileDialog,
-    QSplitter
+    QSplitter, QSpinBox, QInputDialog, QCheckBox
 )
 from PyQt5.QtCore import Qt
-from core.workers import ContentGenerateWorker
-from utils.utils import sanitize_filename
+from PyQt5.QtGui import QTextCursor
+from core.batch_journal import BatchJournal, list_unfinished_journals, prompt_hash
+from core.content_generation import (
+    OUTPUT_TOKENS_PER_POST,
+    build_content_prompt,
+    get_max_in_flight,
+    outline_mode_enabled,
+)
+from core.key_pool import resolve_api_keys
+from core.outline_generation import estimate_outlined_batch
+from core.prompt_builder import (
+    TokenBudgetExceeded,
+    estimate_batch,
+    format_estimate,
+    get_token_budget,
+)
+from core.workers import (
+    AsyncBatchContentGenerateWorker, BatchContentGenerateWorker, use_async_engine
+)
 
 
 class ContentGenerationTab(QWidget):
@@ -17,10 +33,16 @@ class ContentGenerationTab(QWidget):
         super().__init__(parent)
         self.parent = parent
         self.selected_titles = []
-        self.current_title_index = 0
         self.total_titles = 0
         self.generated_count = 0
+        self.failed_count = 0
         self.batch_prompt = ""
+        self.batch_save_path = ""
+        self.batch_indices = []
+        self.journal = None
+        self.content_worker = None
+        self.preview_index = None
+        self.preview_chunks = {}
         self.init_ui()
     
     def init_ui(self):
@@ -192,6 +214,44 @@ class ContentGenerationTab(QWidget):
         
         right_layout.addWidget(save_group)
         
+        # 동시 생성 수 설정
+        parallel_layout = QHBoxLayout()
+        parallel_layout.addWidget(QLabel("동시 생성 수:"))
+        self.max_in_flight_spin = QSpinBox()
+        self.max_in_flight_spin.setRange(1, 10)
+        self.max_in_flight_spin.setValue(max(1, min(10, get_max_in_flight())))
+        self.max_in_flight_spin.setToolTip("여러 제목의 글을 동시에 생성합니다 (1이면 하나씩 순서대로)")
+        parallel_layout.addWidget(self.max_in_flight_spin)
+        
+        self.stream_content_check = QCheckBox("실시간 생성 (스트리밍)")
+        self.stream_content_check.setChecked(True)
+        self.stream_content_check.setToolTip(
+            "생성되는 글을 바로 파일에 기록하고 미리보기에 표시합니다"
+        )
+        parallel_layout.addWidget(self.stream_content_check)
+        
+        self.outline_check = QCheckBox("개요 후 섹션 동시 생성")
+        self.outline_check.setChecked(outline_mode_enabled())
+        self.outline_check.setToolTip(
+            "긴 글용: 개요를 먼저 만들고 서론/소제목/결론을 동시에 생성해 이어 붙입니다 (스트리밍 미적용)"
+        )
+        parallel_layout.addWidget(self.outline_check)
+        parallel_layout.addStretch()
+        right_layout.addLayout(parallel_layout)
+        
+        # 실시간 미리보기
+        preview_group = QGroupBox("실시간 미리보기")
+        preview_layout = QVBoxLayout(preview_group)
+        
+        self.preview_title_label = QLabel("생성 중인 글이 없습니다.")
+        preview_layout.addWidget(self.preview_title_label)
+        
+        self.preview_text = QTextEdit()
+        self.preview_text.setReadOnly(True)
+        preview_layout.addWidget(self.preview_text)
+        
+        right_layout.addWidget(preview_group)
+        
         # 글 생성 버튼
         self.generate_content_btn = QPushButton("📝 선택된 제목들로 일괄 글 생성")
         self.generate_content_btn.clicked.connect(self.generate_multiple_contents)
@@ -218,6 +278,52 @@ class ContentGenerationTab(QWidget):
         """)
         right_layout.addWidget(self.generate_content_btn)
         
+        self.resume_batch_btn = QPushButton("↩️ 중단된 일괄 생성 이어하기")
+        self.resume_batch_btn.clicked.connect(self.resume_batch)
+        self.resume_batch_btn.setToolTip("완료되지 않은 일괄 생성 기록을 불러와 남은 제목만 생성합니다")
+        self.resume_batch_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #607d8b;
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #455a64;
+            }
+            QPushButton:disabled {
+                background-color: #cccccc;
+                color: #666666;
+            }
+        """)
+        right_layout.addWidget(self.resume_batch_btn)
+        
+        self.stop_batch_btn = QPushButton("⏹️ 일괄 생성 중지")
+        self.stop_batch_btn.clicked.connect(self.stop_batch)
+        self.stop_batch_btn.setEnabled(False)
+        self.stop_batch_btn.setToolTip(
+            "아직 시작하지 않은 제목을 취소합니다 (생성 중인 글은 마저 저장합니다).\n"
+            "취소된 제목은 '중단된 일괄 생성 이어하기'로 다시 생성할 수 있습니다."
+        )
+        self.stop_batch_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #f44336;
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #d32f2f;
+            }
+            QPushButton:disabled {
+                background-color: #cccccc;
+                color: #666666;
+            }
+        """)
+        right_layout.addWidget(self.stop_batch_btn)
+        
         splitter.addWidget(right_widget)
         layout.addWidget(splitter)
     
@@ -260,7 +366,7 @@ class ContentGenerationTab(QWidget):
             QMessageBox.warning(self, "선택 오류", "글을 생성할 제목을 하나 이상 선택하세요.")
             return
         
-        api_key = os.getenv("GEMINI_API_KEY") or self.parent.gemini_key_input.text().strip()
+        api_key = resolve_api_keys(self.parent.gemini_key_input.text())
         if not api_key:
             QMessageBox.warning(self, "API 오류", "Gemini API 키를 입력하세요.")
             return
@@ -270,23 +376,6 @@ class ContentGenerationTab(QWidget):
             QMessageBox.warning(self, "경로 오류", "저장 경로를 선택하세요.")
             return
         
-        # 확인 메시지
-        reply = QMessageBox.question(
-            self, "일괄 생성 확인",
-            f"{len(selected_items)}개의 제목으로 글을 생성하시겠습니까?\n\n"
-            f"예상 소요 시간: 약 {len(selected_items) * 30}초",
-            QMessageBox.Yes | QMessageBox.No
-        )
-        
-        if reply != QMessageBox.Yes:
-            return
-        
-        # 선택된 제목들 저장
-        self.selected_titles = [item.text() for item in selected_items]
-        self.current_title_index = 0
-        self.total_titles = len(self.selected_titles)
-        self.generated_count = 0
-        
         prompt = self.prompt_input.toPlainText().strip()
 
         if not prompt:
@@ -300,84 +389,206 @@ class ContentGenerationTab(QWidget):
 6. 마지막에 요약 또는 결론 포함
 
 글의 톤앤매너는 친근하고 전문적으로 작성해주세요."""
+
+        # 전송 전 토큰/비용 추정
+        titles = [item.text() for item in selected_items]
+        try:
+            if self.outline_check.isChecked():
+                # 개요 모드는 글마다 개요 + 서론/소제목/결론 요청을 보냄
+                estimate = estimate_outlined_batch(titles, prompt)
+            else:
+                budget = get_token_budget()
+                prompts = [build_content_prompt(title, prompt, budget) for title in titles]
+                estimate = estimate_batch(prompts, OUTPUT_TOKENS_PER_POST)
+        except TokenBudgetExceeded as e:
+            QMessageBox.warning(self, "프롬프트 오류", str(e))
+            return
+        max_in_flight = self.max_in_flight_spin.value()
+
+        # 확인 메시지
+        reply = QMessageBox.question(
+            self, "일괄 생성 확인",
+            f"{len(selected_items)}개의 제목으로 글을 생성하시겠습니까?\n\n"
+            f"{format_estimate(estimate)}\n"
+            f"예상 소요 시간: 약 {-(-len(selected_items) // max_in_flight) * 30}초 "
+            f"(동시 {max_in_flight}개)",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        
+        if reply != QMessageBox.Yes:
+            return
+        
+        # 진행 기록 생성 후 시작
+        self.start_batch(BatchJournal.create(titles, prompt, save_path), api_key, max_in_flight)
+    
+    def resume_batch(self):
+        """중단된 일괄 생성 기록을 골라 남은 제목만 생성"""
+        api_key = resolve_api_keys(self.parent.gemini_key_input.text())
+        if not api_key:
+            QMessageBox.warning(self, "API 오류", "Gemini API 키를 입력하세요.")
+            return
+        
+        journals = list_unfinished_journals()
+        if not journals:
+            QMessageBox.information(self, "이어하기", "이어서 생성할 일괄 생성 기록이 없습니다.")
+            return
+        
+        summaries = [journal.summary() for journal in journals]
+        summary, ok = QInputDialog.getItem(
+            self, "일괄 생성 이어하기", "이어서 생성할 기록을 선택하세요:", summaries, 0, False
+        )
+        if not ok:
+            return
+        journal = journals[summaries.index(summary)]
         
-        self.batch_prompt = prompt
+        if prompt_hash(journal.prompt) != journal.prompt_hash:
+            QMessageBox.warning(self, "기록 오류", "기록된 프롬프트가 손상되어 이어서 생성할 수 없습니다.")
+            return
+        
+        reply = QMessageBox.question(
+            self, "이어하기 확인",
+            f"남은 {len(journal.remaining())}개 제목의 글을 생성하시겠습니까?\n"
+            f"(완료된 {len(journal.done)}개는 다시 생성하지 않습니다)",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        
+        self.start_batch(journal, api_key, self.max_in_flight_spin.value())
+    
+    def start_batch(self, journal, api_key, max_in_flight):
+        """기록에서 완료되지 않은 제목으로 글 생성 워커 시작"""
+        remaining = journal.remaining()
+        
+        # 남은 제목들 저장 (워커 결과의 위치 -> 기록의 제목 번호)
+        self.journal = journal
+        self.batch_indices = [index for index, _ in remaining]
+        self.selected_titles = [title for _, title in remaining]
+        self.total_titles = len(self.selected_titles)
+        self.generated_count = 0
+        self.failed_count = 0
+        
+        self.batch_prompt = journal.prompt
+        self.batch_save_path = journal.save_path
+        self.preview_index = None
+        self.preview_chunks = {}
         
         # UI 비활성화
         self.generate_content_btn.setEnabled(False)
+        self.resume_batch_btn.setEnabled(False)
+        self.stop_batch_btn.setEnabled(True)
         self.parent.progress_bar.setVisible(True)
         self.parent.progress_bar.setRange(0, self.total_titles)
         self.parent.progress_bar.setValue(0)
         
-        # 첫 번째 제목으로 시작
-        self.generate_next_content(api_key)
-    
-    def generate_next_content(self, api_key):
-        """다음 제목으로 글 생성"""
-        if self.current_title_index >= len(self.selected_titles):
-            # 모든 글 생성 완료
-            self.on_batch_generation_completed()
-            return
-        
-        title = self.selected_titles[self.current_title_index]
+        if journal.done:
+            self.generation_log_text.append(
+                f"=== 이어하기: 완료 {len(journal.done)}개 제외, {self.total_titles}개 생성 ==="
+            )
         
-        # 글 생성 워커 시작
-        self.content_worker = ContentGenerateWorker(title, self.batch_prompt, api_key)
+        # 글 생성 워커 시작 (max_in_flight개씩 동시 생성)
+        worker_class = (
+            AsyncBatchContentGenerateWorker if use_async_engine() else BatchContentGenerateWorker
+        )
+        self.content_worker = worker_class(
+            self.selected_titles,
+            self.batch_prompt,
+            api_key,
+            self.batch_save_path,
+            max_in_flight=max_in_flight,
+            use_cache=self.parent.use_response_cache(),
+            stream=self.stream_content_check.isChecked(),
+            outline=self.outline_check.isChecked(),
+        )
         self.content_worker.content_generated.connect(self.on_batch_content_generated)
-        self.content_worker.generation_failed.connect(self.on_batch_content_failed)
+        self.content_worker.content_failed.connect(self.on_batch_content_failed)
+        self.content_worker.content_started.connect(self.on_content_started)
+        self.content_worker.content_chunk.connect(self.on_content_chunk)
+        self.content_worker.shared_prefix_report.connect(self.generation_log_text.append)
+        self.content_worker.batch_completed.connect(self.on_batch_generation_completed)
         self.content_worker.progress.connect(self.parent.update_status)
         self.content_worker.start()
     
-    def on_batch_content_generated(self, title, content):
-        """일괄 생성 중 개별 글 생성 완료"""
-        try:
-            # 파일 저장
-            safe_title = sanitize_filename(title)
-            filename = f"{safe_title}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-            
-            save_path = self.save_path_input.text()
-            full_path = os.path.join(save_path, filename)
-            
-            with open(full_path, "w", encoding="utf-8") as f:
-                f.write(f"제목: {title}\n")
-                f.write(f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(content)
-            
-            # 진행 상황 업데이트
-            self.generated_count += 1
-            self.current_title_index += 1
-            self.parent.progress_bar.setValue(self.generated_count)
-            
-            # 로그 추가
-            self.generation_log_text.append(
-                f"[{self.generated_count}/{self.total_titles}] {title} - 완료"
-            )
-            
-            # 다음 제목으로 진행
-            api_key = os.getenv("GEMINI_API_KEY") or self.parent.gemini_key_input.text().strip()
-            self.generate_next_content(api_key)
-            
-        except Exception as e:
-            self.on_batch_content_failed(f"파일 저장 오류: {str(e)}")
+    def on_content_started(self, index, title, part_path):
+        """스트리밍 생성 시작 - 미리보기 중인 글이 없으면 이 글을 표시"""
+        self.preview_chunks[index] = []
+        if self.preview_index is None:
+            self.show_preview(index)
+        if index == self.preview_index:
+            self.preview_title_label.setToolTip(part_path)
     
-    def on_batch_content_failed(self, error_msg):
+    def on_content_chunk(self, index, text):
+        """스트리밍 조각 도착 - 미리보기 중인 글이면 이어 붙임"""
+        self.preview_chunks.setdefault(index, []).append(text)
+        if self.preview_index is None:
+            self.show_preview(index)
+        elif index == self.preview_index:
+            cursor = self.preview_text.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text)
+            self.preview_text.setTextCursor(cursor)
+    
+    def show_preview(self, index):
+        """미리보기를 다른 글로 전환 (지금까지 받은 조각부터 표시)"""
+        self.preview_index = index
+        self.preview_title_label.setText(
+            f"#{self.batch_indices[index] + 1} {self.selected_titles[index]}"
+        )
+        self.preview_text.setPlainText("".join(self.preview_chunks.get(index, [])))
+        self.preview_text.moveCursor(QTextCursor.End)
+    
+    def finish_preview(self, index):
+        """글이 끝나면 받은 조각을 버리고, 미리보기 중이던 글이면 다음 조각이 오는 글로 전환"""
+        self.preview_chunks.pop(index, None)
+        if index == self.preview_index:
+            self.preview_index = None
+    
+    def on_batch_content_generated(self, index, title, full_path):
+        """일괄 생성 중 개별 글 생성/저장 완료 (완료 순서는 선택 순서와 다를 수 있음)"""
+        self.finish_preview(index)
+        
+        # 진행 상황 기록
+        journal_index = self.batch_indices[index]
+        self.journal.record_done(journal_index, full_path)
+        self.generated_count += 1
+        done_count = self.generated_count + self.failed_count
+        self.parent.progress_bar.setValue(done_count)
+        
+        # 로그 추가
+        self.generation_log_text.append(
+            f"[{done_count}/{self.total_titles}] #{journal_index + 1} {title} - 완료"
+        )
+    
+    def on_batch_content_failed(self, index, title, error_msg):
         """일괄 생성 중 개별 글 생성 실패"""
-        title = self.selected_titles[self.current_title_index]
+        self.finish_preview(index)
+        journal_index = self.batch_indices[index]
+        self.journal.record_failed(journal_index, error_msg)
+        self.failed_count += 1
+        done_count = self.generated_count + self.failed_count
+        self.parent.progress_bar.setValue(done_count)
         self.generation_log_text.append(
-            f"[{self.current_title_index + 1}/{self.total_titles}] {title} - 실패: {error_msg}"
+            f"[{done_count}/{self.total_titles}] #{journal_index + 1} {title} - 실패: {error_msg}"
         )
-        
-        # 실패해도 다음으로 진행
-        self.current_title_index += 1
-        self.parent.progress_bar.setValue(self.current_title_index)
-        
-        api_key = os.getenv("GEMINI_API_KEY") or self.parent.gemini_key_input.text().strip()
-        self.generate_next_content(api_key)
+    
+    def stop_batch(self):
+        """진행 중인 일괄 생성 중지 - 남은 제목은 취소되어 완료 신호가 옴"""
+        if self.content_worker is not None and self.content_worker.isRunning():
+            self.content_worker.stop()
+            self.stop_batch_btn.setEnabled(False)
+            self.parent.update_status("일괄 생성 중지 중... (생성 중인 글은 마저 저장합니다)")
+    
+    def stop_workers(self):
+        """창을 닫을 때 진행 중인 일괄 생성을 중지하고 끝날 때까지 대기"""
+        if self.content_worker is not None and self.content_worker.isRunning():
+            self.content_worker.stop()
+            self.content_worker.wait()
     
     def on_batch_generation_completed(self):
         """일괄 생성 완료"""
         self.generate_content_btn.setEnabled(True)
+        self.resume_batch_btn.setEnabled(True)
+        self.stop_batch_btn.setEnabled(False)
         self.parent.progress_bar.setVisible(False)
         
         success_count = self.generated_count
@@ -389,7 +600,7 @@ class ContentGenerationTab(QWidget):
         
         self.parent.update_status(f"일괄 생성 완료: {success_count}/{total_count}개 성공")
         
-        QMessageBox.information(
-            self, "일괄 생성 완료",
-            f"총 {total_count}개 중 {success_count}개의 글이 성공적으로 생성되었습니다!"
-        )
\ No newline at end of file
+        message = f"총 {total_count}개 중 {success_count}개의 글이 성공적으로 생성되었습니다!"
+        if self.journal and not self.journal.is_complete():
+            message += "\n\n실패한 제목은 '중단된 일괄 생성 이어하기'로 다시 생성할 수 있습니다."
+        QMessageBox.information(self, "일괄 생성 완료", message)
\ No newline at end of file
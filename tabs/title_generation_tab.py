@@ -2,10 +2,29 @@ import os
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QListWidget, QListWidgetItem, QSpinBox, QGroupBox, QMessageBox,
-    QSplitter, QInputDialog
+    QSplitter, QInputDialog, QCheckBox, QFileDialog
 )
 from PyQt5.QtCore import Qt
-from core.workers import NaverSearchWorker, TitleGenerateWorker
+from PyQt5.QtGui import QColor
+from core.batch_search import load_keywords, parse_keywords
+from core.key_pool import resolve_api_keys
+from core.post_store import get_post_store
+from core.prompt_builder import (
+    TokenBudgetExceeded,
+    estimate_batch,
+    format_estimate,
+    get_token_budget,
+)
+from core.title_generation import (
+    OUTPUT_TOKENS_PER_TITLE,
+    build_batch_title_requests,
+    group_posts_by_keyword,
+)
+from core.workers import (
+    AsyncBatchSearchWorker, AsyncBatchTitleGenerateWorker, AsyncNaverSearchWorker,
+    AsyncTitleGenerateWorker, BatchSearchWorker, BatchTitleGenerateWorker, NaverSearchWorker,
+    TitleGenerateWorker, use_async_engine
+)
 
 
 class TitleGenerationTab(QWidget):
@@ -16,6 +35,14 @@ class TitleGenerationTab(QWidget):
         self.parent = parent
         self.blog_posts = []
         self.generated_titles = []
+        self.batch_failures = []
+        self.batch_title_failures = []
+        self.streamed_title_count = 0
+        self.similar_title_count = 0
+        self.search_worker = None
+        self.batch_search_worker = None
+        self.title_worker = None
+        self.batch_title_worker = None
         self.init_ui()
     
     def init_ui(self):
@@ -31,6 +58,16 @@ class TitleGenerationTab(QWidget):
         self.keyword_input.setPlaceholderText("검색할 키워드를 입력하세요")
         search_layout.addWidget(self.keyword_input)
         
+        self.deep_search_check = QCheckBox("딥 검색 (최대 1000개)")
+        self.deep_search_check.setToolTip("여러 페이지를 동시에 요청하여 최대 1000개의 글을 수집합니다")
+        search_layout.addWidget(self.deep_search_check)
+        
+        self.incremental_search_check = QCheckBox("새 글만 (증분)")
+        self.incremental_search_check.setToolTip(
+            "지난 수집 이후 올라온 글만 최신순으로 가져와 저장된 글 목록에 합칩니다"
+        )
+        search_layout.addWidget(self.incremental_search_check)
+        
         self.search_btn = QPushButton("🔍 검색")
         self.search_btn.clicked.connect(self.search_blogs)
         self.search_btn.setStyleSheet("""
@@ -51,6 +88,27 @@ class TitleGenerationTab(QWidget):
         """)
         search_layout.addWidget(self.search_btn)
         
+        self.batch_search_btn = QPushButton("📋 일괄 검색")
+        self.batch_search_btn.clicked.connect(self.batch_search_from_input)
+        self.batch_search_btn.setToolTip("여러 키워드를 붙여넣어 한 번에 검색합니다")
+        search_layout.addWidget(self.batch_search_btn)
+        
+        self.keyword_file_btn = QPushButton("📂 키워드 파일")
+        self.keyword_file_btn.clicked.connect(self.batch_search_from_file)
+        self.keyword_file_btn.setToolTip("키워드 파일(한 줄에 하나)을 불러와 일괄 검색합니다")
+        search_layout.addWidget(self.keyword_file_btn)
+        
+        self.archive_search_btn = QPushButton("🗂️ 보관함 검색")
+        self.archive_search_btn.clicked.connect(self.search_archive)
+        self.archive_search_btn.setToolTip("지금까지 수집한 글에서 API 호출 없이 검색합니다")
+        search_layout.addWidget(self.archive_search_btn)
+        
+        self.stop_search_btn = QPushButton("⏹️ 중지")
+        self.stop_search_btn.clicked.connect(self.stop_batch_search)
+        self.stop_search_btn.setEnabled(False)
+        self.stop_search_btn.setToolTip("일괄 검색에서 아직 시작하지 않은 키워드를 취소합니다")
+        search_layout.addWidget(self.stop_search_btn)
+        
         layout.addWidget(search_group)
         
         # 수평 분할
@@ -126,6 +184,18 @@ class TitleGenerationTab(QWidget):
         """)
         count_layout.addWidget(self.generate_titles_btn)
         
+        self.stream_titles_check = QCheckBox("실시간 표시")
+        self.stream_titles_check.setChecked(True)
+        self.stream_titles_check.setToolTip("제목이 완성되는 대로 바로 목록에 추가합니다 (스트리밍)")
+        count_layout.addWidget(self.stream_titles_check)
+        
+        self.skip_similar_check = QCheckBox("유사 제목 제외")
+        self.skip_similar_check.setChecked(True)
+        self.skip_similar_check.setToolTip(
+            "이전에 생성한 제목과 비슷한 제목은 목록에 추가하지 않습니다 (해제하면 표시만 함)"
+        )
+        count_layout.addWidget(self.skip_similar_check)
+        
         title_gen_layout.addLayout(count_layout)
         right_layout.addWidget(title_gen_group)
         
@@ -193,12 +263,17 @@ class TitleGenerationTab(QWidget):
         splitter.addWidget(right_widget)
         layout.addWidget(splitter)
     
+    def get_naver_credentials(self):
+        """네이버 API 인증 정보 반환"""
+        client_id = os.getenv("NAVER_CLIENT_ID") or self.parent.naver_id_input.text().strip()
+        client_secret = os.getenv("NAVER_CLIENT_SECRET") or self.parent.naver_secret_input.text().strip()
+        return client_id, client_secret
+    
     def search_blogs(self):
         """네이버 블로그 검색"""
         keyword = self.keyword_input.text().strip()
         
-        client_id = os.getenv("NAVER_CLIENT_ID") or self.parent.naver_id_input.text().strip()
-        client_secret = os.getenv("NAVER_CLIENT_SECRET") or self.parent.naver_secret_input.text().strip()
+        client_id, client_secret = self.get_naver_credentials()
         
         if not keyword:
             QMessageBox.warning(self, "입력 오류", "키워드를 입력하세요.")
@@ -211,32 +286,182 @@ class TitleGenerationTab(QWidget):
         self.search_btn.setEnabled(False)
         self.parent.progress_bar.setVisible(True)
         self.parent.progress_bar.setRange(0, 0)
+        self.search_result_list.clear()
         
         # 검색 워커 시작
-        self.search_worker = NaverSearchWorker(keyword, client_id, client_secret)
+        deep = self.deep_search_check.isChecked()
+        incremental = self.incremental_search_check.isChecked()
+        worker_class = AsyncNaverSearchWorker if use_async_engine() else NaverSearchWorker
+        self.search_worker = worker_class(
+            keyword, client_id, client_secret, deep=deep, incremental=incremental
+        )
+        self.search_worker.page_received.connect(self.on_search_page_received)
         self.search_worker.search_completed.connect(self.on_search_completed)
         self.search_worker.search_failed.connect(self.on_search_failed)
         self.search_worker.progress.connect(self.parent.update_status)
         self.search_worker.start()
     
-    def on_search_completed(self, blog_posts):
-        """검색 완료 처리"""
-        self.blog_posts = blog_posts
-        self.search_btn.setEnabled(True)
-        self.generate_titles_btn.setEnabled(True)
-        self.parent.progress_bar.setVisible(False)
+    def search_archive(self):
+        """저장된 글 전문 검색 (오프라인)"""
+        query = self.keyword_input.text().strip()
+        if not query:
+            QMessageBox.warning(self, "입력 오류", "키워드를 입력하세요.")
+            return
         
-        # 검색 결과를 리스트로 표시
+        try:
+            store = get_post_store()
+            blog_posts = store.search(query, limit=1000)
+        except Exception as e:
+            QMessageBox.critical(self, "보관함 검색 실패", f"보관함 검색 오류: {str(e)}")
+            return
+        
+        self.blog_posts = blog_posts
+        self.generate_titles_btn.setEnabled(bool(blog_posts))
         self.search_result_list.clear()
+        self.add_search_result_items(blog_posts)
         
-        for i, post in enumerate(blog_posts, 1):
+        self.parent.update_status(
+            f"보관함 검색 완료: {len(blog_posts)}개 글 (전체 {store.count()}개 중)"
+        )
+    
+    def add_search_result_items(self, blog_posts):
+        """검색 결과를 리스트에 추가"""
+        self.search_result_list.setUpdatesEnabled(False)
+        start = self.search_result_list.count() + 1
+        for i, post in enumerate(blog_posts, start):
             item_text = f"{i:2d}. {post['title']}"
+            if post.get("keyword"):
+                item_text = f"{i:2d}. [{post['keyword']}] {post['title']}"
             item = QListWidgetItem(item_text)
             tooltip = f"블로거: {post['bloggername']}\n날짜: {post['postdate']}\n내용: {post['description'][:200]}...\n링크: {post['link']}"
             item.setToolTip(tooltip)
             self.search_result_list.addItem(item)
+        self.search_result_list.setUpdatesEnabled(True)
+    
+    def on_search_page_received(self, blog_posts):
+        """딥 검색 중 페이지 단위 부분 결과 표시"""
+        self.add_search_result_items(blog_posts)
+    
+    def on_search_completed(self, blog_posts):
+        """검색 완료 처리"""
+        self.blog_posts = blog_posts
+        self.search_btn.setEnabled(True)
+        self.generate_titles_btn.setEnabled(True)
+        self.parent.progress_bar.setVisible(False)
+        
+        # 검색 결과를 순서대로 다시 표시
+        self.search_result_list.clear()
+        self.add_search_result_items(blog_posts)
         
         self.parent.update_status(f"검색 완료: {len(blog_posts)}개 블로그 글 발견")
+        self.parent.update_cache_status()
+    
+    def batch_search_from_input(self):
+        """붙여넣은 키워드 목록으로 일괄 검색"""
+        text, ok = QInputDialog.getMultiLineText(
+            self, "키워드 일괄 검색", "키워드 목록 (줄바꿈 또는 쉼표로 구분):"
+        )
+        if ok:
+            self.start_batch_search(parse_keywords(text))
+    
+    def batch_search_from_file(self):
+        """키워드 파일을 불러와 일괄 검색"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "키워드 파일 선택", "", "텍스트 파일 (*.txt *.csv);;모든 파일 (*)"
+        )
+        if not file_path:
+            return
+        
+        try:
+            keywords = load_keywords(file_path)
+        except Exception as e:
+            QMessageBox.critical(self, "파일 오류", f"키워드 파일을 읽을 수 없습니다: {str(e)}")
+            return
+        
+        self.start_batch_search(keywords)
+    
+    def start_batch_search(self, keywords):
+        """키워드 목록 일괄 검색 시작"""
+        if not keywords:
+            QMessageBox.warning(self, "입력 오류", "검색할 키워드가 없습니다.")
+            return
+        
+        client_id, client_secret = self.get_naver_credentials()
+        if not client_id or not client_secret:
+            QMessageBox.warning(self, "API 오류", "네이버 API 정보를 입력하거나 .env 파일에 설정하세요.")
+            return
+        
+        self.batch_failures = []
+        self.search_btn.setEnabled(False)
+        self.batch_search_btn.setEnabled(False)
+        self.keyword_file_btn.setEnabled(False)
+        self.stop_search_btn.setEnabled(True)
+        self.parent.progress_bar.setVisible(True)
+        self.parent.progress_bar.setRange(0, len(keywords))
+        self.parent.progress_bar.setValue(0)
+        self.search_result_list.clear()
+        
+        # 일괄 검색 워커 시작
+        deep = self.deep_search_check.isChecked()
+        worker_class = AsyncBatchSearchWorker if use_async_engine() else BatchSearchWorker
+        self.batch_search_worker = worker_class(keywords, client_id, client_secret, deep=deep)
+        self.batch_search_worker.keyword_completed.connect(self.on_batch_keyword_completed)
+        self.batch_search_worker.keyword_failed.connect(self.on_batch_keyword_failed)
+        self.batch_search_worker.batch_completed.connect(self.on_batch_search_completed)
+        self.batch_search_worker.progress.connect(self.parent.update_status)
+        self.batch_search_worker.start()
+    
+    def on_batch_keyword_completed(self, keyword, blog_posts):
+        """일괄 검색 중 키워드 하나 완료"""
+        self.add_search_result_items(blog_posts)
+        self.parent.progress_bar.setValue(self.parent.progress_bar.value() + 1)
+    
+    def on_batch_keyword_failed(self, keyword, error_msg):
+        """일괄 검색 중 키워드 하나 실패"""
+        self.batch_failures.append(f"{keyword}: {error_msg}")
+        self.parent.progress_bar.setValue(self.parent.progress_bar.value() + 1)
+    
+    def stop_batch_search(self):
+        """진행 중인 일괄 검색 중지 - 남은 키워드는 취소되어 실패 목록에 표시됨"""
+        if self.batch_search_worker is not None and self.batch_search_worker.isRunning():
+            self.batch_search_worker.stop()
+            self.stop_search_btn.setEnabled(False)
+            self.parent.update_status("일괄 검색 중지 중... (진행 중인 키워드는 마저 검색합니다)")
+    
+    def stop_workers(self):
+        """창을 닫을 때 일괄 검색을 중지하고 진행 중인 워커가 끝날 때까지 대기"""
+        if self.batch_search_worker is not None:
+            self.batch_search_worker.stop()
+        workers = (
+            self.search_worker, self.batch_search_worker, self.title_worker, self.batch_title_worker
+        )
+        for worker in workers:
+            if worker is not None and worker.isRunning():
+                worker.wait()
+    
+    def on_batch_search_completed(self, blog_posts):
+        """일괄 검색 완료 처리"""
+        self.blog_posts = blog_posts
+        self.search_btn.setEnabled(True)
+        self.batch_search_btn.setEnabled(True)
+        self.keyword_file_btn.setEnabled(True)
+        self.stop_search_btn.setEnabled(False)
+        self.generate_titles_btn.setEnabled(bool(blog_posts))
+        self.parent.progress_bar.setVisible(False)
+        
+        # 키워드 순서대로 다시 표시
+        self.search_result_list.clear()
+        self.add_search_result_items(blog_posts)
+        
+        self.parent.update_status(
+            f"일괄 검색 완료: {len(blog_posts)}개 블로그 글 발견 (실패 {len(self.batch_failures)}개 키워드)"
+        )
+        self.parent.update_cache_status()
+        
+        if self.batch_failures:
+            QMessageBox.warning(
+                self, "일부 검색 실패", "\n".join(self.batch_failures[:20])
+            )
     
     def on_search_failed(self, error_msg):
         """검색 실패 처리"""
@@ -251,36 +476,138 @@ class TitleGenerationTab(QWidget):
             QMessageBox.warning(self, "데이터 없음", "먼저 키워드 검색을 실행하세요.")
             return
         
-        api_key = os.getenv("GEMINI_API_KEY") or self.parent.gemini_key_input.text().strip()
+        api_key = resolve_api_keys(self.parent.gemini_key_input.text())
         if not api_key:
             QMessageBox.warning(self, "API 오류", "Gemini API 키를 입력하거나 .env 파일에 설정하세요.")
             return
         
         count = self.title_count_spin.value()
         
+        # 여러 키워드 검색 결과면 키워드별 일괄 생성 (전송 전 토큰/비용 확인)
+        corpora = group_posts_by_keyword(self.blog_posts)
+        keywords = [k for k in corpora if k]
+        if len(keywords) > 1:
+            try:
+                requests = build_batch_title_requests(corpora, count, budget=get_token_budget())
+            except TokenBudgetExceeded as e:
+                QMessageBox.warning(self, "프롬프트 오류", str(e))
+                return
+            # 요청당 출력 토큰은 전체 키워드 기준 평균값
+            output_tokens = len(corpora) * count * OUTPUT_TOKENS_PER_TITLE // len(requests)
+            estimate = estimate_batch([prompt for _, prompt in requests], output_tokens)
+            reply = QMessageBox.question(
+                self, "일괄 생성 확인",
+                f"{len(keywords)}개 키워드의 제목을 생성하시겠습니까?\n\n{format_estimate(estimate)}",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                return
+
         self.generate_titles_btn.setEnabled(False)
         self.parent.progress_bar.setVisible(True)
         self.parent.progress_bar.setRange(0, 0)
         
+        self.similar_title_count = 0
+        if len(keywords) > 1:
+            self.batch_title_failures = []
+            worker_class = (
+                AsyncBatchTitleGenerateWorker if use_async_engine() else BatchTitleGenerateWorker
+            )
+            self.batch_title_worker = worker_class(
+                self.blog_posts, count, api_key, use_cache=self.parent.use_response_cache()
+            )
+            self.batch_title_worker.keyword_titles_generated.connect(self.on_keyword_titles_generated)
+            self.batch_title_worker.keyword_failed.connect(self.on_keyword_title_failed)
+            self.batch_title_worker.batch_completed.connect(self.on_batch_titles_completed)
+            self.batch_title_worker.generation_failed.connect(self.on_title_generation_failed)
+            self.batch_title_worker.progress.connect(self.parent.update_status)
+            self.batch_title_worker.start()
+            return
+        
         # 제목 생성 워커 시작
-        self.title_worker = TitleGenerateWorker(self.blog_posts, count, api_key)
+        self.streamed_title_count = 0
+        worker_class = AsyncTitleGenerateWorker if use_async_engine() else TitleGenerateWorker
+        self.title_worker = worker_class(
+            self.blog_posts,
+            count,
+            api_key,
+            use_cache=self.parent.use_response_cache(),
+            stream=self.stream_titles_check.isChecked(),
+        )
+        self.title_worker.title_streamed.connect(self.on_title_streamed)
         self.title_worker.titles_generated.connect(self.on_titles_generated)
         self.title_worker.generation_failed.connect(self.on_title_generation_failed)
         self.title_worker.progress.connect(self.parent.update_status)
         self.title_worker.start()
     
-    def on_titles_generated(self, titles):
+    def add_generated_titles(self, checked, keyword=None):
+        """
+        워커가 이전 제목 색인과 비교한 제목 [(제목, 유사 제목 또는 None, 유사도)]을 목록에 추가
+        유사 제목은 제외하거나 빨간색으로 표시 - 제외한 개수 반환
+        """
+        skip_similar = self.skip_similar_check.isChecked()
+        skipped = 0
+        for title, similar, score in checked:
+            if similar and skip_similar:
+                skipped += 1
+                continue
+            
+            self.generated_titles.append(title)
+            item = QListWidgetItem(title)
+            tooltip = f"키워드: {keyword}" if keyword else ""
+            if similar:
+                item.setForeground(QColor("#d32f2f"))
+                tooltip = "\n".join(
+                    filter(None, [tooltip, f"⚠️ 유사 제목 ({score:.0%}): {similar}"])
+                )
+            if tooltip:
+                item.setToolTip(tooltip)
+            self.titles_list.addItem(item)
+        self.similar_title_count += skipped
+        return skipped
+    
+    def on_title_streamed(self, checked):
+        """스트리밍 중 완성된 제목 바로 추가"""
+        self.streamed_title_count += len(checked)
+        self.add_generated_titles(checked)
+    
+    def on_titles_generated(self, checked):
         """제목 생성 완료 처리"""
-        self.generated_titles.extend(titles)
+        # 스트리밍으로 이미 추가된 제목은 제외
+        self.add_generated_titles(checked[self.streamed_title_count:])
         
-        # 리스트에 제목 추가
-        for title in titles:
-            self.titles_list.addItem(title)
+        self.generate_titles_btn.setEnabled(True)
+        self.parent.progress_bar.setVisible(False)
         
+        self.parent.update_status(
+            f"제목 생성 완료: {len(checked)}개 (유사 제목 {self.similar_title_count}개 제외)"
+            if self.similar_title_count
+            else f"제목 생성 완료: {len(checked)}개"
+        )
+    
+    def on_keyword_titles_generated(self, keyword, checked):
+        """일괄 제목 생성 중 키워드 하나 완료"""
+        self.add_generated_titles(checked, keyword)
+    
+    def on_keyword_title_failed(self, keyword, error_msg):
+        """일괄 제목 생성 중 키워드 하나 실패"""
+        self.batch_title_failures.append(f"{keyword}: {error_msg}")
+    
+    def on_batch_titles_completed(self, results):
+        """일괄 제목 생성 완료 처리"""
         self.generate_titles_btn.setEnabled(True)
         self.parent.progress_bar.setVisible(False)
         
-        self.parent.update_status(f"제목 생성 완료: {len(titles)}개")
+        title_count = sum(len(titles) for titles in results.values())
+        self.parent.update_status(
+            f"제목 일괄 생성 완료: {len(results)}개 키워드, {title_count}개 제목"
+            + (f" (유사 제목 {self.similar_title_count}개 제외)" if self.similar_title_count else "")
+        )
+        
+        if self.batch_title_failures:
+            QMessageBox.warning(
+                self, "일부 제목 생성 실패", "\n".join(self.batch_title_failures[:20])
+            )
     
     def on_title_generation_failed(self, error_msg):
         """제목 생성 실패 처리"""
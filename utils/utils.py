@@ -24,4 +24,13 @@ def load_env_file(file_path=".env"):
 
 def sanitize_filename(filename):
     """파일명에서 특수문자 제거"""
-    return "".join(c for c in filename if c.isalnum() or c in (" ", "-", "_")).rstrip()
\ No newline at end of file
+    return "".join(c for c in filename if c.isalnum() or c in (" ", "-", "_")).rstrip()
+
+
+def get_data_dir():
+    """프로그램 데이터(캐시, 색인 등) 저장 폴더 반환"""
+    data_dir = os.getenv("BLOG_GENERATOR_DATA_DIR") or os.path.join(
+        os.path.expanduser("~"), ".blog_generator"
+    )
+    os.makedirs(data_dir, exist_ok=True)
+    return data_dir